@@ -24,6 +24,9 @@ Boston, MA 02111-1307, USA.
 from PyQt4.QtGui import QApplication
 from PyQt4.QtCore import QThread, QEvent
 from threading import Lock
+from collections import deque
+
+from bindings.ip_connection import Device
 
 import logging
 import traceback
@@ -34,15 +37,73 @@ except ImportError:
     from queue import Queue
 
 ASYNC_EVENT = 12345
-
-async_call_queue = Queue()
+ASYNC_THREAD_COUNT = 8
+
+# calls are queued in lanes, one lane per device UID. the lane of a device
+# is put into the ready queue if it has calls and none of its calls is
+# running, so the calls of each device are done in order while the calls
+# of different devices run in parallel on the worker threads. calls of
+# functions that are no device methods share the None lane. a lane only
+# exists while it has pending calls, the running calls are tracked
+# separately, because they outlive a session change
+async_lanes = {}
+async_running = set()
+async_ready_queue = Queue()
 async_event_queue = Queue()
 async_session_lock = Lock()
 async_session_id = 1
 
-def async_call(func_to_call, parameter=None, return_ok=None, return_error=None):
+def async_get_lane_key(func_to_call):
+    device = getattr(func_to_call, '__self__', None)
+
+    if isinstance(device, Device):
+        return device.uid
+
+    return None
+
+def async_call(func_to_call, parameter=None, return_ok=None, return_error=None, key=None):
+    # if key is given and a call of the same device with the same key is
+    # still pending then that call is replaced by this one, instead of
+    # queueing another call. periodic polls use this to keep at most one
+    # pending call per value, if the device cannot keep up
+    lane_key = async_get_lane_key(func_to_call)
+
     with async_session_lock:
-        async_call_queue.put((func_to_call, parameter, return_ok, return_error, async_session_id))
+        call = (func_to_call, parameter, return_ok, return_error, async_session_id, key)
+        lane = async_lanes.get(lane_key)
+
+        if lane is None:
+            async_lanes[lane_key] = deque([call])
+
+            # otherwise the lane is put into the ready queue when the
+            # running call is done
+            if lane_key not in async_running:
+                async_ready_queue.put(lane_key)
+
+            return
+
+        if key is not None:
+            for i, pending in enumerate(lane):
+                if pending[5] == key:
+                    lane[i] = call
+                    return
+
+        lane.append(call)
+
+def async_queue_depth(device=None):
+    # returns the number of pending calls of the given device or of all
+    # devices, calls that are already running are not counted. periodic
+    # polls can skip an update while their device is behind
+    with async_session_lock:
+        if device is None:
+            return sum([len(lane) for lane in async_lanes.values()])
+
+        lane = async_lanes.get(device.uid)
+
+        if lane is None:
+            return 0
+
+        return len(lane)
 
 def async_event_handler():
     while not async_event_queue.empty():
@@ -60,56 +121,101 @@ def async_next_session():
         global async_session_id
         async_session_id += 1
 
-        with async_call_queue.mutex:
-            async_call_queue.queue.clear()
+        # only the pending calls are dropped. a device with a running call
+        # stays in async_running, so calls of the new session for it wait
+        # until that call is done
+        async_lanes.clear()
+
+        with async_ready_queue.mutex:
+            async_ready_queue.queue.clear()
 
-def async_start_thread(parent):
+def async_start_threads(parent):
     class AsyncThread(QThread):
         def __init__(self, parent=None):
             QThread.__init__(self, parent)
 
         def run(self):
             while True:
-                func_to_call, parameter, return_ok, return_error, session_id = async_call_queue.get()
-                if not func_to_call:
-                    continue
-
-                return_value = None
-                try:
-                    if parameter == None:
-                        return_value = func_to_call()
-                    elif isinstance(parameter, tuple):
-                        return_value = func_to_call(*parameter)
-                    else:
-                        return_value = func_to_call(parameter)
-                except:
-                    with async_session_lock:
-                        if session_id != async_session_id:
-                            continue
-
-                    if return_error != None:
-                        async_event_queue.put(return_error)
-                        with async_call_queue.mutex:
-                            async_call_queue.queue.clear()
-
-                        QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+                key = async_ready_queue.get()
+
+                with async_session_lock:
+                    lane = async_lanes.get(key)
+
+                    if lane is None:
+                        continue # dropped by a session change
+
+                    if key in async_running:
+                        # stale key: it was taken from the ready queue
+                        # before a session change and the lane was
+                        # scheduled again since. the running call puts the
+                        # lane into the ready queue again when it is done
                         continue
 
-                if return_ok != None:
-                    with async_session_lock:
-                        if session_id != async_session_id:
-                            continue
+                    call = lane.popleft()
+
+                    if len(lane) == 0:
+                        del async_lanes[key]
+
+                    async_running.add(key)
+
+                failed = self.run_call(*call)
+
+                with async_session_lock:
+                    async_running.discard(key)
+
+                    # after an error the pending calls of this device are
+                    # dropped, the calls of other devices are not affected.
+                    # calls of a new session are kept
+                    if failed and call[4] == async_session_id:
+                        async_lanes.pop(key, None)
+
+                    if key in async_lanes:
+                        async_ready_queue.put(key)
+
+        def run_call(self, func_to_call, parameter, return_ok, return_error, session_id, key):
+            if not func_to_call:
+                return False
+
+            return_value = None
+            try:
+                if parameter == None:
+                    return_value = func_to_call()
+                elif isinstance(parameter, tuple):
+                    return_value = func_to_call(*parameter)
+                else:
+                    return_value = func_to_call(parameter)
+            except:
+                with async_session_lock:
+                    if session_id != async_session_id:
+                        return False
+
+                if return_error != None:
+                    async_event_queue.put(return_error)
+                    QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+                    return True
+
+            if return_ok != None:
+                with async_session_lock:
+                    if session_id != async_session_id:
+                        return False
+
+                if return_value == None:
+                    async_event_queue.put(return_ok)
+                    QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+                else:
+                    def return_lambda(return_ok, value):
+                        return lambda: return_ok(value)
+
+                    async_event_queue.put(return_lambda(return_ok, return_value))
+                    QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+
+            return False
 
-                    if return_value == None:
-                        async_event_queue.put(return_ok)
-                        QApplication.postEvent(self, QEvent(ASYNC_EVENT))
-                    else:
-                        def return_lambda(return_ok, value):
-                            return lambda: return_ok(value)
+    async_threads = []
 
-                        async_event_queue.put(return_lambda(return_ok, return_value))
-                        QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+    for i in range(ASYNC_THREAD_COUNT):
+        async_thread = AsyncThread(parent)
+        async_thread.start()
+        async_threads.append(async_thread)
 
-    async_thread = AsyncThread(parent)
-    async_thread.start()
-    return async_thread
+    return async_threads
@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+
+brickd_simulator.py: Simulates a Brick Daemon with stacks of devices
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Run from the brickv directory:
+#
+#   python -m benchmarks.brickd_simulator [port] [stacks] [period] [layout]
+#
+# Listens on the given port (default 4223) and simulates the given number
+# of stacks (default 20). The layout describes one stack as a ; separated
+# list of bricks, each followed by the bricklets at its ports:
+#
+#   brick_master:bricklet_temperature,bricklet_humidity;brick_servo
+#
+# The default layout is a Master, IMU, Stepper, Servo and DC Brick with
+# four bricklets each, the bricklet types are cycled through all bricklets
+# in bindings/. Every device answers all functions of its binding:
+#
+# - setters store their values, the matching getters return them
+# - other getters return generated values that change on every call
+# - get_identity returns the position of the device in its stack
+# - unknown function IDs are answered with function not supported
+#
+# Periodic callbacks are started by their period setters (for example
+# set_temperature_callback_period) as on real hardware. A period in ms
+# other than 0 starts all periodic callbacks of all devices with that
+# period. Unlike real hardware, periodic callbacks are sent even if the
+# value did not change, threshold callbacks are never sent.
+#
+# The simulator runs in a single thread, so hundreds of devices can be
+# simulated in one process. It can also be used from other benchmarks:
+#
+#   simulator = BrickdSimulator(create_stacks(20))
+#   simulator.start()
+#   ipcon.connect('127.0.0.1', simulator.port)
+
+import errno
+import heapq
+import inspect
+import re
+import select
+import socket
+import struct
+import sys
+import time
+from threading import Thread
+
+from bindings.ip_connection import IPConnection, base58encode
+from benchmarks.codec import SEND_REQUEST_PATTERN
+from benchmarks.replay import get_device_classes
+
+HEADER_STRUCT = struct.Struct('<IBBBB')
+ENUMERATE_STRUCT = struct.Struct('<IBBBB8s8scBBBBBBHB')
+PERIOD_STRUCT = struct.Struct('<I')
+PERIOD_SETTER_PATTERN = re.compile(r'^FUNCTION_SET_(\w+?)(_CALLBACK)?_PERIOD$')
+
+FUNCTION_GET_IDENTITY = 255
+ERROR_CODE_FUNCTION_NOT_SUPPORTED = 2
+
+# callbacks are dropped for connections with more data pending than this,
+# like brickd drops them for clients that cannot keep up
+MAX_PENDING = 1024 * 1024
+
+DEFAULT_BRICKS = ['brick_master', 'brick_imu', 'brick_stepper', 'brick_servo', 'brick_dc']
+
+class SampleFormat:
+    """
+    Packs generated values for a space separated format string. The
+    values depend on a step number, so consecutive getter calls and
+    callbacks return different values.
+    """
+
+    def __init__(self, form):
+        self.fields = []
+
+        for f in form.split(' '):
+            if len(f) == 0:
+                continue
+
+            t = f[-1]
+            count = int(f[:-1] or 1)
+
+            if t == 's':
+                count = 1
+
+            self.fields.append((t, count))
+
+        self.struct = struct.Struct('<' + ''.join(form.split(' ')))
+        self.size = self.struct.size
+
+    def pack(self, step):
+        values = []
+        number = step % 100
+
+        for t, count in self.fields:
+            if t == 's':
+                value = b'sim'
+            elif t == 'c':
+                value = b'a'
+            elif t == '?':
+                value = number % 2 == 1
+            elif t in 'fd':
+                value = float(number)
+            else:
+                value = number
+
+            values.extend([value] * count)
+
+        return self.struct.pack(*values)
+
+class DeviceType:
+    """
+    Function table of one binding, parsed from the send_request calls in
+    its source. It is shared by all simulated devices of this type.
+    """
+
+    def __init__(self, device_class):
+        self.device_class = device_class
+        self.device_identifier = device_class.DEVICE_IDENTIFIER
+        self.functions = {} # function ID -> (request size, response format)
+        self.stores = {} # setter function ID -> (getter function ID, key size)
+        self.period_setters = {} # setter function ID -> callback ID
+        self.callbacks = {} # callback ID -> response format
+
+        source = inspect.getsource(sys.modules[device_class.__module__])
+        names = {}
+
+        for name, form, form_ret in SEND_REQUEST_PATTERN.findall(source):
+            function_id = getattr(device_class, name)
+            names[name] = function_id
+            self.functions[function_id] = (SampleFormat(form).size, SampleFormat(form_ret))
+
+        for name, function_id in names.items():
+            if not name.startswith('FUNCTION_SET_'):
+                continue
+
+            getter_id = names.get('FUNCTION_GET_' + name[len('FUNCTION_SET_'):])
+
+            if getter_id is not None:
+                request_size = self.functions[function_id][0]
+                key_size = self.functions[getter_id][0]
+                value_size = self.functions[getter_id][1].size
+
+                # the setter parameters have to be the getter parameters
+                # followed by the getter return values
+                if value_size > 0 and request_size == key_size + value_size:
+                    self.stores[function_id] = (getter_id, key_size)
+
+            m = PERIOD_SETTER_PATTERN.match(name)
+
+            if m is not None and self.functions[function_id][0] == PERIOD_STRUCT.size:
+                callback_id = getattr(device_class, 'CALLBACK_' + m.group(1), None)
+
+                if callback_id in device_class.callback_formats:
+                    self.period_setters[function_id] = callback_id
+
+        for callback_id, form in device_class.callback_formats.items():
+            self.callbacks[callback_id] = SampleFormat(form)
+
+class SimulatedDevice:
+    def __init__(self, device_type, uid, connected_uid, position):
+        self.device_type = device_type
+        self.uid = uid
+        self.connected_uid = connected_uid
+        self.position = position
+        self.values = {} # (getter function ID, parameters) -> return values
+        self.periods = {} # callback ID -> period in ms
+        self.timer_tokens = {} # callback ID -> token of the current timer
+        self.step = 0
+
+    def get_identity(self):
+        return struct.pack('<8s8scBBBBBBH', base58encode(self.uid).encode('ascii'),
+                           self.connected_uid.encode('ascii'), self.position.encode('ascii'),
+                           1, 0, 0, 2, 0, 0, self.device_type.device_identifier)
+
+    def get_enumerate(self, enumeration_type):
+        return ENUMERATE_STRUCT.pack(self.uid, ENUMERATE_STRUCT.size,
+                                     IPConnection.CALLBACK_ENUMERATE, 0, 0,
+                                     base58encode(self.uid).encode('ascii'),
+                                     self.connected_uid.encode('ascii'),
+                                     self.position.encode('ascii'),
+                                     1, 0, 0, 2, 0, 0,
+                                     self.device_type.device_identifier,
+                                     enumeration_type)
+
+    def call(self, function_id, payload):
+        # returns the response payload and error code, payload is None if
+        # the function is not supported
+        if function_id == FUNCTION_GET_IDENTITY:
+            return self.get_identity(), 0
+
+        try:
+            request_size, response = self.device_type.functions[function_id]
+        except KeyError:
+            return None, ERROR_CODE_FUNCTION_NOT_SUPPORTED
+
+        payload = bytes(payload)
+
+        if function_id in self.device_type.stores:
+            getter_id, key_size = self.device_type.stores[function_id]
+            self.values[(getter_id, payload[:key_size])] = payload[key_size:]
+
+        if response.size == 0:
+            return b'', 0
+
+        value = self.values.get((function_id, payload))
+
+        if value is None:
+            self.step += 1
+            value = response.pack(self.step)
+
+        return value, 0
+
+    def get_callback(self, callback_id):
+        self.step += 1
+        payload = self.device_type.callbacks[callback_id].pack(self.step)
+
+        return HEADER_STRUCT.pack(self.uid, 8 + len(payload), callback_id, 0, 0) + payload
+
+class Client:
+    def __init__(self, sock):
+        self.sock = sock
+        self.incoming = bytearray()
+        self.outgoing = bytearray()
+
+class BrickdSimulator:
+    def __init__(self, devices, host='127.0.0.1', port=0, callback_period=0):
+        self.devices = {}
+        self.callback_period = callback_period
+        self.clients = {}
+        self.timers = []
+        self.timer_token = 0
+        self.running = False
+        self.thread = None
+
+        # counters, read them as approximate values from other threads
+        self.requests = 0
+        self.responses = 0
+        self.callbacks = 0
+        self.dropped_callbacks = 0
+
+        for device in devices:
+            self.devices[device.uid] = device
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.server.listen(64)
+        self.port = self.server.getsockname()[1]
+
+    def start(self):
+        if self.callback_period > 0:
+            now = time.time()
+
+            for device in self.devices.values():
+                for setter_id in device.device_type.period_setters:
+                    self.set_period(device, setter_id, PERIOD_STRUCT.pack(self.callback_period), now)
+
+        self.running = True
+        self.thread = Thread(target=self.loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def set_period(self, device, setter_id, payload, now):
+        # stores the period like any other setter, so the period getter
+        # returns it
+        device.call(setter_id, payload)
+
+        callback_id = device.device_type.period_setters[setter_id]
+        period = PERIOD_STRUCT.unpack(payload)[0]
+
+        self.timer_token += 1
+        device.periods[callback_id] = period
+        device.timer_tokens[callback_id] = self.timer_token
+
+        if period > 0:
+            heapq.heappush(self.timers, (now + period / 1000.0, self.timer_token, device, callback_id))
+
+    def loop(self):
+        try:
+            while self.running:
+                self.poll()
+        finally:
+            for client in list(self.clients.values()):
+                self.close_client(client)
+
+            self.server.close()
+
+    def poll(self):
+        timeout = 0.1
+
+        if len(self.timers) > 0:
+            timeout = max(0.0, min(timeout, self.timers[0][0] - time.time()))
+
+        readable = [self.server] + list(self.clients.keys())
+        writable = [sock for sock, client in self.clients.items() if len(client.outgoing) > 0]
+
+        readable, writable, _ = select.select(readable, writable, [], timeout)
+
+        for sock in readable:
+            if sock is self.server:
+                sock, _ = self.server.accept()
+                sock.setblocking(False)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.clients[sock] = Client(sock)
+            elif sock in self.clients:
+                self.receive(self.clients[sock])
+
+        for sock in writable:
+            if sock in self.clients:
+                self.flush(self.clients[sock])
+
+        self.fire_timers(time.time())
+
+    def receive(self, client):
+        try:
+            data = client.sock.recv(8192)
+        except socket.error:
+            data = b''
+
+        if len(data) == 0:
+            self.close_client(client)
+            return
+
+        client.incoming += data
+
+        while len(client.incoming) >= 8:
+            length = client.incoming[4]
+
+            if length < 8:
+                self.close_client(client)
+                return
+
+            if len(client.incoming) < length:
+                break
+
+            packet = client.incoming[:length]
+            del client.incoming[:length]
+
+            self.handle_request(client, packet)
+
+        self.flush(client)
+
+    def handle_request(self, client, packet):
+        uid, length, function_id, sequence_number_and_options, flags = HEADER_STRUCT.unpack_from(packet)
+        self.requests += 1
+
+        if uid == IPConnection.BROADCAST_UID:
+            if function_id == IPConnection.FUNCTION_ENUMERATE:
+                for device in self.devices.values():
+                    client.outgoing += device.get_enumerate(IPConnection.ENUMERATION_TYPE_AVAILABLE)
+
+            return
+
+        device = self.devices.get(uid)
+
+        if device is None:
+            return # like brickd, requests for unknown devices are not answered
+
+        payload = packet[8:]
+
+        if function_id in device.device_type.period_setters and len(payload) == PERIOD_STRUCT.size:
+            self.set_period(device, function_id, payload, time.time())
+            response, error_code = b'', 0
+        else:
+            response, error_code = device.call(function_id, payload)
+
+        if (sequence_number_and_options >> 3) & 1 == 0:
+            return
+
+        if response is None:
+            response = b''
+
+        client.outgoing += HEADER_STRUCT.pack(uid, 8 + len(response), function_id,
+                                              sequence_number_and_options, error_code << 6)
+        client.outgoing += response
+        self.responses += 1
+
+    def fire_timers(self, now):
+        packets = []
+
+        while len(self.timers) > 0 and self.timers[0][0] <= now:
+            deadline, token, device, callback_id = heapq.heappop(self.timers)
+
+            if device.timer_tokens.get(callback_id) != token:
+                continue # the period was changed in the meantime
+
+            packets.append(device.get_callback(callback_id))
+
+            # a simulator that cannot keep up skips the missed callbacks
+            # instead of sending them in a burst
+            deadline = max(deadline + device.periods[callback_id] / 1000.0, now)
+
+            heapq.heappush(self.timers, (deadline, token, device, callback_id))
+
+        if len(packets) == 0:
+            return
+
+        data = b''.join(packets)
+
+        for client in list(self.clients.values()):
+            if len(client.outgoing) > MAX_PENDING:
+                self.dropped_callbacks += len(packets)
+                continue
+
+            client.outgoing += data
+            self.callbacks += len(packets)
+            self.flush(client)
+
+    def flush(self, client):
+        if len(client.outgoing) == 0:
+            return
+
+        try:
+            sent = client.sock.send(client.outgoing)
+        except socket.error:
+            e = sys.exc_info()[1]
+
+            if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return
+
+            self.close_client(client)
+            return
+
+        del client.outgoing[:sent]
+
+    def close_client(self, client):
+        self.clients.pop(client.sock, None)
+
+        try:
+            client.sock.close()
+        except socket.error:
+            pass
+
+def create_stacks(count, layout=None, first_uid=100000):
+    """
+    Creates the simulated devices for count stacks with the given layout,
+    a list of (brick module name, [bricklet module names]). Without a
+    layout every stack consists of the default bricks with four bricklets
+    each, cycling through all bricklet types.
+    """
+
+    classes = {}
+
+    for device_class in get_device_classes().values():
+        classes[device_class.__module__.split('.')[-1]] = DeviceType(device_class)
+
+    if layout is None:
+        # continue the bricklet cycle in every stack, so all bricklet
+        # types are simulated once there are enough stacks
+        bricklet_names = sorted([name for name in classes if name.startswith('bricklet_')])
+        layouts = []
+        i = 0
+
+        for stack in range(count):
+            layout = []
+
+            for name in DEFAULT_BRICKS:
+                layout.append((name, [bricklet_names[(i + k) % len(bricklet_names)] for k in range(4)]))
+                i += 4
+
+            layouts.append(layout)
+    else:
+        for brick_name, bricklet_names in layout:
+            for name in [brick_name] + bricklet_names:
+                if name not in classes:
+                    raise ValueError('Unknown device type: {0}'.format(name))
+
+            if len(bricklet_names) > 4:
+                raise ValueError('A brick has at most 4 bricklet ports')
+
+        layouts = [layout] * count
+
+    devices = []
+    uid = first_uid
+
+    for layout in layouts:
+        for position, (brick_name, bricklet_names) in enumerate(layout):
+            brick = SimulatedDevice(classes[brick_name], uid, '0', str(position))
+            devices.append(brick)
+            uid += 1
+
+            for port, bricklet_name in zip('abcd', bricklet_names):
+                devices.append(SimulatedDevice(classes[bricklet_name], uid,
+                                               base58encode(brick.uid), port))
+                uid += 1
+
+    return devices
+
+def parse_layout(spec):
+    layout = []
+
+    for brick in spec.split(';'):
+        parts = brick.split(':')
+        bricklets = []
+
+        if len(parts) > 1 and len(parts[1]) > 0:
+            bricklets = parts[1].split(',')
+
+        layout.append((parts[0], bricklets))
+
+    return layout
+
+def main():
+    port = 4223
+    stacks = 20
+    period = 0
+    layout = None
+
+    if len(sys.argv) > 1:
+        port = int(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        stacks = int(sys.argv[2])
+
+    if len(sys.argv) > 3:
+        period = int(sys.argv[3])
+
+    if len(sys.argv) > 4:
+        layout = parse_layout(sys.argv[4])
+
+    simulator = BrickdSimulator(create_stacks(stacks, layout), '0.0.0.0', port, period)
+    simulator.start()
+
+    print('simulating {0} devices on port {1}'.format(len(simulator.devices), simulator.port))
+    print('{0:>8} {1:>12} {2:>12} {3:>12} {4:>12}'.format('clients', 'requests/s', 'responses/s',
+                                                          'callbacks/s', 'dropped/s'))
+
+    last = (0, 0, 0, 0)
+
+    try:
+        while True:
+            time.sleep(1)
+
+            current = (simulator.requests, simulator.responses,
+                       simulator.callbacks, simulator.dropped_callbacks)
+
+            print('{0:>8} {1:>12} {2:>12} {3:>12} {4:>12}'.format(len(simulator.clients),
+                                                                  *[c - l for c, l in zip(current, last)]))
+
+            last = current
+    except KeyboardInterrupt:
+        simulator.stop()
+
+if __name__ == '__main__':
+    main()
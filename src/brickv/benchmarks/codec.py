@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+
+codec.py: Micro-benchmark for packet encoding and decoding
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Run from the brickv directory:
+#
+#   python -m benchmarks.codec [iterations]
+#   python -m benchmarks.codec operations [iterations] [rows]
+#
+# The first form compares the per-call cost of the format string parsing
+# that was done by send_request and deserialize_data on every call
+# (legacy) against the precompiled codecs from get_codec (codec) for every
+# function of every binding in bindings/.
+#
+# The second form times every single codec operation of the bindings and
+# of the IP Connection itself: the request packing of send_request for
+# every function, the response decoding of every getter and the callback
+# decoding of every callback through deserialize_data. It prints the
+# slowest operations and the mean per binding in ns/op and allocs/op.
+# allocs/op counts the memory blocks that are still allocated after the
+# call with its result kept alive, objects that are freed again within
+# the call are not counted. It is only available on Python 3.
+
+import gc
+import os
+import re
+import struct
+import sys
+import time
+import types
+
+from bindings.ip_connection import IPConnection, get_codec
+
+SEND_REQUEST_PATTERN = re.compile(r"send_request\(self, \w+\.(\w+), \(.*?\), '([^']*)', '([^']*)'\)")
+CALLBACK_FORMAT_PATTERN = re.compile(r"^        (CALLBACK_\w+): '([^']*)',$", re.MULTILINE)
+IP_CONNECTION_SEND_REQUEST_PATTERN = re.compile(r"send_request\(device,\s+IPConnection\.(\w+),\s+\([^)]*\),\s+'([^']*)',\s+'([^']*)'\)")
+ENUMERATE_FORMAT = '8s 8s c 3B 3B H B'
+
+def legacy_pack_string(f, d):
+    if sys.hexversion < 0x03000000:
+        if type(d) == types.UnicodeType:
+            f = f.replace('s', 'B')
+            l = map(ord, d)
+            l += [0] * (int(f.replace('B', '')) - len(l))
+            return struct.pack('<' + f, *l)
+        else:
+            return struct.pack('<' + f, d)
+    else:
+        if isinstance(d, str):
+            return struct.pack('<' + f, bytes(map(ord, d)))
+        else:
+            return struct.pack('<' + f, d)
+
+def legacy_pack_request(header, data, form):
+    request = header
+
+    for f, d in zip(form.split(' '), data):
+        if len(f) > 1 and not 's' in f and not 'c' in f:
+            request += struct.pack('<' + f, *d)
+        elif 's' in f:
+            request += legacy_pack_string(f, d)
+        elif 'c' in f:
+            if len(f) > 1:
+                if int(f.replace('c', '')) != len(d):
+                    raise ValueError('Incorrect char list length');
+                for k in d:
+                    request += legacy_pack_string('c', k)
+            else:
+                request += legacy_pack_string(f, d)
+        else:
+            request += struct.pack('<' + f, d)
+
+    return request
+
+def legacy_trim_deserialized_string(s):
+    if sys.hexversion >= 0x03000000:
+        s = s.decode('ascii')
+
+    i = s.find(chr(0))
+    if i >= 0:
+        s = s[:i]
+
+    return s
+
+def legacy_deserialize_data(data, form):
+    ret = []
+    for f in form.split(' '):
+        f = '<' + f
+        length = struct.calcsize(f)
+
+        x = struct.unpack(f, data[:length])
+        if len(x) > 1:
+            ret.append(x)
+        elif 's' in f:
+            ret.append(legacy_trim_deserialized_string(x[0]))
+        else:
+            ret.append(x[0])
+
+        data = data[length:]
+
+    if len(ret) == 1:
+        return ret[0]
+
+    return ret
+
+def sample_value(f):
+    t = f[-1]
+    count = int(f[:-1] or 1)
+
+    if t == 's':
+        return 'abc'
+    elif t == 'c':
+        value = 'a'
+    elif t == '?':
+        value = True
+    elif t in 'fd':
+        value = 1.5
+    else:
+        value = 1
+
+    if count > 1:
+        return [value] * count
+
+    return value
+
+def sample_data(form):
+    return [sample_value(f) for f in form.split(' ') if len(f) > 0]
+
+def sample_response(form_ret):
+    return b'\x00' * (8 + struct.calcsize('<' + ''.join(form_ret.split(' '))))
+
+def collect_functions(bindings_path):
+    bindings = []
+
+    for name in sorted(os.listdir(bindings_path)):
+        if not name.startswith('brick') or not name.endswith('.py'):
+            continue
+
+        source = open(os.path.join(bindings_path, name)).read()
+        functions = SEND_REQUEST_PATTERN.findall(source)
+        callbacks = [(callback_name, form) for callback_name, form
+                     in CALLBACK_FORMAT_PATTERN.findall(source) if len(form) > 0]
+
+        bindings.append((name[:-3], functions, callbacks))
+
+    return bindings
+
+def collect_ip_connection_functions(bindings_path):
+    source = open(os.path.join(bindings_path, 'ip_connection.py')).read()
+    functions = IP_CONNECTION_SEND_REQUEST_PATTERN.findall(source)
+
+    return ('ip_connection', functions, [('CALLBACK_ENUMERATE', ENUMERATE_FORMAT)])
+
+def measure(func, iterations):
+    start = time.time()
+
+    for i in range(iterations):
+        func()
+
+    return (time.time() - start) / iterations * 1e9
+
+def measure_function(form, form_ret, iterations):
+    header = struct.pack('<IBBBB', 1, 8, 1, 0x18, 0)
+    data = sample_data(form)
+    response = sample_response(form_ret)
+    codec = get_codec(form, form_ret)
+
+    def legacy():
+        legacy_pack_request(header, data, form)
+
+        if len(form_ret) > 0:
+            legacy_deserialize_data(response[8:], form_ret)
+
+    def compiled():
+        codec.pack_request(1, 1, 0x18, data)
+
+        if len(form_ret) > 0:
+            codec.unpack_response(response)
+
+    return measure(legacy, iterations), measure(compiled, iterations)
+
+def measure_callback(form, iterations):
+    packet = sample_response(form)
+    codec = get_codec('', form)
+
+    def legacy():
+        legacy_deserialize_data(packet[8:], form)
+
+    def compiled():
+        codec.unpack_response(packet)
+
+    return measure(legacy, iterations), measure(compiled, iterations)
+
+def measure_allocations(func, iterations):
+    if not hasattr(sys, 'getallocatedblocks'):
+        return None
+
+    results = [None] * iterations
+
+    gc.disable()
+
+    try:
+        before = sys.getallocatedblocks()
+
+        for i in range(iterations):
+            results[i] = func()
+
+        after = sys.getallocatedblocks()
+    finally:
+        gc.enable()
+
+    return float(after - before) / iterations
+
+def request_operation(form, form_ret):
+    data = sample_data(form)
+
+    # the same lookup and packing that send_request does
+    def operation():
+        return get_codec(form, form_ret).pack_request(1, 1, 0x18, data)
+
+    return operation
+
+def decode_operation(ipcon, form):
+    data = sample_response(form)[8:]
+
+    def operation():
+        return ipcon.deserialize_data(data, form)
+
+    return operation
+
+def collect_operations(bindings_path):
+    ipcon = IPConnection()
+    operations = []
+
+    for name, functions, callbacks in collect_functions(bindings_path) + \
+                                      [collect_ip_connection_functions(bindings_path)]:
+        for function_name, form, form_ret in functions:
+            operations.append((name, 'request', function_name, form,
+                               request_operation(form, form_ret)))
+
+            if len(form_ret) > 0:
+                operations.append((name, 'response', function_name, form_ret,
+                                   decode_operation(ipcon, form_ret)))
+
+        for callback_name, form in callbacks:
+            operations.append((name, 'callback', callback_name, form,
+                               decode_operation(ipcon, form)))
+
+    return operations
+
+def format_allocations(allocations):
+    if allocations is None:
+        return '-'
+
+    return '{0:.1f}'.format(allocations)
+
+def main_operations(iterations, rows):
+    bindings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bindings')
+    results = []
+
+    for name, kind, function_name, form, operation in collect_operations(bindings_path):
+        # the best of several runs, the first run also warms up the codec cache
+        ns = min([measure(operation, iterations) for i in range(3)])
+
+        results.append((ns, measure_allocations(operation, iterations),
+                        name, kind, function_name, form))
+
+    results.sort(key=lambda result: result[0], reverse=True)
+
+    print('{0:<36} {1:<8} {2:<42} {3:<28} {4:>8} {5:>9}'.format('binding', 'kind', 'name', 'format',
+                                                                 'ns/op', 'allocs/op'))
+
+    for ns, allocations, name, kind, function_name, form in results[:rows]:
+        print('{0:<36} {1:<8} {2:<42} {3:<28} {4:>8.0f} {5:>9}'.format(name, kind, function_name, form,
+                                                                       ns, format_allocations(allocations)))
+
+    families = {}
+
+    for ns, allocations, name, kind, function_name, form in results:
+        families.setdefault(name, []).append((ns, allocations))
+
+    summary = []
+
+    for name, values in families.items():
+        ns = sum([v[0] for v in values]) / len(values)
+
+        if values[0][1] is None:
+            allocations = None
+        else:
+            allocations = sum([v[1] for v in values]) / len(values)
+
+        summary.append((ns, allocations, name, len(values)))
+
+    summary.sort(key=lambda family: family[0], reverse=True)
+
+    print('')
+    print('{0:<36} {1:>10} {2:>8} {3:>9}'.format('binding', 'operations', 'ns/op', 'allocs/op'))
+
+    for ns, allocations, name, count in summary:
+        print('{0:<36} {1:>10} {2:>8.0f} {3:>9}'.format(name, count, ns, format_allocations(allocations)))
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'operations':
+        iterations = 2000
+        rows = 30
+
+        if len(sys.argv) > 2:
+            iterations = int(sys.argv[2])
+
+        if len(sys.argv) > 3:
+            rows = int(sys.argv[3])
+
+        main_operations(iterations, rows)
+        return
+
+    iterations = 2000
+
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+
+    bindings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bindings')
+
+    print('{0:<36} {1:>6} {2:>12} {3:>12} {4:>8}'.format('binding', 'calls', 'legacy ns', 'codec ns', 'speedup'))
+
+    total_legacy = 0.0
+    total_compiled = 0.0
+    total_count = 0
+
+    for name, functions, callbacks in collect_functions(bindings_path):
+        legacy = 0.0
+        compiled = 0.0
+
+        for function_name, form, form_ret in functions:
+            l, c = measure_function(form, form_ret, iterations)
+            legacy += l
+            compiled += c
+
+        for callback_name, form in callbacks:
+            l, c = measure_callback(form, iterations)
+            legacy += l
+            compiled += c
+
+        count = len(functions) + len(callbacks)
+
+        if count == 0:
+            continue
+
+        total_legacy += legacy
+        total_compiled += compiled
+        total_count += count
+
+        print('{0:<36} {1:>6} {2:>12.0f} {3:>12.0f} {4:>7.2f}x'.format(name, count, legacy / count,
+                                                                       compiled / count, legacy / compiled))
+
+    print('{0:<36} {1:>6} {2:>12.0f} {3:>12.0f} {4:>7.2f}x'.format('all', total_count, total_legacy / total_count,
+                                                                   total_compiled / total_count,
+                                                                   total_legacy / total_compiled))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+
+replay.py: Records and replays the traffic of an IP Connection
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Run from the brickv directory:
+#
+#   python -m benchmarks.replay record <host> <port> <seconds> <file>
+#   python -m benchmarks.replay replay <file> [speed]
+#
+# record connects to a Brick Daemon, enumerates the devices and captures
+# all traffic for the given number of seconds. Callbacks are sent to all
+# connections of the Brick Daemon, so a brickv configured to receive the
+# interesting callbacks can run at the same time.
+#
+# replay creates a device object for every device that was enumerated in
+# the capture, registers a counting function for all of their callbacks
+# and replays the capture. The default speed of 0 replays as fast as
+# possible and measures the decoding and dispatching throughput.
+
+import importlib
+import os
+import sys
+import time
+
+from bindings.ip_connection import IPConnection, read_capture, get_codec, \
+                                   get_function_id_from_data, get_length_from_data
+
+def get_device_classes():
+    bindings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bindings')
+    device_classes = {}
+
+    for name in sorted(os.listdir(bindings_path)):
+        if not name.startswith('brick') or not name.endswith('.py'):
+            continue
+
+        module = importlib.import_module('bindings.' + name[:-3])
+
+        for value in vars(module).values():
+            if isinstance(value, type) and hasattr(value, 'DEVICE_IDENTIFIER'):
+                device_classes[value.DEVICE_IDENTIFIER] = value
+
+    return device_classes
+
+def record(host, port, seconds, filename):
+    ipcon = IPConnection()
+    ipcon.start_capture(filename)
+    ipcon.connect(host, port)
+    ipcon.enumerate()
+
+    time.sleep(seconds)
+
+    ipcon.disconnect()
+    ipcon.stop_capture()
+
+    received = 0
+    sent = 0
+
+    for timestamp, direction, packet in read_capture(filename):
+        if direction == IPConnection.CAPTURE_DIRECTION_RECEIVED:
+            received += 1
+        else:
+            sent += 1
+
+    print('captured {0} received and {1} sent packets'.format(received, sent))
+
+def replay(filename, speed):
+    device_classes = get_device_classes()
+    enumerate_codec = get_codec('', '8s 8s c 3B 3B H B')
+    ipcon = IPConnection()
+    devices = {}
+    counts = [0]
+
+    def count(*values):
+        counts[0] += 1
+
+    # create the device objects up front, otherwise the callbacks that
+    # arrive before their device object was created would be ignored
+    for timestamp, direction, packet in read_capture(filename):
+        if direction == IPConnection.CAPTURE_DIRECTION_RECEIVED and \
+           get_function_id_from_data(packet) == IPConnection.CALLBACK_ENUMERATE and \
+           get_length_from_data(packet) == 34:
+            uid, connected_uid, position, hardware_version, firmware_version, \
+                device_identifier, enumeration_type = enumerate_codec.unpack_response(packet)
+
+            if uid in devices or device_identifier not in device_classes:
+                continue
+
+            device = device_classes[device_identifier](uid, ipcon)
+
+            for callback_id in device.callback_formats:
+                device.registered_callbacks[callback_id] = count
+
+            devices[uid] = device
+
+    start = time.time()
+    packets = ipcon.replay_capture(filename, speed)
+    elapsed = time.time() - start
+
+    print('{0} devices, {1} packets, {2} callbacks in {3:.3f} s'.format(len(devices), packets, counts[0], elapsed))
+    print('{0:.0f} packets/s, {1:.0f} callbacks/s'.format(packets / elapsed, counts[0] / elapsed))
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == 'record':
+        record(sys.argv[2], int(sys.argv[3]), float(sys.argv[4]), sys.argv[5])
+    elif len(sys.argv) in (3, 4) and sys.argv[1] == 'replay':
+        speed = 0.0
+
+        if len(sys.argv) > 3:
+            speed = float(sys.argv[3])
+
+        replay(sys.argv[2], speed)
+    else:
+        print('usage: python -m benchmarks.replay record <host> <port> <seconds> <file>')
+        print('       python -m benchmarks.replay replay <file> [speed]')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+
+soak_devices.py: Soak test for the device registry of the IP Connection
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Run from the brickv directory: python -m benchmarks.soak_devices [cycles] [devices]
+#
+# Connects to a local stand-in for brickd and disconnects again for the
+# given number of cycles. On every connect the stand-in enumerates the
+# devices as available. The second enumerate request is answered with one
+# callback per device and the devices enumerated as disconnected. Like
+# brickv, the enumerate callback creates a new device object with a
+# registered callback for every available device and releases it when the
+# device is disconnected. The memory in use and the number of registered
+# devices are printed every 1000 cycles and have to stay flat.
+
+import gc
+import socket
+import struct
+import sys
+import time
+from threading import Thread, Event
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None # Python 2, only the object count is printed
+
+from bindings.ip_connection import IPConnection, base58encode
+from bindings.bricklet_temperature import BrickletTemperature
+
+HEADER_FORMAT = '<IBBBB'
+ENUMERATE_FORMAT = '<8s8scBBBBBBHB'
+
+def enumerate_packet(uid, enumeration_type):
+    payload = struct.pack(ENUMERATE_FORMAT, base58encode(uid).encode('ascii'), b'0', b'a',
+                          1, 1, 0, 2, 0, 0, BrickletTemperature.DEVICE_IDENTIFIER,
+                          enumeration_type)
+
+    return struct.pack(HEADER_FORMAT, uid, 8 + len(payload),
+                       IPConnection.CALLBACK_ENUMERATE, 0, 0) + payload
+
+def temperature_packet(uid):
+    return struct.pack(HEADER_FORMAT + 'h', uid, 10,
+                       BrickletTemperature.CALLBACK_TEMPERATURE, 0, 0, 2342)
+
+class StandInBrickd:
+    def __init__(self, device_count):
+        uids = range(1000, 1000 + device_count)
+        self.responses = [b''.join([enumerate_packet(uid, IPConnection.ENUMERATION_TYPE_AVAILABLE) for uid in uids]),
+                          b''.join([temperature_packet(uid) for uid in uids] +
+                                   [enumerate_packet(uid, IPConnection.ENUMERATION_TYPE_DISCONNECTED) for uid in uids])]
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(16)
+        self.port = self.server.getsockname()[1]
+
+        thread = Thread(target=self.loop)
+        thread.daemon = True
+        thread.start()
+
+    def loop(self):
+        while True:
+            client = self.server.accept()[0]
+            thread = Thread(target=self.handle, args=(client,))
+            thread.daemon = True
+            thread.start()
+
+    def handle(self, client):
+        # any request is taken as the enumerate request
+        i = 0
+
+        try:
+            while len(client.recv(4096)) > 0:
+                client.sendall(self.responses[i % 2])
+                i += 1
+        except socket.error:
+            pass
+
+        client.close()
+
+class Viewer:
+    def __init__(self, device_count):
+        self.device_count = device_count
+        self.devices = {}
+        self.callback_count = 0
+        self.disconnected_count = 0
+        self.done = Event()
+        self.ipcon = IPConnection()
+        self.ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, self.cb_enumerate)
+
+    def cb_enumerate(self, uid, connected_uid, position, hardware_version,
+                     firmware_version, device_identifier, enumeration_type):
+        if enumeration_type == IPConnection.ENUMERATION_TYPE_AVAILABLE:
+            device = BrickletTemperature(uid, self.ipcon)
+            device.register_callback(BrickletTemperature.CALLBACK_TEMPERATURE,
+                                     lambda temperature: self.cb_temperature(device, temperature))
+            self.devices[uid] = device
+
+            if len(self.devices) == self.device_count:
+                self.ipcon.enumerate()
+        elif enumeration_type == IPConnection.ENUMERATION_TYPE_DISCONNECTED:
+            self.devices.pop(uid).release()
+            self.disconnected_count += 1
+
+            if self.disconnected_count == self.device_count:
+                self.done.set()
+
+    def cb_temperature(self, device, temperature):
+        self.callback_count += 1
+
+    def cycle(self, port):
+        self.disconnected_count = 0
+        self.done.clear()
+        self.ipcon.connect('127.0.0.1', port)
+        self.ipcon.enumerate()
+
+        if not self.done.wait(5):
+            raise Exception('Stand-in brickd did not respond')
+
+        self.ipcon.disconnect()
+
+def measure():
+    gc.collect()
+
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0], len(gc.get_objects())
+    else:
+        return None, len(gc.get_objects())
+
+def main():
+    cycles = 10000
+    device_count = 10
+
+    if len(sys.argv) > 1:
+        cycles = int(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        device_count = int(sys.argv[2])
+
+    brickd = StandInBrickd(device_count)
+    viewer = Viewer(device_count)
+
+    # warm up the codec and class level caches before measuring
+    viewer.cycle(brickd.port)
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    first_memory, first_objects = measure()
+    start = time.time()
+
+    print('{0:>8} {1:>12} {2:>10} {3:>10} {4:>10}'.format('cycles', 'memory', 'objects', 'devices', 'callbacks'))
+
+    for i in range(1, cycles + 1):
+        viewer.cycle(brickd.port)
+
+        if i % 1000 == 0 or i == cycles:
+            memory, objects = measure()
+
+            print('{0:>8} {1:>12} {2:>10} {3:>10} {4:>10}'.format(i, memory, objects,
+                                                                  len(viewer.ipcon.devices),
+                                                                  viewer.callback_count))
+
+    last_memory, last_objects = measure()
+
+    print('{0} cycles in {1:.1f} s'.format(cycles, time.time() - start))
+
+    if first_memory is not None:
+        print('memory growth: {0} bytes'.format(last_memory - first_memory))
+
+    print('object growth: {0}'.format(last_objects - first_objects))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+
+suite.py: End-to-end benchmarks of the IP Connection
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Run from the brickv directory:
+#
+#   python -m benchmarks.suite [stacks] [result file]
+#   python -m benchmarks.suite compare <old result file> <new result file> [tolerance]
+#
+# Starts the Brick Daemon simulator from brickd_simulator.py with the
+# given number of stacks (default 20, 25 devices each) in a separate
+# process and measures the IP Connection and the bindings against it:
+#
+# - enumerate: time until all devices were enumerated
+# - connect: time of connect
+# - reconnect: time from the loss of the connection until auto-reconnect
+#   reestablished it, with a minimal backoff
+# - getter: round trip time of get_identity, one call at a time, and the
+#   call rate of gather_calls for all devices at once
+# - callback_rate: callback rates are doubled until the callback
+#   functions receive less than 95% of the callbacks sent, the highest
+#   rate received completely is max_sustained
+# - cpu: CPU time of this process per 1000 packets for callbacks and for
+#   getter round trips (request and response)
+#
+# All times are in seconds. The results are written as JSON to the result
+# file or printed. compare prints every result of the new file that is
+# worse than in the old file by more than the tolerance (default 0.2 for
+# 20%) and exits with status 1 if there is any.
+
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from threading import Thread, Event
+
+from bindings.ip_connection import IPConnection, base58encode, gather_calls
+from benchmarks.brickd_simulator import create_stacks
+
+ENUMERATE_ROUNDS = 5
+CONNECT_ROUNDS = 20
+RECONNECT_ROUNDS = 10
+RECONNECT_BACKOFF = 0.001
+GETTER_CALLS = 2000
+GATHER_ROUNDS = 10
+CALLBACK_RATES = [1000 * 2 ** i for i in range(10)]
+CALLBACK_WARMUP = 0.5
+CALLBACK_WINDOW = 2.0
+CALLBACK_SUSTAINED = 0.95
+CPU_CALLBACK_RATE = 10000
+CPU_WINDOW = 3.0
+
+# (result path, True if higher values are better)
+METRICS = [('enumerate.median', False),
+           ('connect.median', False),
+           ('reconnect.median', False),
+           ('getter.p50', False),
+           ('getter.p99', False),
+           ('getter.calls_per_second', True),
+           ('callback_rate.max_sustained', True),
+           ('cpu.ms_per_1000_callbacks', False),
+           ('cpu.ms_per_1000_getter_packets', False)]
+
+def percentile(values, fraction):
+    values = sorted(values)
+
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def median(values):
+    return percentile(values, 0.5)
+
+def log(message):
+    sys.stderr.write(message + '\n')
+
+try:
+    cpu_time = time.process_time
+except AttributeError:
+    cpu_time = time.clock # Python 2, CPU time of the process on Unix
+
+class Simulator:
+    """
+    Runs brickd_simulator.py in a separate process, so it does not compete
+    with the measured IP Connection for the interpreter lock.
+    """
+
+    def __init__(self, stacks):
+        brickv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+        self.process = subprocess.Popen([sys.executable, '-u', '-m', 'benchmarks.brickd_simulator',
+                                         '0', str(stacks)],
+                                        cwd=brickv_path, stdout=subprocess.PIPE,
+                                        universal_newlines=True)
+        self.port = int(self.process.stdout.readline().split()[-1])
+        self.dropped_callbacks = 0
+
+        thread = Thread(target=self.loop)
+        thread.daemon = True
+        thread.start()
+
+    def loop(self):
+        # the simulator prints its counters every second, the last column
+        # is the number of callbacks dropped in that second
+        for line in iter(self.process.stdout.readline, ''):
+            try:
+                self.dropped_callbacks += int(line.split()[-1])
+            except ValueError:
+                pass
+
+    def stop(self):
+        self.process.terminate()
+        self.process.wait()
+
+class Suite:
+    def __init__(self, stacks):
+        self.simulated_devices = create_stacks(stacks)
+        self.simulator = Simulator(stacks)
+        self.ipcon = IPConnection()
+        self.devices = []
+        self.callback_count = 0
+        self.periodic_callbacks = []
+
+    def count_callback(self, *values):
+        self.callback_count += 1
+
+    def connect(self):
+        self.ipcon.connect('127.0.0.1', self.simulator.port)
+
+    def create_devices(self):
+        for simulated in self.simulated_devices:
+            device = simulated.device_type.device_class(base58encode(simulated.uid), self.ipcon)
+
+            for callback_id in device.callback_formats:
+                device.register_callback(callback_id, self.count_callback)
+
+            for setter_id in simulated.device_type.period_setters:
+                self.periodic_callbacks.append((device, setter_id))
+
+            self.devices.append(device)
+
+    def measure_enumerate(self):
+        done = Event()
+        uids = set()
+        times = []
+
+        def cb_enumerate(uid, *args):
+            uids.add(uid)
+
+            if len(uids) == len(self.simulated_devices):
+                done.set()
+
+        self.ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, cb_enumerate)
+
+        for i in range(ENUMERATE_ROUNDS):
+            uids.clear()
+            done.clear()
+
+            start = time.time()
+            self.ipcon.enumerate()
+
+            if not done.wait(10):
+                raise Exception('Enumeration did not finish')
+
+            times.append(time.time() - start)
+
+        return {'devices': len(self.simulated_devices), 'median': median(times), 'min': min(times)}
+
+    def measure_connect(self):
+        times = []
+
+        for i in range(CONNECT_ROUNDS):
+            start = time.time()
+            self.connect()
+            times.append(time.time() - start)
+
+            self.ipcon.disconnect()
+
+        return {'count': len(times), 'median': median(times), 'max': max(times)}
+
+    def measure_reconnect(self):
+        connected = Event()
+        times = []
+
+        def cb_connected(connect_reason):
+            if connect_reason == IPConnection.CONNECT_REASON_AUTO_RECONNECT:
+                connected.set()
+
+        self.ipcon.set_auto_reconnect_backoff(RECONNECT_BACKOFF, RECONNECT_BACKOFF)
+        self.ipcon.register_callback(IPConnection.CALLBACK_CONNECTED, cb_connected)
+
+        for i in range(RECONNECT_ROUNDS):
+            connected.clear()
+
+            # the receive thread sees the shut down socket as a lost
+            # connection and starts the auto-reconnect
+            self.ipcon.socket.shutdown(socket.SHUT_RDWR)
+
+            if not connected.wait(10):
+                raise Exception('Auto-reconnect did not reconnect')
+
+            times.append(self.ipcon.get_reconnect_statistics().last_latency)
+
+        return {'count': len(times), 'backoff': RECONNECT_BACKOFF,
+                'median': median(times), 'max': max(times)}
+
+    def measure_getter(self):
+        times = []
+        start_cpu = cpu_time()
+
+        for i in range(GETTER_CALLS):
+            device = self.devices[i % len(self.devices)]
+
+            start = time.time()
+            device.get_identity()
+            times.append(time.time() - start)
+
+        cpu = cpu_time() - start_cpu
+        calls = [(device, 'get_identity') for device in self.devices]
+        start = time.time()
+
+        for i in range(GATHER_ROUNDS):
+            for result in gather_calls(calls):
+                if result.error is not None:
+                    raise result.error
+
+        calls_per_second = len(calls) * GATHER_ROUNDS / (time.time() - start)
+
+        return {'count': len(times), 'p50': median(times), 'p99': percentile(times, 0.99),
+                'max': max(times), 'calls_per_second': calls_per_second}, \
+               cpu / (GETTER_CALLS * 2) * 1000 * 1000
+
+    def set_callback_periods(self, period):
+        # the requests are sent back-to-back, under full load each of them
+        # would have to wait for the queued callbacks
+        futures = [self.ipcon.send_request_async(device, setter_id, (period,), 'I', '')
+                   for device, setter_id in self.periodic_callbacks]
+
+        for future in futures:
+            future.result()
+
+    def wait_for_callbacks(self):
+        # waits until the queued callbacks were called
+        count = -1
+
+        while count != self.callback_count:
+            count = self.callback_count
+            time.sleep(0.2)
+
+    def run_callbacks(self, rate, window):
+        period = max(1, int(round(len(self.periodic_callbacks) * 1000.0 / rate)))
+        rate = len(self.periodic_callbacks) * 1000.0 / period
+
+        # the simulator sends the callbacks of all devices at about the same
+        # time, so the window has to cover whole periods
+        window = period / 1000.0 * math.ceil(window * 1000.0 / period)
+
+        self.set_callback_periods(period)
+        time.sleep(CALLBACK_WARMUP)
+
+        start_count = self.callback_count
+        start_cpu = cpu_time()
+        start = time.time()
+
+        time.sleep(window)
+
+        received = (self.callback_count - start_count) / (time.time() - start)
+        cpu = cpu_time() - start_cpu
+        count = self.callback_count - start_count
+
+        self.set_callback_periods(0)
+        self.wait_for_callbacks()
+
+        return rate, received, cpu, count, period
+
+    def measure_callback_rate(self):
+        steps = []
+        max_sustained = 0.0
+
+        for rate in CALLBACK_RATES:
+            rate, received, cpu, count, period = self.run_callbacks(rate, CALLBACK_WINDOW)
+            sustained = received >= rate * CALLBACK_SUSTAINED
+
+            log('{0:.0f} callbacks/s: received {1:.0f}/s'.format(rate, received))
+
+            steps.append({'rate': rate, 'received': received, 'sustained': sustained})
+
+            if not sustained:
+                break
+
+            max_sustained = received
+
+            if period == 1:
+                break # the simulator cannot send faster
+
+        return {'steps': steps, 'max_sustained': max_sustained,
+                'simulator_dropped': self.simulator.dropped_callbacks}
+
+    def measure_cpu(self):
+        rate, received, cpu, count, period = self.run_callbacks(CPU_CALLBACK_RATE, CPU_WINDOW)
+
+        return cpu / count * 1000 * 1000
+
+    def run(self):
+        results = {'python': platform.python_version(), 'platform': platform.platform(),
+                   'devices': len(self.simulated_devices)}
+
+        try:
+            self.connect()
+            self.create_devices()
+
+            log('measuring enumerate')
+            results['enumerate'] = self.measure_enumerate()
+
+            self.ipcon.disconnect()
+
+            log('measuring connect')
+            results['connect'] = self.measure_connect()
+
+            self.connect()
+
+            log('measuring reconnect')
+            results['reconnect'] = self.measure_reconnect()
+            log('measuring getter')
+            results['getter'], getter_cpu = self.measure_getter()
+            log('measuring callback rate')
+            results['callback_rate'] = self.measure_callback_rate()
+            log('measuring cpu')
+            results['cpu'] = {'ms_per_1000_callbacks': self.measure_cpu(),
+                              'ms_per_1000_getter_packets': getter_cpu}
+
+            self.ipcon.disconnect()
+        finally:
+            self.simulator.stop()
+
+        return results
+
+def get_metric(results, path):
+    for key in path.split('.'):
+        results = results[key]
+
+    return results
+
+def compare(old_filename, new_filename, tolerance):
+    old = json.load(open(old_filename))
+    new = json.load(open(new_filename))
+    regressions = 0
+
+    print('{0:<32} {1:>14} {2:>14} {3:>9}'.format('result', 'old', 'new', 'better'))
+
+    for path, higher_is_better in METRICS:
+        try:
+            old_value = get_metric(old, path)
+            new_value = get_metric(new, path)
+        except KeyError:
+            continue
+
+        if higher_is_better:
+            change = (old_value - new_value) / max(old_value, 1e-12)
+        else:
+            change = (new_value - old_value) / max(old_value, 1e-12)
+
+        marker = ''
+
+        if change > tolerance:
+            marker = 'REGRESSION'
+            regressions += 1
+
+        print('{0:<32} {1:>14.6g} {2:>14.6g} {3:>+8.1f}% {4}'.format(path, old_value, new_value,
+                                                                    -change * 100, marker))
+
+    return regressions
+
+def main():
+    if len(sys.argv) in (4, 5) and sys.argv[1] == 'compare':
+        tolerance = 0.2
+
+        if len(sys.argv) > 4:
+            tolerance = float(sys.argv[4])
+
+        if compare(sys.argv[2], sys.argv[3], tolerance) > 0:
+            sys.exit(1)
+
+        return
+
+    stacks = 20
+
+    if len(sys.argv) > 1:
+        stacks = int(sys.argv[1])
+
+    results = Suite(stacks).run()
+    output = json.dumps(results, indent=2, sort_keys=True)
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted.
+
+# asyncio is only available in python 3. this file still sticks to python 2
+# syntax (no async/await), because the package builds compile every module
+# in the bindings directory
+
+from collections import deque
+import asyncio
+
+try:
+    from .ip_connection import IPConnection, Error, ReceiveBuffer, monotonic
+except ValueError:
+    from ip_connection import IPConnection, Error, ReceiveBuffer, monotonic
+
+class AsyncIPConnectionProtocol(asyncio.BufferedProtocol):
+    def __init__(self, ipcon):
+        self.ipcon = ipcon
+        self.receive_buffer = ReceiveBuffer(ipcon.receive_buffer_size)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        return self.receive_buffer.get_free_view()
+
+    def buffer_updated(self, nbytes):
+        self.ipcon.receive_timestamp = monotonic()
+
+        if not self.receive_buffer.frame(nbytes, self.ipcon.handle_response):
+            self.ipcon.disconnect_reason = IPConnection.DISCONNECT_REASON_ERROR
+            self.transport.abort()
+
+    def eof_received(self):
+        if self.ipcon.disconnect_reason is None:
+            self.ipcon.disconnect_reason = IPConnection.DISCONNECT_REASON_SHUTDOWN
+
+    def connection_lost(self, exc):
+        self.ipcon.connection_lost(self, exc)
+
+class AsyncCallbackQueue:
+    """
+    Stand-in for the callback queue of the IPConnection. Packets and meta
+    events are dispatched directly in the event loop instead of being
+    passed to a callback thread.
+    """
+
+    def __init__(self, ipcon):
+        self.ipcon = ipcon
+
+    def put(self, item, block=True, timeout=None):
+        kind, data = item
+
+        if kind == IPConnection.QUEUE_META:
+            self.ipcon.dispatch_meta(*data)
+        elif kind == IPConnection.QUEUE_PACKET:
+            self.ipcon.dispatch_packet(data)
+        elif kind == IPConnection.QUEUE_COALESCED_PACKET:
+            self.ipcon.dispatch_packet(self.ipcon.take_coalesced_packet(data))
+        elif kind == IPConnection.QUEUE_BATCH:
+            # batches that are not full yet are delivered by the flush thread
+            self.ipcon.loop.call_soon_threadsafe(self.ipcon.dispatch_batch, data)
+
+class CallbackIterator:
+    """
+    Asynchronous iterator over the values of a device callback, as returned
+    by AsyncIPConnection.iterate_callback. Values of callbacks with more
+    than one parameter are returned as tuples.
+    """
+
+    def __init__(self, device, id, maxsize):
+        self.device = device
+        self.id = id
+        self.queue = asyncio.Queue(maxsize)
+
+        device.register_callback(id, self.put)
+
+    def put(self, *values):
+        if len(values) == 1:
+            values = values[0]
+
+        if self.queue.full():
+            # drop the oldest value to keep up with the device
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(values)
+
+    def close(self):
+        """
+        Unregisters the callback from the device.
+        """
+
+        if self.device.registered_callbacks.get(self.id) == self.put:
+            self.device.registered_callbacks.pop(self.id)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.queue.get()
+
+class AsyncIPConnection(IPConnection):
+    """
+    IP Connection on top of an asyncio event loop. All I/O and callback
+    dispatching happens in the event loop, no threads are started.
+
+    connect, disconnect and the *_async getters of the devices return
+    awaitables. Setters are sent without waiting for their response. The
+    blocking getters of the devices cannot be used with this IP
+    Connection. Callbacks can be plain functions or coroutine functions,
+    alternatively iterate_callback returns an asynchronous iterator over
+    the values of a device callback.
+    """
+
+    def __init__(self, loop=None):
+        IPConnection.__init__(self)
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        self.loop = loop
+        self.transport = None
+        self.protocol = None
+        self.disconnect_reason = None
+        self.closed = None
+        self.reconnect_handle = None
+        self.callback_queue = AsyncCallbackQueue(self)
+        self.waiting_requests = {} # (uid, function_id) -> deque of requests waiting for a sequence number
+
+    def connect(self, host, port):
+        """
+        Creates a TCP/IP connection to the given *host* and *port*. Returns
+        an awaitable that completes when the connection is established.
+        """
+
+        if self.transport is not None:
+            raise Error(Error.ALREADY_CONNECTED,
+                        'Already connected to {0}:{1}'.format(self.host, self.port))
+
+        self.host = host
+        self.port = port
+
+        return self.connect_unlocked(False)
+
+    def connect_unlocked(self, is_auto_reconnect):
+        connected = self.loop.create_future()
+        protocol = AsyncIPConnectionProtocol(self)
+        task = self.loop.create_task(self.loop.create_connection(lambda: protocol, self.host, self.port))
+
+        def done(task):
+            if task.cancelled():
+                connected.cancel()
+                return
+
+            if task.exception() is not None:
+                connected.set_exception(task.exception())
+                return
+
+            self.transport, self.protocol = task.result()
+            self.disconnect_reason = None
+            self.write_combiner.reset()
+            self.closed = self.loop.create_future()
+            self.auto_reconnect_allowed = False
+            self.auto_reconnect_pending = False
+
+            if is_auto_reconnect:
+                self.record_reconnect()
+                connect_reason = IPConnection.CONNECT_REASON_AUTO_RECONNECT
+            else:
+                connect_reason = IPConnection.CONNECT_REASON_REQUEST
+
+            self.dispatch_meta(IPConnection.CALLBACK_CONNECTED, connect_reason)
+            connected.set_result(None)
+
+        task.add_done_callback(done)
+
+        return connected
+
+    def disconnect(self):
+        """
+        Closes the connection. Returns an awaitable that completes when the
+        connection is closed.
+        """
+
+        self.auto_reconnect_allowed = False
+
+        if self.auto_reconnect_pending:
+            # abort potentially pending auto reconnect
+            self.auto_reconnect_pending = False
+
+            if self.reconnect_handle is not None:
+                self.reconnect_handle.cancel()
+                self.reconnect_handle = None
+
+            closed = self.loop.create_future()
+            closed.set_result(None)
+
+            return closed
+
+        if self.transport is None:
+            raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+        self.disconnect_reason = IPConnection.DISCONNECT_REASON_REQUEST
+        self.transport.close()
+
+        return asyncio.shield(self.closed)
+
+    def connection_lost(self, protocol, exc):
+        if protocol is not self.protocol:
+            return
+
+        disconnect_reason = self.disconnect_reason
+
+        if disconnect_reason is None:
+            disconnect_reason = IPConnection.DISCONNECT_REASON_ERROR
+
+        self.transport = None
+        self.protocol = None
+        self.disconnect_time = monotonic()
+        self.write_combiner.reset()
+        self.fail_pending_requests(Error(Error.NOT_CONNECTED, 'Connection closed'))
+
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+        if disconnect_reason != IPConnection.DISCONNECT_REASON_REQUEST:
+            self.auto_reconnect_allowed = True
+
+        self.dispatch_meta(IPConnection.CALLBACK_DISCONNECTED, disconnect_reason)
+
+    def get_connection_state(self):
+        if self.transport is not None:
+            return IPConnection.CONNECTION_STATE_CONNECTED
+        elif self.auto_reconnect_pending:
+            return IPConnection.CONNECTION_STATE_PENDING
+        else:
+            return IPConnection.CONNECTION_STATE_DISCONNECTED
+
+    def reconnect(self):
+        self.reconnect_handle = None
+
+        if not self.auto_reconnect_allowed or self.transport is not None:
+            self.auto_reconnect_pending = False
+            return
+
+        def done(connected):
+            if connected.exception() is not None:
+                self.auto_reconnect_failures += 1
+                self.reconnect_handle = self.loop.call_later(self.get_reconnect_delay(), self.reconnect)
+
+        self.reconnect_attempts += 1
+        self.connect_unlocked(True).add_done_callback(done)
+
+    def dispatch_meta(self, function_id, parameter):
+        if function_id == IPConnection.CALLBACK_DISCONNECTED and \
+           parameter != IPConnection.DISCONNECT_REASON_REQUEST and \
+           self.auto_reconnect and self.auto_reconnect_allowed:
+            self.auto_reconnect_pending = True
+            self.auto_reconnect_failures = 0
+            self.reconnect_handle = self.loop.call_later(self.get_reconnect_delay(), self.reconnect)
+
+        callback = self.registered_callbacks.get(function_id)
+
+        if callback is not None:
+            self.call_callback(callback, (parameter,))
+
+    def dispatch_packet(self, packet):
+        # callbacks can be coroutine functions, schedule the coroutines
+        # they return as tasks
+        result = IPConnection.dispatch_packet(self, packet)
+
+        if asyncio.iscoroutine(result):
+            self.loop.create_task(result)
+
+    def dispatch_batch(self, batch):
+        result = IPConnection.dispatch_batch(self, batch)
+
+        if asyncio.iscoroutine(result):
+            self.loop.create_task(result)
+
+    def call_callback(self, callback, values):
+        result = callback(*values)
+
+        if asyncio.iscoroutine(result):
+            self.loop.create_task(result)
+
+    def iterate_callback(self, device, id, maxsize=1000):
+        """
+        Registers the callback with ID *id* of *device* and returns an
+        asynchronous iterator over its values. If the consumer falls more
+        than *maxsize* values behind then the oldest values are dropped.
+        """
+
+        return CallbackIterator(device, id, maxsize)
+
+    def replay_capture(self, filename, speed=1.0):
+        # replaying blocks until all callbacks are called, that would
+        # block the event loop
+        raise Error(Error.NOT_SUPPORTED, 'Captures cannot be replayed with an AsyncIPConnection')
+
+    def send(self, packet):
+        if self.transport is None:
+            raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+        try:
+            in_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            in_loop = False
+
+        if not in_loop:
+            # the write combiner sends the held back setter calls from its
+            # own thread, but the transport can only be used from the event
+            # loop
+            self.loop.call_soon_threadsafe(self.send_in_loop, packet)
+            return
+
+        self.send_in_loop(packet)
+
+    def send_in_loop(self, packet):
+        if self.transport is None:
+            # disconnected after the packet was handed over from another
+            # thread. only write combined setters are sent this way, they
+            # don't expect a response
+            return
+
+        if self.statistics is not None:
+            self.statistics.count_out(len(packet))
+
+        if self.capture is not None:
+            self.capture.write(IPConnection.CAPTURE_DIRECTION_SENT, monotonic(), packet)
+
+        self.transport.write(packet)
+
+    def send_request(self, device, function_id, data, form, form_ret):
+        # the event loop cannot be blocked to wait for a response. setters
+        # are sent without waiting for their response, getters have to be
+        # called via their *_async variant
+        if len(form_ret) > 0:
+            raise Error(Error.NOT_SUPPORTED,
+                        'Function {0} returns a value, use its *_async variant instead'.format(function_id))
+
+        return self.send_request_async(device, function_id, data, form, form_ret)
+
+    def send_request_async(self, device, function_id, data, form, form_ret, result_type=None):
+        """
+        Sends a request and returns an asyncio future for its result.
+        """
+
+        result = self.loop.create_future()
+        request = (device, function_id, data, form, form_ret, result_type, result)
+        key = (device.uid, function_id)
+
+        if device.get_response_expected(function_id) and \
+           (key in self.waiting_requests or not self.has_free_sequence_number(key)):
+            # all sequence numbers of this function are in use. waiting for
+            # one of them to be released would block the event loop, the
+            # request is sent as soon as a response arrives or a request
+            # times out instead. the timeout starts when it is sent
+            self.waiting_requests.setdefault(key, deque()).append(request)
+        else:
+            self.start_request(request)
+
+        return result
+
+    def start_request(self, request):
+        device, function_id, data, form, form_ret, result_type, result = request
+        future = IPConnection.send_request_async(self, device, function_id, data, form, form_ret, result_type)
+
+        if future.done():
+            self.complete_future(result, future)
+        else:
+            timeout_handle = self.loop.call_later(self.timeout, self.expire_pending_request, future)
+
+            def done(future):
+                timeout_handle.cancel()
+                self.complete_future(result, future)
+                self.send_waiting_requests((device.uid, function_id))
+
+            future.add_done_callback(done)
+
+    def send_waiting_requests(self, key):
+        waiting = self.waiting_requests.get(key)
+
+        while waiting is not None and len(waiting) > 0 and self.has_free_sequence_number(key):
+            request = waiting.popleft()
+            result = request[-1]
+
+            if result.cancelled():
+                continue
+
+            try:
+                self.start_request(request)
+            except Error as e:
+                result.set_exception(e)
+
+        if waiting is not None and len(waiting) == 0:
+            del self.waiting_requests[key]
+
+    def has_free_sequence_number(self, key):
+        uid, function_id = key
+
+        for sequence_number in range(1, 16):
+            if (uid, function_id, sequence_number) not in self.pending_requests:
+                return True
+
+        return False
+
+    def complete_future(self, result, future):
+        if result.cancelled():
+            return
+
+        try:
+            value = future.result(0)
+        except Error as e:
+            result.set_exception(e)
+        else:
+            result.set_result(value)
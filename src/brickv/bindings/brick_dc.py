@@ -65,6 +65,46 @@ class BrickDC(Device):
     DRIVE_MODE_DRIVE_BRAKE = 0
     DRIVE_MODE_DRIVE_COAST = 1
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_VELOCITY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ACCELERATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_ACCELERATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_PWM_FREQUENCY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PWM_FREQUENCY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_FULL_BRAKE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STACK_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_CONSUMPTION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_ENABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_DISABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_ENABLED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DRIVE_MODE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_DRIVE_MODE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CURRENT_VELOCITY_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_CURRENT_VELOCITY_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_UNDER_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_EMERGENCY_SHUTDOWN: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_VELOCITY_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_CURRENT_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_PROTOCOL1_BRICKLET_NAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESET: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_UNDER_VOLTAGE: 'H',
+        CALLBACK_EMERGENCY_SHUTDOWN: '',
+        CALLBACK_VELOCITY_REACHED: 'h',
+        CALLBACK_CURRENT_VELOCITY: 'h',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -74,40 +114,6 @@ class BrickDC(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickDC.FUNCTION_SET_VELOCITY] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_VELOCITY] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_CURRENT_VELOCITY] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_SET_ACCELERATION] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_ACCELERATION] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_SET_PWM_FREQUENCY] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_PWM_FREQUENCY] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_FULL_BRAKE] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_STACK_INPUT_VOLTAGE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_CURRENT_CONSUMPTION] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_ENABLE] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_DISABLE] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_IS_ENABLED] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_SET_MINIMUM_VOLTAGE] = BrickDC.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_MINIMUM_VOLTAGE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_SET_DRIVE_MODE] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_DRIVE_MODE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_SET_CURRENT_VELOCITY_PERIOD] = BrickDC.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_CURRENT_VELOCITY_PERIOD] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.CALLBACK_UNDER_VOLTAGE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickDC.CALLBACK_EMERGENCY_SHUTDOWN] = BrickDC.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickDC.CALLBACK_VELOCITY_REACHED] = BrickDC.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickDC.CALLBACK_CURRENT_VELOCITY] = BrickDC.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_GET_CHIP_TEMPERATURE] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickDC.FUNCTION_RESET] = BrickDC.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickDC.FUNCTION_GET_IDENTITY] = BrickDC.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickDC.CALLBACK_UNDER_VOLTAGE] = 'H'
-        self.callback_formats[BrickDC.CALLBACK_EMERGENCY_SHUTDOWN] = ''
-        self.callback_formats[BrickDC.CALLBACK_VELOCITY_REACHED] = 'h'
-        self.callback_formats[BrickDC.CALLBACK_CURRENT_VELOCITY] = 'h'
-
     def set_velocity(self, velocity):
         """
         Sets the velocity of the motor. Whereas -32767 is full speed backward,
@@ -130,6 +136,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_VELOCITY, (), '', 'h')
 
+    def get_velocity_async(self):
+        """
+        Asynchronous version of :func:`GetVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_VELOCITY, (), '', 'h')
+
     def get_current_velocity(self):
         """
         Returns the *current* velocity of the motor. This value is different
@@ -138,6 +152,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_CURRENT_VELOCITY, (), '', 'h')
 
+    def get_current_velocity_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_CURRENT_VELOCITY, (), '', 'h')
+
     def set_acceleration(self, acceleration):
         """
         Sets the acceleration of the motor. It is given in *velocity/s*. An
@@ -161,6 +183,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_ACCELERATION, (), '', 'H')
 
+    def get_acceleration_async(self):
+        """
+        Asynchronous version of :func:`GetAcceleration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAcceleration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_ACCELERATION, (), '', 'H')
+
     def set_pwm_frequency(self, frequency):
         """
         Sets the frequency (in Hz) of the PWM with which the motor is driven.
@@ -182,6 +212,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_PWM_FREQUENCY, (), '', 'H')
 
+    def get_pwm_frequency_async(self):
+        """
+        Asynchronous version of :func:`GetPwmFrequency`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPwmFrequency` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_PWM_FREQUENCY, (), '', 'H')
+
     def full_brake(self):
         """
         Executes an active full brake.
@@ -203,6 +241,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_stack_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetStackInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
+
     def get_external_input_voltage(self):
         """
         Returns the external input voltage in mV. The external input voltage is
@@ -220,12 +266,28 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_external_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetExternalInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetExternalInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
+
     def get_current_consumption(self):
         """
         Returns the current consumption of the motor in mA.
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_CURRENT_CONSUMPTION, (), '', 'H')
 
+    def get_current_consumption_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentConsumption`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentConsumption` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_CURRENT_CONSUMPTION, (), '', 'H')
+
     def enable(self):
         """
         Enables the driver chip. The driver parameters can be configured (velocity,
@@ -246,6 +308,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_IS_ENABLED, (), '', '?')
 
+    def is_enabled_async(self):
+        """
+        Asynchronous version of :func:`IsEnabled`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsEnabled` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_IS_ENABLED, (), '', '?')
+
     def set_minimum_voltage(self, voltage):
         """
         Sets the minimum voltage in mV, below which the :func:`UnderVoltage` callback
@@ -264,6 +334,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
 
+    def get_minimum_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetMinimumVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMinimumVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
+
     def set_drive_mode(self, mode):
         """
         Sets the drive mode. Possible modes are:
@@ -292,6 +370,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_DRIVE_MODE, (), '', 'B')
 
+    def get_drive_mode_async(self):
+        """
+        Asynchronous version of :func:`GetDriveMode`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDriveMode` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_DRIVE_MODE, (), '', 'B')
+
     def set_current_velocity_period(self, period):
         """
         Sets a period in ms with which the :func:`CurrentVelocity` callback is triggered.
@@ -307,6 +393,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_CURRENT_VELOCITY_PERIOD, (), '', 'H')
 
+    def get_current_velocity_period_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentVelocityPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentVelocityPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_CURRENT_VELOCITY_PERIOD, (), '', 'H')
+
     def get_protocol1_bricklet_name(self, port):
         """
         Returns the firmware and protocol version and the name of the Bricklet for a given port.
@@ -317,6 +411,14 @@ class BrickDC(Device):
         """
         return GetProtocol1BrickletName(*self.ipcon.send_request(self, BrickDC.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s'))
 
+    def get_protocol1_bricklet_name_async(self, port):
+        """
+        Asynchronous version of :func:`GetProtocol1BrickletName`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetProtocol1BrickletName` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s', GetProtocol1BrickletName)
+
     def get_chip_temperature(self):
         """
         Returns the temperature in °C/10 as measured inside the microcontroller. The
@@ -330,6 +432,14 @@ class BrickDC(Device):
         """
         return self.ipcon.send_request(self, BrickDC.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def reset(self):
         """
         Calling this function will reset the Brick. Calling this function
@@ -357,6 +467,14 @@ class BrickDC(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickDC.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickDC.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
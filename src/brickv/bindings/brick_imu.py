@@ -87,6 +87,60 @@ class BrickIMU(Device):
     CALIBRATION_TYPE_GYROSCOPE_GAIN = 4
     CALIBRATION_TYPE_GYROSCOPE_BIAS = 5
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_ACCELERATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_MAGNETIC_FIELD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ANGULAR_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ALL_DATA: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ORIENTATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_QUATERNION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IMU_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_LEDS_ON: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_LEDS_OFF: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_ARE_LEDS_ON: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ACCELERATION_RANGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_ACCELERATION_RANGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MAGNETOMETER_RANGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MAGNETOMETER_RANGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CONVERGENCE_SPEED: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CONVERGENCE_SPEED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CALIBRATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CALIBRATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ACCELERATION_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ACCELERATION_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MAGNETIC_FIELD_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_MAGNETIC_FIELD_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANGULAR_VELOCITY_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANGULAR_VELOCITY_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ALL_DATA_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ALL_DATA_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ORIENTATION_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ORIENTATION_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_QUATERNION_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_QUATERNION_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_ACCELERATION: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_MAGNETIC_FIELD: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANGULAR_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ALL_DATA: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ORIENTATION: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_QUATERNION: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_PROTOCOL1_BRICKLET_NAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESET: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_ACCELERATION: 'h h h',
+        CALLBACK_MAGNETIC_FIELD: 'h h h',
+        CALLBACK_ANGULAR_VELOCITY: 'h h h',
+        CALLBACK_ALL_DATA: 'h h h h h h h h h h',
+        CALLBACK_ORIENTATION: 'h h h',
+        CALLBACK_QUATERNION: 'f f f f',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -96,54 +150,6 @@ class BrickIMU(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickIMU.FUNCTION_GET_ACCELERATION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_MAGNETIC_FIELD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ALL_DATA] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ORIENTATION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_QUATERNION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_IMU_TEMPERATURE] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_LEDS_ON] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_LEDS_OFF] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_ARE_LEDS_ON] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_ACCELERATION_RANGE] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_ACCELERATION_RANGE] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_MAGNETOMETER_RANGE] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_MAGNETOMETER_RANGE] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_CONVERGENCE_SPEED] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_CONVERGENCE_SPEED] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_CALIBRATION] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_CALIBRATION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_ACCELERATION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ACCELERATION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_MAGNETIC_FIELD_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_MAGNETIC_FIELD_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_ANGULAR_VELOCITY_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_ALL_DATA_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ALL_DATA_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_ORIENTATION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_ORIENTATION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_SET_QUATERNION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_QUATERNION_PERIOD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.CALLBACK_ACCELERATION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.CALLBACK_MAGNETIC_FIELD] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.CALLBACK_ANGULAR_VELOCITY] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.CALLBACK_ALL_DATA] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.CALLBACK_ORIENTATION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.CALLBACK_QUATERNION] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_GET_CHIP_TEMPERATURE] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickIMU.FUNCTION_RESET] = BrickIMU.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickIMU.FUNCTION_GET_IDENTITY] = BrickIMU.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickIMU.CALLBACK_ACCELERATION] = 'h h h'
-        self.callback_formats[BrickIMU.CALLBACK_MAGNETIC_FIELD] = 'h h h'
-        self.callback_formats[BrickIMU.CALLBACK_ANGULAR_VELOCITY] = 'h h h'
-        self.callback_formats[BrickIMU.CALLBACK_ALL_DATA] = 'h h h h h h h h h h'
-        self.callback_formats[BrickIMU.CALLBACK_ORIENTATION] = 'h h h'
-        self.callback_formats[BrickIMU.CALLBACK_QUATERNION] = 'f f f f'
-
     def get_acceleration(self):
         """
         Returns the calibrated acceleration from the accelerometer for the 
@@ -155,6 +161,14 @@ class BrickIMU(Device):
         """
         return GetAcceleration(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ACCELERATION, (), '', 'h h h'))
 
+    def get_acceleration_async(self):
+        """
+        Asynchronous version of :func:`GetAcceleration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAcceleration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ACCELERATION, (), '', 'h h h', GetAcceleration)
+
     def get_magnetic_field(self):
         """
         Returns the calibrated magnetic field from the magnetometer for the 
@@ -166,6 +180,14 @@ class BrickIMU(Device):
         """
         return GetMagneticField(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_MAGNETIC_FIELD, (), '', 'h h h'))
 
+    def get_magnetic_field_async(self):
+        """
+        Asynchronous version of :func:`GetMagneticField`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMagneticField` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_MAGNETIC_FIELD, (), '', 'h h h', GetMagneticField)
+
     def get_angular_velocity(self):
         """
         Returns the calibrated angular velocity from the gyroscope for the 
@@ -178,6 +200,14 @@ class BrickIMU(Device):
         """
         return GetAngularVelocity(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY, (), '', 'h h h'))
 
+    def get_angular_velocity_async(self):
+        """
+        Asynchronous version of :func:`GetAngularVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAngularVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY, (), '', 'h h h', GetAngularVelocity)
+
     def get_all_data(self):
         """
         Returns the data from :func:`GetAcceleration`, :func:`GetMagneticField` 
@@ -191,6 +221,14 @@ class BrickIMU(Device):
         """
         return GetAllData(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ALL_DATA, (), '', 'h h h h h h h h h h'))
 
+    def get_all_data_async(self):
+        """
+        Asynchronous version of :func:`GetAllData`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAllData` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ALL_DATA, (), '', 'h h h h h h h h h h', GetAllData)
+
     def get_orientation(self):
         """
         Returns the current orientation (roll, pitch, yaw) of the IMU Brick as Euler
@@ -208,6 +246,14 @@ class BrickIMU(Device):
         """
         return GetOrientation(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ORIENTATION, (), '', 'h h h'))
 
+    def get_orientation_async(self):
+        """
+        Asynchronous version of :func:`GetOrientation`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetOrientation` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ORIENTATION, (), '', 'h h h', GetOrientation)
+
     def get_quaternion(self):
         """
         Returns the current orientation (x, y, z, w) of the IMU as 
@@ -236,6 +282,14 @@ class BrickIMU(Device):
         """
         return GetQuaternion(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_QUATERNION, (), '', 'f f f f'))
 
+    def get_quaternion_async(self):
+        """
+        Asynchronous version of :func:`GetQuaternion`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetQuaternion` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_QUATERNION, (), '', 'f f f f', GetQuaternion)
+
     def get_imu_temperature(self):
         """
         Returns the temperature of the IMU Brick. The temperature is given in 
@@ -243,6 +297,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_IMU_TEMPERATURE, (), '', 'h')
 
+    def get_imu_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetImuTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetImuTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_IMU_TEMPERATURE, (), '', 'h')
+
     def leds_on(self):
         """
         Turns the orientation and direction LEDs of the IMU Brick on.
@@ -262,6 +324,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_ARE_LEDS_ON, (), '', '?')
 
+    def are_leds_on_async(self):
+        """
+        Asynchronous version of :func:`AreLedsOn`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`AreLedsOn` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_ARE_LEDS_ON, (), '', '?')
+
     def set_acceleration_range(self, range):
         """
         Not implemented yet.
@@ -274,6 +344,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ACCELERATION_RANGE, (), '', 'B')
 
+    def get_acceleration_range_async(self):
+        """
+        Asynchronous version of :func:`GetAccelerationRange`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAccelerationRange` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ACCELERATION_RANGE, (), '', 'B')
+
     def set_magnetometer_range(self, range):
         """
         Not implemented yet.
@@ -286,6 +364,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_MAGNETOMETER_RANGE, (), '', 'B')
 
+    def get_magnetometer_range_async(self):
+        """
+        Asynchronous version of :func:`GetMagnetometerRange`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMagnetometerRange` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_MAGNETOMETER_RANGE, (), '', 'B')
+
     def set_convergence_speed(self, speed):
         """
         Sets the convergence speed of the IMU Brick in °/s. The convergence speed 
@@ -324,6 +410,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_CONVERGENCE_SPEED, (), '', 'H')
 
+    def get_convergence_speed_async(self):
+        """
+        Asynchronous version of :func:`GetConvergenceSpeed`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetConvergenceSpeed` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_CONVERGENCE_SPEED, (), '', 'H')
+
     def set_calibration(self, typ, data):
         """
         There are several different types that can be calibrated:
@@ -368,6 +462,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_CALIBRATION, (typ,), 'B', '10h')
 
+    def get_calibration_async(self, typ):
+        """
+        Asynchronous version of :func:`GetCalibration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCalibration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_CALIBRATION, (typ,), 'B', '10h')
+
     def set_acceleration_period(self, period):
         """
         Sets the period in ms with which the :func:`Acceleration` callback is triggered
@@ -383,6 +485,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ACCELERATION_PERIOD, (), '', 'I')
 
+    def get_acceleration_period_async(self):
+        """
+        Asynchronous version of :func:`GetAccelerationPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAccelerationPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ACCELERATION_PERIOD, (), '', 'I')
+
     def set_magnetic_field_period(self, period):
         """
         Sets the period in ms with which the :func:`MagneticField` callback is triggered
@@ -396,6 +506,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_MAGNETIC_FIELD_PERIOD, (), '', 'I')
 
+    def get_magnetic_field_period_async(self):
+        """
+        Asynchronous version of :func:`GetMagneticFieldPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMagneticFieldPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_MAGNETIC_FIELD_PERIOD, (), '', 'I')
+
     def set_angular_velocity_period(self, period):
         """
         Sets the period in ms with which the :func:`AngularVelocity` callback is triggered
@@ -409,6 +527,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY_PERIOD, (), '', 'I')
 
+    def get_angular_velocity_period_async(self):
+        """
+        Asynchronous version of :func:`GetAngularVelocityPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAngularVelocityPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ANGULAR_VELOCITY_PERIOD, (), '', 'I')
+
     def set_all_data_period(self, period):
         """
         Sets the period in ms with which the :func:`AllData` callback is triggered
@@ -422,6 +548,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 'I')
 
+    def get_all_data_period_async(self):
+        """
+        Asynchronous version of :func:`GetAllDataPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAllDataPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 'I')
+
     def set_orientation_period(self, period):
         """
         Sets the period in ms with which the :func:`Orientation` callback is triggered
@@ -435,6 +569,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_ORIENTATION_PERIOD, (), '', 'I')
 
+    def get_orientation_period_async(self):
+        """
+        Asynchronous version of :func:`GetOrientationPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetOrientationPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_ORIENTATION_PERIOD, (), '', 'I')
+
     def set_quaternion_period(self, period):
         """
         Sets the period in ms with which the :func:`Quaternion` callback is triggered
@@ -448,6 +590,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_QUATERNION_PERIOD, (), '', 'I')
 
+    def get_quaternion_period_async(self):
+        """
+        Asynchronous version of :func:`GetQuaternionPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetQuaternionPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_QUATERNION_PERIOD, (), '', 'I')
+
     def get_protocol1_bricklet_name(self, port):
         """
         Returns the firmware and protocol version and the name of the Bricklet for a given port.
@@ -458,6 +608,14 @@ class BrickIMU(Device):
         """
         return GetProtocol1BrickletName(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s'))
 
+    def get_protocol1_bricklet_name_async(self, port):
+        """
+        Asynchronous version of :func:`GetProtocol1BrickletName`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetProtocol1BrickletName` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s', GetProtocol1BrickletName)
+
     def get_chip_temperature(self):
         """
         Returns the temperature in °C/10 as measured inside the microcontroller. The
@@ -471,6 +629,14 @@ class BrickIMU(Device):
         """
         return self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def reset(self):
         """
         Calling this function will reset the Brick. Calling this function
@@ -498,6 +664,14 @@ class BrickIMU(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickIMU.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickIMU.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -158,6 +158,88 @@ class BrickMaster(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_STACK_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_STACK_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_EXTENSION_TYPE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_EXTENSION_TYPE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_IS_CHIBI_PRESENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CHIBI_ADDRESS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIBI_ADDRESS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CHIBI_MASTER_ADDRESS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIBI_MASTER_ADDRESS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CHIBI_SLAVE_ADDRESS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIBI_SLAVE_ADDRESS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIBI_SIGNAL_STRENGTH: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIBI_ERROR_LOG: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CHIBI_FREQUENCY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIBI_FREQUENCY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CHIBI_CHANNEL: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIBI_CHANNEL: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_IS_RS485_PRESENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_RS485_ADDRESS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_RS485_ADDRESS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_RS485_SLAVE_ADDRESS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_RS485_SLAVE_ADDRESS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_RS485_ERROR_LOG: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_RS485_CONFIGURATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_RS485_CONFIGURATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_IS_WIFI_PRESENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_WIFI_CONFIGURATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_CONFIGURATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_WIFI_ENCRYPTION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_ENCRYPTION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_WIFI_STATUS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_REFRESH_WIFI_STATUS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_SET_WIFI_CERTIFICATE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_CERTIFICATE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_WIFI_POWER_MODE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_POWER_MODE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_WIFI_BUFFER_INFO: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_WIFI_REGULATORY_DOMAIN: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_REGULATORY_DOMAIN: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_USB_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_LONG_WIFI_KEY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_LONG_WIFI_KEY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_WIFI_HOSTNAME: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_WIFI_HOSTNAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STACK_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STACK_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_USB_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STACK_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STACK_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_USB_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_STACK_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_STACK_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_USB_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_STACK_CURRENT_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_STACK_VOLTAGE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_USB_VOLTAGE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_PROTOCOL1_BRICKLET_NAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESET: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_STACK_CURRENT: 'H',
+        CALLBACK_STACK_VOLTAGE: 'H',
+        CALLBACK_USB_VOLTAGE: 'H',
+        CALLBACK_STACK_CURRENT_REACHED: 'H',
+        CALLBACK_STACK_VOLTAGE_REACHED: 'H',
+        CALLBACK_USB_VOLTAGE_REACHED: 'H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -167,82 +249,6 @@ class BrickMaster(Device):
 
         self.api_version = (2, 0, 1)
 
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_VOLTAGE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_CURRENT] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_EXTENSION_TYPE] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_EXTENSION_TYPE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_IS_CHIBI_PRESENT] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_CHIBI_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_CHIBI_MASTER_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_MASTER_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_CHIBI_SLAVE_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_SLAVE_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_SIGNAL_STRENGTH] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_ERROR_LOG] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_CHIBI_FREQUENCY] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_FREQUENCY] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_CHIBI_CHANNEL] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIBI_CHANNEL] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_IS_RS485_PRESENT] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_RS485_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_RS485_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_RS485_SLAVE_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_RS485_SLAVE_ADDRESS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_RS485_ERROR_LOG] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_RS485_CONFIGURATION] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_RS485_CONFIGURATION] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_IS_WIFI_PRESENT] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_CONFIGURATION] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_CONFIGURATION] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_ENCRYPTION] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_ENCRYPTION] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_STATUS] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_REFRESH_WIFI_STATUS] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_CERTIFICATE] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_CERTIFICATE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_POWER_MODE] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_POWER_MODE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_BUFFER_INFO] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_REGULATORY_DOMAIN] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_REGULATORY_DOMAIN] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_USB_VOLTAGE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_LONG_WIFI_KEY] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_LONG_WIFI_KEY] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_WIFI_HOSTNAME] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_WIFI_HOSTNAME] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_STACK_CURRENT_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_STACK_VOLTAGE_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_USB_VOLTAGE_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_STACK_CURRENT_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_STACK_VOLTAGE_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_USB_VOLTAGE_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickMaster.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.CALLBACK_STACK_CURRENT] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.CALLBACK_STACK_VOLTAGE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.CALLBACK_USB_VOLTAGE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.CALLBACK_STACK_CURRENT_REACHED] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.CALLBACK_STACK_VOLTAGE_REACHED] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.CALLBACK_USB_VOLTAGE_REACHED] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_GET_CHIP_TEMPERATURE] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickMaster.FUNCTION_RESET] = BrickMaster.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickMaster.FUNCTION_GET_IDENTITY] = BrickMaster.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickMaster.CALLBACK_STACK_CURRENT] = 'H'
-        self.callback_formats[BrickMaster.CALLBACK_STACK_VOLTAGE] = 'H'
-        self.callback_formats[BrickMaster.CALLBACK_USB_VOLTAGE] = 'H'
-        self.callback_formats[BrickMaster.CALLBACK_STACK_CURRENT_REACHED] = 'H'
-        self.callback_formats[BrickMaster.CALLBACK_STACK_VOLTAGE_REACHED] = 'H'
-        self.callback_formats[BrickMaster.CALLBACK_USB_VOLTAGE_REACHED] = 'H'
-
     def get_stack_voltage(self):
         """
         Returns the stack voltage in mV. The stack voltage is the
@@ -251,6 +257,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE, (), '', 'H')
 
+    def get_stack_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetStackVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE, (), '', 'H')
+
     def get_stack_current(self):
         """
         Returns the stack current in mA. The stack current is the
@@ -259,6 +273,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_CURRENT, (), '', 'H')
 
+    def get_stack_current_async(self):
+        """
+        Asynchronous version of :func:`GetStackCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_CURRENT, (), '', 'H')
+
     def set_extension_type(self, extension, exttype):
         """
         Writes the extension type to the EEPROM of a specified extension. 
@@ -291,6 +313,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_EXTENSION_TYPE, (extension,), 'B', 'I')
 
+    def get_extension_type_async(self, extension):
+        """
+        Asynchronous version of :func:`GetExtensionType`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetExtensionType` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_EXTENSION_TYPE, (extension,), 'B', 'I')
+
     def is_chibi_present(self):
         """
         Returns *true* if a Chibi Extension is available to be used by the Master.
@@ -299,6 +329,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_IS_CHIBI_PRESENT, (), '', '?')
 
+    def is_chibi_present_async(self):
+        """
+        Asynchronous version of :func:`IsChibiPresent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsChibiPresent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_IS_CHIBI_PRESENT, (), '', '?')
+
     def set_chibi_address(self, address):
         """
         Sets the address (1-255) belonging to the Chibi Extension.
@@ -319,6 +357,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_ADDRESS, (), '', 'B')
 
+    def get_chibi_address_async(self):
+        """
+        Asynchronous version of :func:`GetChibiAddress`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiAddress` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_ADDRESS, (), '', 'B')
+
     def set_chibi_master_address(self, address):
         """
         Sets the address (1-255) of the Chibi Master. This address is used if the
@@ -340,6 +386,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_MASTER_ADDRESS, (), '', 'B')
 
+    def get_chibi_master_address_async(self):
+        """
+        Asynchronous version of :func:`GetChibiMasterAddress`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiMasterAddress` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_MASTER_ADDRESS, (), '', 'B')
+
     def set_chibi_slave_address(self, num, address):
         """
         Sets up to 254 slave addresses. Valid addresses are in range 1-255. 0 has a
@@ -371,6 +425,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_SLAVE_ADDRESS, (num,), 'B', 'B')
 
+    def get_chibi_slave_address_async(self, num):
+        """
+        Asynchronous version of :func:`GetChibiSlaveAddress`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiSlaveAddress` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_SLAVE_ADDRESS, (num,), 'B', 'B')
+
     def get_chibi_signal_strength(self):
         """
         Returns the signal strength in dBm. The signal strength updates every time a
@@ -380,6 +442,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_SIGNAL_STRENGTH, (), '', 'B')
 
+    def get_chibi_signal_strength_async(self):
+        """
+        Asynchronous version of :func:`GetChibiSignalStrength`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiSignalStrength` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_SIGNAL_STRENGTH, (), '', 'B')
+
     def get_chibi_error_log(self):
         """
         Returns underrun, CRC error, no ACK and overflow error counts of the Chibi
@@ -391,6 +461,14 @@ class BrickMaster(Device):
         """
         return GetChibiErrorLog(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_ERROR_LOG, (), '', 'H H H H'))
 
+    def get_chibi_error_log_async(self):
+        """
+        Asynchronous version of :func:`GetChibiErrorLog`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiErrorLog` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_ERROR_LOG, (), '', 'H H H H', GetChibiErrorLog)
+
     def set_chibi_frequency(self, frequency):
         """
         Sets the Chibi frequency range for the Chibi Extension. Possible values are:
@@ -420,6 +498,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_FREQUENCY, (), '', 'B')
 
+    def get_chibi_frequency_async(self):
+        """
+        Asynchronous version of :func:`GetChibiFrequency`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiFrequency` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_FREQUENCY, (), '', 'B')
+
     def set_chibi_channel(self, channel):
         """
         Sets the channel used by the Chibi Extension. Possible channels are
@@ -450,6 +536,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIBI_CHANNEL, (), '', 'B')
 
+    def get_chibi_channel_async(self):
+        """
+        Asynchronous version of :func:`GetChibiChannel`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChibiChannel` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIBI_CHANNEL, (), '', 'B')
+
     def is_rs485_present(self):
         """
         Returns *true* if a RS485 Extension is available to be used by the Master.
@@ -458,6 +552,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_IS_RS485_PRESENT, (), '', '?')
 
+    def is_rs485_present_async(self):
+        """
+        Asynchronous version of :func:`IsRs485Present`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsRs485Present` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_IS_RS485_PRESENT, (), '', '?')
+
     def set_rs485_address(self, address):
         """
         Sets the address (0-255) belonging to the RS485 Extension.
@@ -481,6 +583,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_RS485_ADDRESS, (), '', 'B')
 
+    def get_rs485_address_async(self):
+        """
+        Asynchronous version of :func:`GetRs485Address`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRs485Address` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_RS485_ADDRESS, (), '', 'B')
+
     def set_rs485_slave_address(self, num, address):
         """
         Sets up to 255 slave addresses. Valid addresses are in range 1-255. 0 has a
@@ -512,6 +622,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_RS485_SLAVE_ADDRESS, (num,), 'B', 'B')
 
+    def get_rs485_slave_address_async(self, num):
+        """
+        Asynchronous version of :func:`GetRs485SlaveAddress`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRs485SlaveAddress` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_RS485_SLAVE_ADDRESS, (num,), 'B', 'B')
+
     def get_rs485_error_log(self):
         """
         Returns CRC error counts of the RS485 communication.
@@ -523,6 +641,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_RS485_ERROR_LOG, (), '', 'H')
 
+    def get_rs485_error_log_async(self):
+        """
+        Asynchronous version of :func:`GetRs485ErrorLog`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRs485ErrorLog` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_RS485_ERROR_LOG, (), '', 'H')
+
     def set_rs485_configuration(self, speed, parity, stopbits):
         """
         Sets the configuration of the RS485 Extension. Speed is given in baud. The
@@ -550,6 +676,14 @@ class BrickMaster(Device):
         """
         return GetRS485Configuration(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_RS485_CONFIGURATION, (), '', 'I c B'))
 
+    def get_rs485_configuration_async(self):
+        """
+        Asynchronous version of :func:`GetRs485Configuration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRs485Configuration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_RS485_CONFIGURATION, (), '', 'I c B', GetRS485Configuration)
+
     def is_wifi_present(self):
         """
         Returns *true* if a WIFI Extension is available to be used by the Master.
@@ -558,6 +692,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_IS_WIFI_PRESENT, (), '', '?')
 
+    def is_wifi_present_async(self):
+        """
+        Asynchronous version of :func:`IsWifiPresent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsWifiPresent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_IS_WIFI_PRESENT, (), '', '?')
+
     def set_wifi_configuration(self, ssid, connection, ip, subnet_mask, gateway, port):
         """
         Sets the configuration of the WIFI Extension. The *ssid* can have a max length
@@ -600,6 +742,14 @@ class BrickMaster(Device):
         """
         return GetWifiConfiguration(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_CONFIGURATION, (), '', '32s B 4B 4B 4B H'))
 
+    def get_wifi_configuration_async(self):
+        """
+        Asynchronous version of :func:`GetWifiConfiguration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiConfiguration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_CONFIGURATION, (), '', '32s B 4B 4B 4B H', GetWifiConfiguration)
+
     def set_wifi_encryption(self, encryption, key, key_index, eap_options, ca_certificate_length, client_certificate_length, private_key_length):
         """
         Sets the encryption of the WIFI Extension. The first parameter is the
@@ -658,6 +808,14 @@ class BrickMaster(Device):
         """
         return GetWifiEncryption(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_ENCRYPTION, (), '', 'B 50s B B H H H'))
 
+    def get_wifi_encryption_async(self):
+        """
+        Asynchronous version of :func:`GetWifiEncryption`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiEncryption` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_ENCRYPTION, (), '', 'B 50s B B H H H', GetWifiEncryption)
+
     def get_wifi_status(self):
         """
         Returns the status of the WIFI Extension. The state is updated automatically,
@@ -680,6 +838,14 @@ class BrickMaster(Device):
         """
         return GetWifiStatus(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_STATUS, (), '', '6B 6B B h 4B 4B 4B I I B'))
 
+    def get_wifi_status_async(self):
+        """
+        Asynchronous version of :func:`GetWifiStatus`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiStatus` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_STATUS, (), '', '6B 6B B h 4B 4B 4B I I B', GetWifiStatus)
+
     def refresh_wifi_status(self):
         """
         Refreshes the WIFI status (see :func:`GetWifiStatus`). To read the status
@@ -726,6 +892,14 @@ class BrickMaster(Device):
         """
         return GetWifiCertificate(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_CERTIFICATE, (index,), 'H', '32B B'))
 
+    def get_wifi_certificate_async(self, index):
+        """
+        Asynchronous version of :func:`GetWifiCertificate`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiCertificate` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_CERTIFICATE, (index,), 'H', '32B B', GetWifiCertificate)
+
     def set_wifi_power_mode(self, mode):
         """
         Sets the power mode of the WIFI Extension. Possible modes are:
@@ -751,6 +925,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_POWER_MODE, (), '', 'B')
 
+    def get_wifi_power_mode_async(self):
+        """
+        Asynchronous version of :func:`GetWifiPowerMode`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiPowerMode` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_POWER_MODE, (), '', 'B')
+
     def get_wifi_buffer_info(self):
         """
         Returns informations about the WIFI receive buffer. The WIFI
@@ -772,6 +954,14 @@ class BrickMaster(Device):
         """
         return GetWifiBufferInfo(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_BUFFER_INFO, (), '', 'I H H'))
 
+    def get_wifi_buffer_info_async(self):
+        """
+        Asynchronous version of :func:`GetWifiBufferInfo`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiBufferInfo` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_BUFFER_INFO, (), '', 'I H H', GetWifiBufferInfo)
+
     def set_wifi_regulatory_domain(self, domain):
         """
         Sets the regulatory domain of the WIFI Extension. Possible domains are:
@@ -798,6 +988,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_REGULATORY_DOMAIN, (), '', 'B')
 
+    def get_wifi_regulatory_domain_async(self):
+        """
+        Asynchronous version of :func:`GetWifiRegulatoryDomain`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiRegulatoryDomain` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_REGULATORY_DOMAIN, (), '', 'B')
+
     def get_usb_voltage(self):
         """
         Returns the USB voltage in mV.
@@ -806,6 +1004,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE, (), '', 'H')
 
+    def get_usb_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetUsbVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetUsbVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE, (), '', 'H')
+
     def set_long_wifi_key(self, key):
         """
         Sets a long WIFI key (up to 63 chars, at least 8 chars) for WPA encryption.
@@ -828,6 +1034,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_LONG_WIFI_KEY, (), '', '64s')
 
+    def get_long_wifi_key_async(self):
+        """
+        Asynchronous version of :func:`GetLongWifiKey`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetLongWifiKey` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_LONG_WIFI_KEY, (), '', '64s')
+
     def set_wifi_hostname(self, hostname):
         """
         Sets the hostname of the WIFI Extension. The hostname will be displayed 
@@ -849,6 +1063,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_WIFI_HOSTNAME, (), '', '16s')
 
+    def get_wifi_hostname_async(self):
+        """
+        Asynchronous version of :func:`GetWifiHostname`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetWifiHostname` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_WIFI_HOSTNAME, (), '', '16s')
+
     def set_stack_current_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`StackCurrent` callback is triggered
@@ -871,6 +1093,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_stack_current_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetStackCurrentCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackCurrentCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD, (), '', 'I')
+
     def set_stack_voltage_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`StackVoltage` callback is triggered
@@ -893,6 +1123,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_stack_voltage_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetStackVoltageCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackVoltageCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_usb_voltage_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`USBVoltage` callback is triggered
@@ -915,6 +1153,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_usb_voltage_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetUsbVoltageCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetUsbVoltageCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_stack_current_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`StackCurrentReached` callback. 
@@ -945,6 +1191,14 @@ class BrickMaster(Device):
         """
         return GetStackCurrentCallbackThreshold(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_stack_current_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetStackCurrentCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackCurrentCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD, (), '', 'c H H', GetStackCurrentCallbackThreshold)
+
     def set_stack_voltage_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`StackStackVoltageReached` callback. 
@@ -975,6 +1229,14 @@ class BrickMaster(Device):
         """
         return GetStackVoltageCallbackThreshold(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_stack_voltage_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetStackVoltageCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackVoltageCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c H H', GetStackVoltageCallbackThreshold)
+
     def set_usb_voltage_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`USBVoltageReached` callback. 
@@ -1005,6 +1267,14 @@ class BrickMaster(Device):
         """
         return GetUSBVoltageCallbackThreshold(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_usb_voltage_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetUsbVoltageCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetUsbVoltageCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c H H', GetUSBVoltageCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -1031,6 +1301,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_protocol1_bricklet_name(self, port):
         """
         Returns the firmware and protocol version and the name of the Bricklet for a given port.
@@ -1041,6 +1319,14 @@ class BrickMaster(Device):
         """
         return GetProtocol1BrickletName(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s'))
 
+    def get_protocol1_bricklet_name_async(self, port):
+        """
+        Asynchronous version of :func:`GetProtocol1BrickletName`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetProtocol1BrickletName` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s', GetProtocol1BrickletName)
+
     def get_chip_temperature(self):
         """
         Returns the temperature in °C/10 as measured inside the microcontroller. The
@@ -1054,6 +1340,14 @@ class BrickMaster(Device):
         """
         return self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def reset(self):
         """
         Calling this function will reset the Brick. Calling this function
@@ -1081,6 +1375,14 @@ class BrickMaster(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickMaster.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickMaster.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
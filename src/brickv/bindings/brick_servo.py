@@ -69,6 +69,49 @@ class BrickServo(Device):
     FUNCTION_GET_IDENTITY = 255
 
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_ENABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_DISABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_ENABLED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_POSITION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_POSITION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_POSITION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_VELOCITY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ACCELERATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_ACCELERATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_OUTPUT_VOLTAGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_OUTPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_PULSE_WIDTH: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PULSE_WIDTH: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEGREE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_DEGREE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_PERIOD: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_SERVO_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_OVERALL_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_STACK_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_UNDER_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_POSITION_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_VELOCITY_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_PROTOCOL1_BRICKLET_NAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESET: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_UNDER_VOLTAGE: 'H',
+        CALLBACK_POSITION_REACHED: 'B h',
+        CALLBACK_VELOCITY_REACHED: 'B h',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -78,43 +121,6 @@ class BrickServo(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickServo.FUNCTION_ENABLE] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_DISABLE] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_IS_ENABLED] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_POSITION] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_POSITION] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_CURRENT_POSITION] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_VELOCITY] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_VELOCITY] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_CURRENT_VELOCITY] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_ACCELERATION] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_ACCELERATION] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_OUTPUT_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_OUTPUT_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_PULSE_WIDTH] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_PULSE_WIDTH] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_DEGREE] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_DEGREE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_PERIOD] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_PERIOD] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_SERVO_CURRENT] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_OVERALL_CURRENT] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_STACK_INPUT_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_SET_MINIMUM_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_MINIMUM_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.CALLBACK_UNDER_VOLTAGE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickServo.CALLBACK_POSITION_REACHED] = BrickServo.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickServo.CALLBACK_VELOCITY_REACHED] = BrickServo.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_GET_CHIP_TEMPERATURE] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickServo.FUNCTION_RESET] = BrickServo.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickServo.FUNCTION_GET_IDENTITY] = BrickServo.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickServo.CALLBACK_UNDER_VOLTAGE] = 'H'
-        self.callback_formats[BrickServo.CALLBACK_POSITION_REACHED] = 'B h'
-        self.callback_formats[BrickServo.CALLBACK_VELOCITY_REACHED] = 'B h'
-
     def enable(self, servo_num):
         """
         Enables a servo (0 to 6). If a servo is enabled, the configured position,
@@ -135,6 +141,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_IS_ENABLED, (servo_num,), 'B', '?')
 
+    def is_enabled_async(self, servo_num):
+        """
+        Asynchronous version of :func:`IsEnabled`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsEnabled` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_IS_ENABLED, (servo_num,), 'B', '?')
+
     def set_position(self, servo_num, position):
         """
         Sets the position in °/100 for the specified servo. 
@@ -154,6 +168,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_POSITION, (servo_num,), 'B', 'h')
 
+    def get_position_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetPosition`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPosition` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_POSITION, (servo_num,), 'B', 'h')
+
     def get_current_position(self, servo_num):
         """
         Returns the *current* position of the specified servo. This may not be the
@@ -162,6 +184,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_CURRENT_POSITION, (servo_num,), 'B', 'h')
 
+    def get_current_position_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetCurrentPosition`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentPosition` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_CURRENT_POSITION, (servo_num,), 'B', 'h')
+
     def set_velocity(self, servo_num, velocity):
         """
         Sets the maximum velocity of the specified servo in °/100s. The velocity
@@ -180,6 +210,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_VELOCITY, (servo_num,), 'B', 'H')
 
+    def get_velocity_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_VELOCITY, (servo_num,), 'B', 'H')
+
     def get_current_velocity(self, servo_num):
         """
         Returns the *current* velocity of the specified servo. This may not be the
@@ -188,6 +226,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_CURRENT_VELOCITY, (servo_num,), 'B', 'H')
 
+    def get_current_velocity_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetCurrentVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_CURRENT_VELOCITY, (servo_num,), 'B', 'H')
+
     def set_acceleration(self, servo_num, acceleration):
         """
         Sets the acceleration of the specified servo in °/100s².
@@ -206,6 +252,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_ACCELERATION, (servo_num,), 'B', 'H')
 
+    def get_acceleration_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetAcceleration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAcceleration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_ACCELERATION, (servo_num,), 'B', 'H')
+
     def set_output_voltage(self, voltage):
         """
         Sets the output voltages with which the servos are driven in mV.
@@ -227,6 +281,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_OUTPUT_VOLTAGE, (), '', 'H')
 
+    def get_output_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetOutputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetOutputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_OUTPUT_VOLTAGE, (), '', 'H')
+
     def set_pulse_width(self, servo_num, min, max):
         """
         Sets the minimum and maximum pulse width of the specified servo in µs.
@@ -256,6 +318,14 @@ class BrickServo(Device):
         """
         return GetPulseWidth(*self.ipcon.send_request(self, BrickServo.FUNCTION_GET_PULSE_WIDTH, (servo_num,), 'B', 'H H'))
 
+    def get_pulse_width_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetPulseWidth`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPulseWidth` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_PULSE_WIDTH, (servo_num,), 'B', 'H H', GetPulseWidth)
+
     def set_degree(self, servo_num, min, max):
         """
         Sets the minimum and maximum degree for the specified servo (by default
@@ -298,6 +368,14 @@ class BrickServo(Device):
         """
         return GetDegree(*self.ipcon.send_request(self, BrickServo.FUNCTION_GET_DEGREE, (servo_num,), 'B', 'h h'))
 
+    def get_degree_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetDegree`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDegree` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_DEGREE, (servo_num,), 'B', 'h h', GetDegree)
+
     def set_period(self, servo_num, period):
         """
         Sets the period of the specified servo in µs.
@@ -324,18 +402,42 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_PERIOD, (servo_num,), 'B', 'H')
 
+    def get_period_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_PERIOD, (servo_num,), 'B', 'H')
+
     def get_servo_current(self, servo_num):
         """
         Returns the current consumption of the specified servo in mA.
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_SERVO_CURRENT, (servo_num,), 'B', 'H')
 
+    def get_servo_current_async(self, servo_num):
+        """
+        Asynchronous version of :func:`GetServoCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetServoCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_SERVO_CURRENT, (servo_num,), 'B', 'H')
+
     def get_overall_current(self):
         """
         Returns the current consumption of all servos together in mA.
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_OVERALL_CURRENT, (), '', 'H')
 
+    def get_overall_current_async(self):
+        """
+        Asynchronous version of :func:`GetOverallCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetOverallCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_OVERALL_CURRENT, (), '', 'H')
+
     def get_stack_input_voltage(self):
         """
         Returns the stack input voltage in mV. The stack input voltage is the
@@ -344,6 +446,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_stack_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetStackInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
+
     def get_external_input_voltage(self):
         """
         Returns the external input voltage in mV. The external input voltage is
@@ -361,6 +471,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_external_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetExternalInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetExternalInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
+
     def set_minimum_voltage(self, voltage):
         """
         Sets the minimum voltage in mV, below which the :func:`UnderVoltage` callback
@@ -379,6 +497,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
 
+    def get_minimum_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetMinimumVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMinimumVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
+
     def get_protocol1_bricklet_name(self, port):
         """
         Returns the firmware and protocol version and the name of the Bricklet for a given port.
@@ -389,6 +515,14 @@ class BrickServo(Device):
         """
         return GetProtocol1BrickletName(*self.ipcon.send_request(self, BrickServo.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s'))
 
+    def get_protocol1_bricklet_name_async(self, port):
+        """
+        Asynchronous version of :func:`GetProtocol1BrickletName`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetProtocol1BrickletName` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s', GetProtocol1BrickletName)
+
     def get_chip_temperature(self):
         """
         Returns the temperature in °C/10 as measured inside the microcontroller. The
@@ -402,6 +536,14 @@ class BrickServo(Device):
         """
         return self.ipcon.send_request(self, BrickServo.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def reset(self):
         """
         Calling this function will reset the Brick. Calling this function
@@ -429,6 +571,14 @@ class BrickServo(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickServo.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickServo.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
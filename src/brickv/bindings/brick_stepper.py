@@ -92,6 +92,63 @@ class BrickStepper(Device):
     STATE_DIRECTION_CHANGE_TO_FORWARD = 5
     STATE_DIRECTION_CHANGE_TO_BACKWARD = 6
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_MAX_VELOCITY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MAX_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_VELOCITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_SPEED_RAMPING: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_SPEED_RAMPING: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_FULL_BRAKE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_SET_CURRENT_POSITION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CURRENT_POSITION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_TARGET_POSITION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_TARGET_POSITION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STEPS: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STEPS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_REMAINING_STEPS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STEP_MODE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STEP_MODE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_DRIVE_FORWARD: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_DRIVE_BACKWARD: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_STOP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STACK_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CURRENT_CONSUMPTION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MOTOR_CURRENT: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MOTOR_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_ENABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_DISABLE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_ENABLED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DECAY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_DECAY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_MINIMUM_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_UNDER_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_POSITION_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_SYNC_RECT: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_SYNC_RECT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_TIME_BASE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_TIME_BASE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ALL_DATA: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ALL_DATA_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ALL_DATA_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_ALL_DATA: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_NEW_STATE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_PROTOCOL1_BRICKLET_NAME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESET: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_UNDER_VOLTAGE: 'H',
+        CALLBACK_POSITION_REACHED: 'i',
+        CALLBACK_ALL_DATA: 'H i i H H H',
+        CALLBACK_NEW_STATE: 'B B',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -101,57 +158,6 @@ class BrickStepper(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickStepper.FUNCTION_SET_MAX_VELOCITY] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_MAX_VELOCITY] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_CURRENT_VELOCITY] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_SPEED_RAMPING] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_SPEED_RAMPING] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_FULL_BRAKE] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_SET_CURRENT_POSITION] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_CURRENT_POSITION] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_TARGET_POSITION] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_TARGET_POSITION] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_STEPS] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_STEPS] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_REMAINING_STEPS] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_STEP_MODE] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_STEP_MODE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_DRIVE_FORWARD] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_DRIVE_BACKWARD] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_STOP] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_STACK_INPUT_VOLTAGE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_CURRENT_CONSUMPTION] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_MOTOR_CURRENT] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_MOTOR_CURRENT] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_ENABLE] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_DISABLE] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_IS_ENABLED] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_DECAY] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_DECAY] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_MINIMUM_VOLTAGE] = BrickStepper.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_MINIMUM_VOLTAGE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.CALLBACK_UNDER_VOLTAGE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickStepper.CALLBACK_POSITION_REACHED] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickStepper.FUNCTION_SET_SYNC_RECT] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_IS_SYNC_RECT] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_TIME_BASE] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_TIME_BASE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_ALL_DATA] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_SET_ALL_DATA_PERIOD] = BrickStepper.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_ALL_DATA_PERIOD] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.CALLBACK_ALL_DATA] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickStepper.CALLBACK_NEW_STATE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_GET_CHIP_TEMPERATURE] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickStepper.FUNCTION_RESET] = BrickStepper.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickStepper.FUNCTION_GET_IDENTITY] = BrickStepper.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickStepper.CALLBACK_UNDER_VOLTAGE] = 'H'
-        self.callback_formats[BrickStepper.CALLBACK_POSITION_REACHED] = 'i'
-        self.callback_formats[BrickStepper.CALLBACK_ALL_DATA] = 'H i i H H H'
-        self.callback_formats[BrickStepper.CALLBACK_NEW_STATE] = 'B B'
-
     def set_max_velocity(self, velocity):
         """
         Sets the maximum velocity of the stepper motor in steps per second.
@@ -168,12 +174,28 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MAX_VELOCITY, (), '', 'H')
 
+    def get_max_velocity_async(self):
+        """
+        Asynchronous version of :func:`GetMaxVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMaxVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_MAX_VELOCITY, (), '', 'H')
+
     def get_current_velocity(self):
         """
         Returns the *current* velocity of the stepper motor in steps per second.
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_VELOCITY, (), '', 'H')
 
+    def get_current_velocity_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentVelocity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentVelocity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_CURRENT_VELOCITY, (), '', 'H')
+
     def set_speed_ramping(self, acceleration, deacceleration):
         """
         Sets the acceleration and deacceleration of the stepper motor. The values
@@ -198,6 +220,14 @@ class BrickStepper(Device):
         """
         return GetSpeedRamping(*self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SPEED_RAMPING, (), '', 'H H'))
 
+    def get_speed_ramping_async(self):
+        """
+        Asynchronous version of :func:`GetSpeedRamping`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetSpeedRamping` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_SPEED_RAMPING, (), '', 'H H', GetSpeedRamping)
+
     def full_brake(self):
         """
         Executes an active full brake. 
@@ -229,6 +259,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_POSITION, (), '', 'i')
 
+    def get_current_position_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentPosition`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentPosition` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_CURRENT_POSITION, (), '', 'i')
+
     def set_target_position(self, position):
         """
         Sets the target position of the stepper motor in steps. For example,
@@ -249,6 +287,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_TARGET_POSITION, (), '', 'i')
 
+    def get_target_position_async(self):
+        """
+        Asynchronous version of :func:`GetTargetPosition`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetTargetPosition` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_TARGET_POSITION, (), '', 'i')
+
     def set_steps(self, steps):
         """
         Sets the number of steps the stepper motor should run. Positive values
@@ -264,6 +310,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STEPS, (), '', 'i')
 
+    def get_steps_async(self):
+        """
+        Asynchronous version of :func:`GetSteps`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetSteps` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_STEPS, (), '', 'i')
+
     def get_remaining_steps(self):
         """
         Returns the remaining steps of the last call of :func:`SetSteps`.
@@ -273,6 +327,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_REMAINING_STEPS, (), '', 'i')
 
+    def get_remaining_steps_async(self):
+        """
+        Asynchronous version of :func:`GetRemainingSteps`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRemainingSteps` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_REMAINING_STEPS, (), '', 'i')
+
     def set_step_mode(self, mode):
         """
         Sets the step mode of the stepper motor. Possible values are:
@@ -295,6 +357,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STEP_MODE, (), '', 'B')
 
+    def get_step_mode_async(self):
+        """
+        Asynchronous version of :func:`GetStepMode`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStepMode` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_STEP_MODE, (), '', 'B')
+
     def drive_forward(self):
         """
         Drives the stepper motor forward until :func:`DriveBackward` or
@@ -326,6 +396,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_stack_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetStackInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStackInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 'H')
+
     def get_external_input_voltage(self):
         """
         Returns the external input voltage in mV. The external input voltage is
@@ -343,12 +421,28 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
 
+    def get_external_input_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetExternalInputVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetExternalInputVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 'H')
+
     def get_current_consumption(self):
         """
         Returns the current consumption of the motor in mA.
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_CONSUMPTION, (), '', 'H')
 
+    def get_current_consumption_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentConsumption`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentConsumption` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_CURRENT_CONSUMPTION, (), '', 'H')
+
     def set_motor_current(self, current):
         """
         Sets the current in mA with which the motor will be driven.
@@ -367,6 +461,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MOTOR_CURRENT, (), '', 'H')
 
+    def get_motor_current_async(self):
+        """
+        Asynchronous version of :func:`GetMotorCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMotorCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_MOTOR_CURRENT, (), '', 'H')
+
     def enable(self):
         """
         Enables the driver chip. The driver parameters can be configured (maximum velocity,
@@ -387,6 +489,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_IS_ENABLED, (), '', '?')
 
+    def is_enabled_async(self):
+        """
+        Asynchronous version of :func:`IsEnabled`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsEnabled` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_IS_ENABLED, (), '', '?')
+
     def set_decay(self, decay):
         """
         Sets the decay mode of the stepper motor. The possible value range is
@@ -425,6 +535,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_DECAY, (), '', 'H')
 
+    def get_decay_async(self):
+        """
+        Asynchronous version of :func:`GetDecay`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDecay` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_DECAY, (), '', 'H')
+
     def set_minimum_voltage(self, voltage):
         """
         Sets the minimum voltage in mV, below which the :func:`UnderVoltage` callback
@@ -443,6 +561,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
 
+    def get_minimum_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetMinimumVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMinimumVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 'H')
+
     def set_sync_rect(self, sync_rect):
         """
         Turns synchronous rectification on or off (*true* or *false*).
@@ -474,6 +600,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_IS_SYNC_RECT, (), '', '?')
 
+    def is_sync_rect_async(self):
+        """
+        Asynchronous version of :func:`IsSyncRect`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsSyncRect` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_IS_SYNC_RECT, (), '', '?')
+
     def set_time_base(self, time_base):
         """
         Sets the time base of the velocity and the acceleration of the stepper brick
@@ -497,6 +631,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_TIME_BASE, (), '', 'I')
 
+    def get_time_base_async(self):
+        """
+        Asynchronous version of :func:`GetTimeBase`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetTimeBase` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_TIME_BASE, (), '', 'I')
+
     def get_all_data(self):
         """
         Returns the following parameters: The current velocity,
@@ -509,6 +651,14 @@ class BrickStepper(Device):
         """
         return GetAllData(*self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_ALL_DATA, (), '', 'H i i H H H'))
 
+    def get_all_data_async(self):
+        """
+        Asynchronous version of :func:`GetAllData`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAllData` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_ALL_DATA, (), '', 'H i i H H H', GetAllData)
+
     def set_all_data_period(self, period):
         """
         Sets the period in ms with which the :func:`AllData` callback is triggered
@@ -526,6 +676,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 'I')
 
+    def get_all_data_period_async(self):
+        """
+        Asynchronous version of :func:`GetAllDataPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAllDataPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 'I')
+
     def get_protocol1_bricklet_name(self, port):
         """
         Returns the firmware and protocol version and the name of the Bricklet for a given port.
@@ -536,6 +694,14 @@ class BrickStepper(Device):
         """
         return GetProtocol1BrickletName(*self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s'))
 
+    def get_protocol1_bricklet_name_async(self, port):
+        """
+        Asynchronous version of :func:`GetProtocol1BrickletName`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetProtocol1BrickletName` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), 'c', 'B 3B 40s', GetProtocol1BrickletName)
+
     def get_chip_temperature(self):
         """
         Returns the temperature in °C/10 as measured inside the microcontroller. The
@@ -549,6 +715,14 @@ class BrickStepper(Device):
         """
         return self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def reset(self):
         """
         Calling this function will reset the Brick. Calling this function
@@ -576,6 +750,14 @@ class BrickStepper(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickStepper.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -58,6 +58,35 @@ class BrickletAmbientLight(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_ILLUMINANCE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ILLUMINANCE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_ILLUMINANCE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ILLUMINANCE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_ILLUMINANCE: 'H',
+        CALLBACK_ANALOG_VALUE: 'H',
+        CALLBACK_ILLUMINANCE_REACHED: 'H',
+        CALLBACK_ANALOG_VALUE_REACHED: 'H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -67,29 +96,6 @@ class BrickletAmbientLight(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_SET_ILLUMINANCE_CALLBACK_THRESHOLD] = BrickletAmbientLight.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletAmbientLight.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAmbientLight.CALLBACK_ILLUMINANCE] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAmbientLight.CALLBACK_ANALOG_VALUE] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAmbientLight.CALLBACK_ILLUMINANCE_REACHED] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAmbientLight.CALLBACK_ANALOG_VALUE_REACHED] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAmbientLight.FUNCTION_GET_IDENTITY] = BrickletAmbientLight.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletAmbientLight.CALLBACK_ILLUMINANCE] = 'H'
-        self.callback_formats[BrickletAmbientLight.CALLBACK_ANALOG_VALUE] = 'H'
-        self.callback_formats[BrickletAmbientLight.CALLBACK_ILLUMINANCE_REACHED] = 'H'
-        self.callback_formats[BrickletAmbientLight.CALLBACK_ANALOG_VALUE_REACHED] = 'H'
-
     def get_illuminance(self):
         """
         Returns the illuminance of the ambient light sensor. The value
@@ -102,6 +108,14 @@ class BrickletAmbientLight(Device):
         """
         return self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE, (), '', 'H')
 
+    def get_illuminance_async(self):
+        """
+        Asynchronous version of :func:`GetIlluminance`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIlluminance` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE, (), '', 'H')
+
     def get_analog_value(self):
         """
         Returns the value as read by a 12-bit analog-to-digital converter.
@@ -123,6 +137,14 @@ class BrickletAmbientLight(Device):
         """
         return self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
 
+    def get_analog_value_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
+
     def set_illuminance_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Illuminance` callback is triggered
@@ -141,6 +163,14 @@ class BrickletAmbientLight(Device):
         """
         return self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_illuminance_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetIlluminanceCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIlluminanceCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_analog_value_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AnalogValue` callback is triggered
@@ -159,6 +189,14 @@ class BrickletAmbientLight(Device):
         """
         return self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_analog_value_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_illuminance_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`IlluminanceReached` callback. 
@@ -185,6 +223,14 @@ class BrickletAmbientLight(Device):
         """
         return GetIlluminanceCallbackThreshold(*self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_illuminance_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetIlluminanceCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIlluminanceCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD, (), '', 'c h h', GetIlluminanceCallbackThreshold)
+
     def set_analog_value_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AnalogValueReached` callback. 
@@ -211,6 +257,14 @@ class BrickletAmbientLight(Device):
         """
         return GetAnalogValueCallbackThreshold(*self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_analog_value_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H', GetAnalogValueCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -233,6 +287,14 @@ class BrickletAmbientLight(Device):
         """
         return self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -247,6 +309,14 @@ class BrickletAmbientLight(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAmbientLight.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -65,6 +65,37 @@ class BrickletAnalogIn(Device):
     RANGE_UP_TO_36V = 3
     RANGE_UP_TO_45V = 3
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_VOLTAGE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_RANGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_RANGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_VOLTAGE: 'H',
+        CALLBACK_ANALOG_VALUE: 'H',
+        CALLBACK_VOLTAGE_REACHED: 'H',
+        CALLBACK_ANALOG_VALUE_REACHED: 'H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -74,31 +105,6 @@ class BrickletAnalogIn(Device):
 
         self.api_version = (2, 0, 1)
 
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_VOLTAGE] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD] = BrickletAnalogIn.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletAnalogIn.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.CALLBACK_VOLTAGE] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAnalogIn.CALLBACK_ANALOG_VALUE] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAnalogIn.CALLBACK_VOLTAGE_REACHED] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAnalogIn.CALLBACK_ANALOG_VALUE_REACHED] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletAnalogIn.FUNCTION_SET_RANGE] = BrickletAnalogIn.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_RANGE] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogIn.FUNCTION_GET_IDENTITY] = BrickletAnalogIn.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletAnalogIn.CALLBACK_VOLTAGE] = 'H'
-        self.callback_formats[BrickletAnalogIn.CALLBACK_ANALOG_VALUE] = 'H'
-        self.callback_formats[BrickletAnalogIn.CALLBACK_VOLTAGE_REACHED] = 'H'
-        self.callback_formats[BrickletAnalogIn.CALLBACK_ANALOG_VALUE_REACHED] = 'H'
-
     def get_voltage(self):
         """
         Returns the voltage of the sensor. The value is in mV and
@@ -111,6 +117,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE, (), '', 'H')
 
+    def get_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE, (), '', 'H')
+
     def get_analog_value(self):
         """
         Returns the value as read by a 12-bit analog-to-digital converter.
@@ -128,6 +142,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
 
+    def get_analog_value_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
+
     def set_voltage_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Voltage` callback is triggered
@@ -146,6 +168,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_voltage_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetVoltageCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltageCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_analog_value_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AnalogValue` callback is triggered
@@ -164,6 +194,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_analog_value_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_voltage_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`VoltageReached` callback. 
@@ -190,6 +228,14 @@ class BrickletAnalogIn(Device):
         """
         return GetVoltageCallbackThreshold(*self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_voltage_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetVoltageCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltageCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c h h', GetVoltageCallbackThreshold)
+
     def set_analog_value_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AnalogValueReached` callback. 
@@ -216,6 +262,14 @@ class BrickletAnalogIn(Device):
         """
         return GetAnalogValueCallbackThreshold(*self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_analog_value_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H', GetAnalogValueCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -238,6 +292,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def set_range(self, range):
         """
         Sets the measurement range. Possible ranges:
@@ -262,6 +324,14 @@ class BrickletAnalogIn(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_RANGE, (), '', 'B')
 
+    def get_range_async(self):
+        """
+        Asynchronous version of :func:`GetRange`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetRange` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_RANGE, (), '', 'B')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -276,6 +346,14 @@ class BrickletAnalogIn(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletAnalogIn.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogIn.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
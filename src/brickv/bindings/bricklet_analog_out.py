@@ -43,6 +43,18 @@ class BrickletAnalogOut(Device):
     MODE_100K_TO_GROUND = 2
     MODE_500K_TO_GROUND = 3
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_VOLTAGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MODE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MODE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {}
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -52,13 +64,6 @@ class BrickletAnalogOut(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletAnalogOut.FUNCTION_SET_VOLTAGE] = BrickletAnalogOut.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletAnalogOut.FUNCTION_GET_VOLTAGE] = BrickletAnalogOut.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogOut.FUNCTION_SET_MODE] = BrickletAnalogOut.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletAnalogOut.FUNCTION_GET_MODE] = BrickletAnalogOut.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletAnalogOut.FUNCTION_GET_IDENTITY] = BrickletAnalogOut.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-
     def set_voltage(self, voltage):
         """
         Sets the voltage in mV. The possible range is 0V to 5V (0-5000).
@@ -74,6 +79,14 @@ class BrickletAnalogOut(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_VOLTAGE, (), '', 'H')
 
+    def get_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogOut.FUNCTION_GET_VOLTAGE, (), '', 'H')
+
     def set_mode(self, mode):
         """
         Sets the mode of the analog value. Possible modes:
@@ -96,6 +109,14 @@ class BrickletAnalogOut(Device):
         """
         return self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_MODE, (), '', 'B')
 
+    def get_mode_async(self):
+        """
+        Asynchronous version of :func:`GetMode`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMode` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogOut.FUNCTION_GET_MODE, (), '', 'B')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -110,4 +131,12 @@ class BrickletAnalogOut(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletAnalogOut.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
 AnalogOut = BrickletAnalogOut # for backward compatibility
@@ -61,6 +61,38 @@ class BrickletBarometer(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_AIR_PRESSURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ALTITUDE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_REFERENCE_AIR_PRESSURE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CHIP_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_AIR_PRESSURE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ALTITUDE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_AIR_PRESSURE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ALTITUDE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_REFERENCE_AIR_PRESSURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_AIR_PRESSURE: 'i',
+        CALLBACK_ALTITUDE: 'i',
+        CALLBACK_AIR_PRESSURE_REACHED: 'i',
+        CALLBACK_ALTITUDE_REACHED: 'i',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -70,32 +102,6 @@ class BrickletBarometer(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletBarometer.FUNCTION_GET_AIR_PRESSURE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_ALTITUDE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD] = BrickletBarometer.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD] = BrickletBarometer.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_SET_REFERENCE_AIR_PRESSURE] = BrickletBarometer.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_CHIP_TEMPERATURE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.CALLBACK_AIR_PRESSURE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletBarometer.CALLBACK_ALTITUDE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletBarometer.CALLBACK_AIR_PRESSURE_REACHED] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletBarometer.CALLBACK_ALTITUDE_REACHED] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_REFERENCE_AIR_PRESSURE] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletBarometer.FUNCTION_GET_IDENTITY] = BrickletBarometer.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletBarometer.CALLBACK_AIR_PRESSURE] = 'i'
-        self.callback_formats[BrickletBarometer.CALLBACK_ALTITUDE] = 'i'
-        self.callback_formats[BrickletBarometer.CALLBACK_AIR_PRESSURE_REACHED] = 'i'
-        self.callback_formats[BrickletBarometer.CALLBACK_ALTITUDE_REACHED] = 'i'
-
     def get_air_pressure(self):
         """
         Returns the air pressure of the air pressure sensor. The value
@@ -108,6 +114,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE, (), '', 'i')
 
+    def get_air_pressure_async(self):
+        """
+        Asynchronous version of :func:`GetAirPressure`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAirPressure` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE, (), '', 'i')
+
     def get_altitude(self):
         """
         Returns the relative altitude of the air pressure sensor. The value is given in
@@ -120,6 +134,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE, (), '', 'i')
 
+    def get_altitude_async(self):
+        """
+        Asynchronous version of :func:`GetAltitude`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAltitude` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_ALTITUDE, (), '', 'i')
+
     def set_air_pressure_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AirPressure` callback is triggered
@@ -138,6 +160,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_air_pressure_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAirPressureCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAirPressureCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_altitude_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Altitude` callback is triggered
@@ -156,6 +186,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_altitude_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAltitudeCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAltitudeCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_air_pressure_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AirPressureReached` callback.
@@ -182,6 +220,14 @@ class BrickletBarometer(Device):
         """
         return GetAirPressureCallbackThreshold(*self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD, (), '', 'c i i'))
 
+    def get_air_pressure_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAirPressureCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAirPressureCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD, (), '', 'c i i', GetAirPressureCallbackThreshold)
+
     def set_altitude_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AltitudeReached` callback.
@@ -208,6 +254,14 @@ class BrickletBarometer(Device):
         """
         return GetAltitudeCallbackThreshold(*self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD, (), '', 'c i i'))
 
+    def get_altitude_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAltitudeCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAltitudeCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD, (), '', 'c i i', GetAltitudeCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -230,6 +284,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def set_reference_air_pressure(self, air_pressure):
         """
         Sets the reference air pressure in mbar/1000 for the altitude calculation.
@@ -260,6 +322,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
 
+    def get_chip_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetChipTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetChipTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 'h')
+
     def get_reference_air_pressure(self):
         """
         Returns the reference air pressure as set by :func:`SetReferenceAirPressure`.
@@ -268,6 +338,14 @@ class BrickletBarometer(Device):
         """
         return self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_REFERENCE_AIR_PRESSURE, (), '', 'i')
 
+    def get_reference_air_pressure_async(self):
+        """
+        Asynchronous version of :func:`GetReferenceAirPressure`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetReferenceAirPressure` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_REFERENCE_AIR_PRESSURE, (), '', 'i')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -282,6 +360,14 @@ class BrickletBarometer(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletBarometer.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
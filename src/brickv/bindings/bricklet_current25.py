@@ -61,6 +61,39 @@ class BrickletCurrent25(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_CALIBRATE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_OVER_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_CURRENT_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_OVER_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_CURRENT: 'h',
+        CALLBACK_ANALOG_VALUE: 'H',
+        CALLBACK_CURRENT_REACHED: 'h',
+        CALLBACK_ANALOG_VALUE_REACHED: 'H',
+        CALLBACK_OVER_CURRENT: '',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -70,33 +103,6 @@ class BrickletCurrent25(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_CURRENT] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_CALIBRATE] = BrickletCurrent25.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletCurrent25.FUNCTION_IS_OVER_CURRENT] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_SET_CURRENT_CALLBACK_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD] = BrickletCurrent25.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletCurrent25.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletCurrent25.CALLBACK_CURRENT] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletCurrent25.CALLBACK_ANALOG_VALUE] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletCurrent25.CALLBACK_CURRENT_REACHED] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletCurrent25.CALLBACK_ANALOG_VALUE_REACHED] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletCurrent25.CALLBACK_OVER_CURRENT] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletCurrent25.FUNCTION_GET_IDENTITY] = BrickletCurrent25.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletCurrent25.CALLBACK_CURRENT] = 'h'
-        self.callback_formats[BrickletCurrent25.CALLBACK_ANALOG_VALUE] = 'H'
-        self.callback_formats[BrickletCurrent25.CALLBACK_CURRENT_REACHED] = 'h'
-        self.callback_formats[BrickletCurrent25.CALLBACK_ANALOG_VALUE_REACHED] = 'H'
-        self.callback_formats[BrickletCurrent25.CALLBACK_OVER_CURRENT] = ''
-
     def get_current(self):
         """
         Returns the current of the sensor. The value is in mA
@@ -108,6 +114,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT, (), '', 'h')
 
+    def get_current_async(self):
+        """
+        Asynchronous version of :func:`GetCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_CURRENT, (), '', 'h')
+
     def calibrate(self):
         """
         Calibrates the 0 value of the sensor. You have to call this function
@@ -133,6 +147,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_IS_OVER_CURRENT, (), '', '?')
 
+    def is_over_current_async(self):
+        """
+        Asynchronous version of :func:`IsOverCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsOverCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_IS_OVER_CURRENT, (), '', '?')
+
     def get_analog_value(self):
         """
         Returns the value as read by a 12-bit analog-to-digital converter.
@@ -150,6 +172,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
 
+    def get_analog_value_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
+
     def set_current_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Current` callback is triggered
@@ -168,6 +198,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_current_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 'I')
+
     def set_analog_value_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AnalogValue` callback is triggered
@@ -186,6 +224,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_analog_value_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_current_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`CurrentReached` callback. 
@@ -212,6 +258,14 @@ class BrickletCurrent25(Device):
         """
         return GetCurrentCallbackThreshold(*self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_current_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 'c h h', GetCurrentCallbackThreshold)
+
     def set_analog_value_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AnalogValueReached` callback. 
@@ -238,6 +292,14 @@ class BrickletCurrent25(Device):
         """
         return GetAnalogValueCallbackThreshold(*self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_analog_value_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H', GetAnalogValueCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -260,6 +322,14 @@ class BrickletCurrent25(Device):
         """
         return self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -274,6 +344,14 @@ class BrickletCurrent25(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletCurrent25.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
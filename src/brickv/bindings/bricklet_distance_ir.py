@@ -60,6 +60,37 @@ class BrickletDistanceIR(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_DISTANCE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_SAMPLING_POINT: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_SAMPLING_POINT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DISTANCE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DISTANCE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_DISTANCE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_DISTANCE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ANALOG_VALUE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_DISTANCE: 'H',
+        CALLBACK_ANALOG_VALUE: 'H',
+        CALLBACK_DISTANCE_REACHED: 'H',
+        CALLBACK_ANALOG_VALUE_REACHED: 'H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -69,31 +100,6 @@ class BrickletDistanceIR(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_DISTANCE] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_SAMPLING_POINT] = BrickletDistanceIR.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_SAMPLING_POINT] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_DISTANCE_CALLBACK_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD] = BrickletDistanceIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletDistanceIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDistanceIR.CALLBACK_DISTANCE] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletDistanceIR.CALLBACK_ANALOG_VALUE] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletDistanceIR.CALLBACK_DISTANCE_REACHED] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletDistanceIR.CALLBACK_ANALOG_VALUE_REACHED] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletDistanceIR.FUNCTION_GET_IDENTITY] = BrickletDistanceIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletDistanceIR.CALLBACK_DISTANCE] = 'H'
-        self.callback_formats[BrickletDistanceIR.CALLBACK_ANALOG_VALUE] = 'H'
-        self.callback_formats[BrickletDistanceIR.CALLBACK_DISTANCE_REACHED] = 'H'
-        self.callback_formats[BrickletDistanceIR.CALLBACK_ANALOG_VALUE_REACHED] = 'H'
-
     def get_distance(self):
         """
         Returns the distance measured by the sensor. The value is in mm and possible
@@ -106,6 +112,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE, (), '', 'H')
 
+    def get_distance_async(self):
+        """
+        Asynchronous version of :func:`GetDistance`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDistance` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE, (), '', 'H')
+
     def get_analog_value(self):
         """
         Returns the value as read by a 12-bit analog-to-digital converter.
@@ -123,6 +137,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
 
+    def get_analog_value_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE, (), '', 'H')
+
     def set_sampling_point(self, position, distance):
         """
         Sets a sampling point value to a specific position of the lookup table.
@@ -153,6 +175,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_SAMPLING_POINT, (position,), 'B', 'H')
 
+    def get_sampling_point_async(self, position):
+        """
+        Asynchronous version of :func:`GetSamplingPoint`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetSamplingPoint` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_SAMPLING_POINT, (position,), 'B', 'H')
+
     def set_distance_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Distance` callback is triggered
@@ -171,6 +201,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_distance_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetDistanceCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDistanceCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_analog_value_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AnalogValue` callback is triggered
@@ -189,6 +227,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_analog_value_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_distance_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`DistanceReached` callback. 
@@ -215,6 +261,14 @@ class BrickletDistanceIR(Device):
         """
         return GetDistanceCallbackThreshold(*self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_distance_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetDistanceCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDistanceCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD, (), '', 'c h h', GetDistanceCallbackThreshold)
+
     def set_analog_value_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AnalogValueReached` callback. 
@@ -241,6 +295,14 @@ class BrickletDistanceIR(Device):
         """
         return GetAnalogValueCallbackThreshold(*self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H'))
 
+    def get_analog_value_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAnalogValueCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAnalogValueCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 'c H H', GetAnalogValueCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -263,6 +325,14 @@ class BrickletDistanceIR(Device):
         """
         return self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -277,6 +347,14 @@ class BrickletDistanceIR(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDistanceIR.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
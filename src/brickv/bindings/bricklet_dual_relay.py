@@ -43,6 +43,22 @@ class BrickletDualRelay(Device):
     FUNCTION_GET_IDENTITY = 255
 
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_STATE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STATE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MONOFLOP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MONOFLOP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_MONOFLOP_DONE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_SELECTED_STATE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_MONOFLOP_DONE: 'B ?',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -52,16 +68,6 @@ class BrickletDualRelay(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletDualRelay.FUNCTION_SET_STATE] = BrickletDualRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletDualRelay.FUNCTION_GET_STATE] = BrickletDualRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDualRelay.FUNCTION_SET_MONOFLOP] = BrickletDualRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletDualRelay.FUNCTION_GET_MONOFLOP] = BrickletDualRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletDualRelay.CALLBACK_MONOFLOP_DONE] = BrickletDualRelay.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletDualRelay.FUNCTION_SET_SELECTED_STATE] = BrickletDualRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletDualRelay.FUNCTION_GET_IDENTITY] = BrickletDualRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletDualRelay.CALLBACK_MONOFLOP_DONE] = 'B ?'
-
     def set_state(self, relay1, relay2):
         """
         Sets the state of the relays, *true* means on and *false* means off. 
@@ -83,6 +89,14 @@ class BrickletDualRelay(Device):
         """
         return GetState(*self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_STATE, (), '', '? ?'))
 
+    def get_state_async(self):
+        """
+        Asynchronous version of :func:`GetState`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetState` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDualRelay.FUNCTION_GET_STATE, (), '', '? ?', GetState)
+
     def set_monoflop(self, relay, state, time):
         """
         The first parameter can be 1 or 2 (relay 1 or relay 2). The second parameter 
@@ -115,6 +129,14 @@ class BrickletDualRelay(Device):
         """
         return GetMonoflop(*self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_MONOFLOP, (relay,), 'B', '? I I'))
 
+    def get_monoflop_async(self, relay):
+        """
+        Asynchronous version of :func:`GetMonoflop`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMonoflop` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDualRelay.FUNCTION_GET_MONOFLOP, (relay,), 'B', '? I I', GetMonoflop)
+
     def set_selected_state(self, relay, state):
         """
         Sets the state of the selected relay (1 or 2), *true* means on and *false* means off. 
@@ -139,6 +161,14 @@ class BrickletDualRelay(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletDualRelay.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -68,6 +68,41 @@ class BrickletGPS(Device):
     RESTART_TYPE_COLD_START = 2
     RESTART_TYPE_FACTORY_RESET = 3
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_COORDINATES: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_STATUS: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_ALTITUDE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_MOTION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_DATE_TIME: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_RESTART: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_SET_COORDINATES_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_COORDINATES_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STATUS_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_STATUS_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MOTION_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_MOTION_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_COORDINATES: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_STATUS: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_ALTITUDE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_MOTION: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_DATE_TIME: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_COORDINATES: 'I c I c H H H H',
+        CALLBACK_STATUS: 'B B B',
+        CALLBACK_ALTITUDE: 'I I',
+        CALLBACK_MOTION: 'I I',
+        CALLBACK_DATE_TIME: 'I I',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -77,35 +112,6 @@ class BrickletGPS(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletGPS.FUNCTION_GET_COORDINATES] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_STATUS] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_ALTITUDE] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_MOTION] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_DATE_TIME] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_RESTART] = BrickletGPS.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletGPS.FUNCTION_SET_COORDINATES_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_COORDINATES_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_SET_STATUS_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_STATUS_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_SET_MOTION_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletGPS.FUNCTION_GET_MOTION_CALLBACK_PERIOD] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletGPS.CALLBACK_COORDINATES] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletGPS.CALLBACK_STATUS] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletGPS.CALLBACK_ALTITUDE] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletGPS.CALLBACK_MOTION] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletGPS.CALLBACK_DATE_TIME] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletGPS.FUNCTION_GET_IDENTITY] = BrickletGPS.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletGPS.CALLBACK_COORDINATES] = 'I c I c H H H H'
-        self.callback_formats[BrickletGPS.CALLBACK_STATUS] = 'B B B'
-        self.callback_formats[BrickletGPS.CALLBACK_ALTITUDE] = 'I I'
-        self.callback_formats[BrickletGPS.CALLBACK_MOTION] = 'I I'
-        self.callback_formats[BrickletGPS.CALLBACK_DATE_TIME] = 'I I'
-
     def get_coordinates(self):
         """
         Returns the GPS coordinates. Latitude and longitude are given in the
@@ -129,6 +135,14 @@ class BrickletGPS(Device):
         """
         return GetCoordinates(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_COORDINATES, (), '', 'I c I c H H H H'))
 
+    def get_coordinates_async(self):
+        """
+        Asynchronous version of :func:`GetCoordinates`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCoordinates` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_COORDINATES, (), '', 'I c I c H H H H', GetCoordinates)
+
     def get_status(self):
         """
         Returns the current fix status, the number of satellites that are in view and
@@ -146,6 +160,14 @@ class BrickletGPS(Device):
         """
         return GetStatus(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_STATUS, (), '', 'B B B'))
 
+    def get_status_async(self):
+        """
+        Asynchronous version of :func:`GetStatus`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStatus` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_STATUS, (), '', 'B B B', GetStatus)
+
     def get_altitude(self):
         """
         Returns the current altitude and corresponding geoidal separation.
@@ -157,6 +179,14 @@ class BrickletGPS(Device):
         """
         return GetAltitude(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_ALTITUDE, (), '', 'I I'))
 
+    def get_altitude_async(self):
+        """
+        Asynchronous version of :func:`GetAltitude`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAltitude` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_ALTITUDE, (), '', 'I I', GetAltitude)
+
     def get_motion(self):
         """
         Returns the current course and speed. Course is given in hundredths degree
@@ -171,6 +201,14 @@ class BrickletGPS(Device):
         """
         return GetMotion(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_MOTION, (), '', 'I I'))
 
+    def get_motion_async(self):
+        """
+        Asynchronous version of :func:`GetMotion`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMotion` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_MOTION, (), '', 'I I', GetMotion)
+
     def get_date_time(self):
         """
         Returns the current date and time. The date is
@@ -180,6 +218,14 @@ class BrickletGPS(Device):
         """
         return GetDateTime(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_DATE_TIME, (), '', 'I I'))
 
+    def get_date_time_async(self):
+        """
+        Asynchronous version of :func:`GetDateTime`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDateTime` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_DATE_TIME, (), '', 'I I', GetDateTime)
+
     def restart(self, restart_type):
         """
         Restarts the GPS Bricklet, the following restart types are available:
@@ -213,6 +259,14 @@ class BrickletGPS(Device):
         """
         return self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_COORDINATES_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_coordinates_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetCoordinatesCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCoordinatesCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_COORDINATES_CALLBACK_PERIOD, (), '', 'I')
+
     def set_status_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Status` callback is triggered
@@ -231,6 +285,14 @@ class BrickletGPS(Device):
         """
         return self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_STATUS_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_status_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetStatusCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetStatusCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_STATUS_CALLBACK_PERIOD, (), '', 'I')
+
     def set_altitude_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Altitude` callback is triggered
@@ -249,6 +311,14 @@ class BrickletGPS(Device):
         """
         return self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_altitude_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAltitudeCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAltitudeCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_date_time_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`DateTime` callback is triggered
@@ -267,6 +337,14 @@ class BrickletGPS(Device):
         """
         return self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_date_time_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetDateTimeCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDateTimeCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD, (), '', 'I')
+
     def set_motion_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Motion` callback is triggered
@@ -285,6 +363,14 @@ class BrickletGPS(Device):
         """
         return self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_MOTION_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_motion_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetMotionCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMotionCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_MOTION_CALLBACK_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -299,6 +385,14 @@ class BrickletGPS(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletGPS.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
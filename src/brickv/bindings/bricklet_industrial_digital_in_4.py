@@ -44,6 +44,25 @@ class BrickletIndustrialDigitalIn4(Device):
     FUNCTION_GET_IDENTITY = 255
 
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_GROUP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_GROUP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_AVAILABLE_FOR_GROUP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_INTERRUPT: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_INTERRUPT: 'H H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -53,19 +72,6 @@ class BrickletIndustrialDigitalIn4(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_VALUE] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_SET_GROUP] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_GROUP] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_AVAILABLE_FOR_GROUP] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_SET_INTERRUPT] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_INTERRUPT] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialDigitalIn4.CALLBACK_INTERRUPT] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIndustrialDigitalIn4.FUNCTION_GET_IDENTITY] = BrickletIndustrialDigitalIn4.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletIndustrialDigitalIn4.CALLBACK_INTERRUPT] = 'H H'
-
     def get_value(self):
         """
         Returns the input value with a bitmask. The bitmask
@@ -84,6 +90,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_VALUE, (), '', 'H')
 
+    def get_value_async(self):
+        """
+        Asynchronous version of :func:`GetValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_VALUE, (), '', 'H')
+
     def set_group(self, group):
         """
         Sets a group of Digital In 4 Bricklets that should work together. You can
@@ -110,6 +124,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_GROUP, (), '', '4c')
 
+    def get_group_async(self):
+        """
+        Asynchronous version of :func:`GetGroup`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetGroup` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_GROUP, (), '', '4c')
+
     def get_available_for_group(self):
         """
         Returns a bitmask of ports that are available for grouping. For example the
@@ -118,6 +140,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 'B')
 
+    def get_available_for_group_async(self):
+        """
+        Asynchronous version of :func:`GetAvailableForGroup`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAvailableForGroup` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 'B')
+
     def set_debounce_period(self, debounce):
         """
         Sets the debounce period of the :func:`Interrupt` callback in ms.
@@ -136,6 +166,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def set_interrupt(self, interrupt_mask):
         """
         Sets the pins on which an interrupt is activated with a bitmask.
@@ -157,6 +195,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_INTERRUPT, (), '', 'H')
 
+    def get_interrupt_async(self):
+        """
+        Asynchronous version of :func:`GetInterrupt`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetInterrupt` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_INTERRUPT, (), '', 'H')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -171,6 +217,14 @@ class BrickletIndustrialDigitalIn4(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -45,6 +45,25 @@ class BrickletIndustrialQuadRelay(Device):
     FUNCTION_GET_IDENTITY = 255
 
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_VALUE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_MONOFLOP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MONOFLOP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_GROUP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_GROUP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_AVAILABLE_FOR_GROUP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_MONOFLOP_DONE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_SELECTED_VALUES: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_MONOFLOP_DONE: 'H H',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -54,19 +73,6 @@ class BrickletIndustrialQuadRelay(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_SET_VALUE] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_GET_VALUE] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_SET_MONOFLOP] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_GET_MONOFLOP] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_SET_GROUP] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_GET_GROUP] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_GET_AVAILABLE_FOR_GROUP] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIndustrialQuadRelay.CALLBACK_MONOFLOP_DONE] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_SET_SELECTED_VALUES] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIndustrialQuadRelay.FUNCTION_GET_IDENTITY] = BrickletIndustrialQuadRelay.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletIndustrialQuadRelay.CALLBACK_MONOFLOP_DONE] = 'H H'
-
     def set_value(self, value_mask):
         """
         Sets the output value with a bitmask. The bitmask
@@ -91,6 +97,14 @@ class BrickletIndustrialQuadRelay(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_VALUE, (), '', 'H')
 
+    def get_value_async(self):
+        """
+        Asynchronous version of :func:`GetValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialQuadRelay.FUNCTION_GET_VALUE, (), '', 'H')
+
     def set_monoflop(self, selection_mask, value_mask, time):
         """
         Configures a monoflop of the pins specified by the first parameter
@@ -125,6 +139,14 @@ class BrickletIndustrialQuadRelay(Device):
         """
         return GetMonoflop(*self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_MONOFLOP, (pin,), 'B', 'H I I'))
 
+    def get_monoflop_async(self, pin):
+        """
+        Asynchronous version of :func:`GetMonoflop`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMonoflop` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialQuadRelay.FUNCTION_GET_MONOFLOP, (pin,), 'B', 'H I I', GetMonoflop)
+
     def set_group(self, group):
         """
         Sets a group of Quad Relay Bricklets that should work together. You can
@@ -151,6 +173,14 @@ class BrickletIndustrialQuadRelay(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_GROUP, (), '', '4c')
 
+    def get_group_async(self):
+        """
+        Asynchronous version of :func:`GetGroup`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetGroup` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialQuadRelay.FUNCTION_GET_GROUP, (), '', '4c')
+
     def get_available_for_group(self):
         """
         Returns a bitmask of ports that are available for grouping. For example the
@@ -159,6 +189,14 @@ class BrickletIndustrialQuadRelay(Device):
         """
         return self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 'B')
 
+    def get_available_for_group_async(self):
+        """
+        Asynchronous version of :func:`GetAvailableForGroup`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAvailableForGroup` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialQuadRelay.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 'B')
+
     def set_selected_values(self, selection_mask, value_mask):
         """
         Sets the output value with a bitmask, according to the selection mask. 
@@ -193,6 +231,14 @@ class BrickletIndustrialQuadRelay(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIndustrialQuadRelay.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
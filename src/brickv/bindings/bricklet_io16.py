@@ -52,6 +52,30 @@ class BrickletIO16(Device):
     DIRECTION_IN = 'i'
     DIRECTION_OUT = 'o'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_PORT: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PORT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_PORT_CONFIGURATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PORT_CONFIGURATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_PORT_INTERRUPT: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_PORT_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_PORT_MONOFLOP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_PORT_MONOFLOP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_MONOFLOP_DONE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_SELECTED_VALUES: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_INTERRUPT: 'c B B',
+        CALLBACK_MONOFLOP_DONE: 'c B B',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -61,24 +85,6 @@ class BrickletIO16(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletIO16.FUNCTION_SET_PORT] = BrickletIO16.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_GET_PORT] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO16.FUNCTION_SET_PORT_CONFIGURATION] = BrickletIO16.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_GET_PORT_CONFIGURATION] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO16.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletIO16.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIO16.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO16.FUNCTION_SET_PORT_INTERRUPT] = BrickletIO16.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIO16.FUNCTION_GET_PORT_INTERRUPT] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO16.CALLBACK_INTERRUPT] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_SET_PORT_MONOFLOP] = BrickletIO16.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_GET_PORT_MONOFLOP] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO16.CALLBACK_MONOFLOP_DONE] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_SET_SELECTED_VALUES] = BrickletIO16.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO16.FUNCTION_GET_IDENTITY] = BrickletIO16.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletIO16.CALLBACK_INTERRUPT] = 'c B B'
-        self.callback_formats[BrickletIO16.CALLBACK_MONOFLOP_DONE] = 'c B B'
-
     def set_port(self, port, value_mask):
         """
         Sets the output value (high or low) for a port ("a" or "b") with a bitmask.
@@ -101,6 +107,14 @@ class BrickletIO16(Device):
         """
         return self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT, (port,), 'c', 'B')
 
+    def get_port_async(self, port):
+        """
+        Asynchronous version of :func:`GetPort`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPort` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_PORT, (port,), 'c', 'B')
+
     def set_port_configuration(self, port, selection_mask, direction, value):
         """
         Configures the value and direction of a specified port. Possible directions
@@ -135,6 +149,14 @@ class BrickletIO16(Device):
         """
         return GetPortConfiguration(*self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_CONFIGURATION, (port,), 'c', 'B B'))
 
+    def get_port_configuration_async(self, port):
+        """
+        Asynchronous version of :func:`GetPortConfiguration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPortConfiguration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_PORT_CONFIGURATION, (port,), 'c', 'B B', GetPortConfiguration)
+
     def set_debounce_period(self, debounce):
         """
         Sets the debounce period of the :func:`Interrupt` callback in ms.
@@ -153,6 +175,14 @@ class BrickletIO16(Device):
         """
         return self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def set_port_interrupt(self, port, interrupt_mask):
         """
         Sets the pins on which an interrupt is activated with a bitmask.
@@ -173,6 +203,14 @@ class BrickletIO16(Device):
         """
         return self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_INTERRUPT, (port,), 'c', 'B')
 
+    def get_port_interrupt_async(self, port):
+        """
+        Asynchronous version of :func:`GetPortInterrupt`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPortInterrupt` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_PORT_INTERRUPT, (port,), 'c', 'B')
+
     def set_port_monoflop(self, port, selection_mask, value_mask, time):
         """
         Configures a monoflop of the pins specified by the second parameter as 8 bit
@@ -211,6 +249,14 @@ class BrickletIO16(Device):
         """
         return GetPortMonoflop(*self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_MONOFLOP, (port, pin), 'c B', 'B I I'))
 
+    def get_port_monoflop_async(self, port, pin):
+        """
+        Asynchronous version of :func:`GetPortMonoflop`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPortMonoflop` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_PORT_MONOFLOP, (port, pin), 'c B', 'B I I', GetPortMonoflop)
+
     def set_selected_values(self, port, selection_mask, value_mask):
         """
         Sets the output value (high or low) for a port ("a" or "b" with a bitmask, 
@@ -242,6 +288,14 @@ class BrickletIO16(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO16.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
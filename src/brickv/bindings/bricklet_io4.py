@@ -52,6 +52,30 @@ class BrickletIO4(Device):
     DIRECTION_IN = 'i'
     DIRECTION_OUT = 'o'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_SET_VALUE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_VALUE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CONFIGURATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CONFIGURATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_INTERRUPT: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_INTERRUPT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_MONOFLOP: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_MONOFLOP: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_MONOFLOP_DONE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_SELECTED_VALUES: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_INTERRUPT: 'B B',
+        CALLBACK_MONOFLOP_DONE: 'B B',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -61,24 +85,6 @@ class BrickletIO4(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletIO4.FUNCTION_SET_VALUE] = BrickletIO4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_GET_VALUE] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO4.FUNCTION_SET_CONFIGURATION] = BrickletIO4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_GET_CONFIGURATION] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO4.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletIO4.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIO4.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO4.FUNCTION_SET_INTERRUPT] = BrickletIO4.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletIO4.FUNCTION_GET_INTERRUPT] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO4.CALLBACK_INTERRUPT] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_SET_MONOFLOP] = BrickletIO4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_GET_MONOFLOP] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletIO4.CALLBACK_MONOFLOP_DONE] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_SET_SELECTED_VALUES] = BrickletIO4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletIO4.FUNCTION_GET_IDENTITY] = BrickletIO4.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletIO4.CALLBACK_INTERRUPT] = 'B B'
-        self.callback_formats[BrickletIO4.CALLBACK_MONOFLOP_DONE] = 'B B'
-
     def set_value(self, value_mask):
         """
         Sets the output value (high or low) with a bitmask. The bitmask
@@ -101,6 +107,14 @@ class BrickletIO4(Device):
         """
         return self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_VALUE, (), '', 'B')
 
+    def get_value_async(self):
+        """
+        Asynchronous version of :func:`GetValue`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetValue` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_VALUE, (), '', 'B')
+
     def set_configuration(self, selection_mask, direction, value):
         """
         Configures the value and direction of the specified pins. Possible directions
@@ -135,6 +149,14 @@ class BrickletIO4(Device):
         """
         return GetConfiguration(*self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_CONFIGURATION, (), '', 'B B'))
 
+    def get_configuration_async(self):
+        """
+        Asynchronous version of :func:`GetConfiguration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetConfiguration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_CONFIGURATION, (), '', 'B B', GetConfiguration)
+
     def set_debounce_period(self, debounce):
         """
         Sets the debounce period of the :func:`Interrupt` callback in ms.
@@ -153,6 +175,14 @@ class BrickletIO4(Device):
         """
         return self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def set_interrupt(self, interrupt_mask):
         """
         Sets the pins on which an interrupt is activated with a bitmask.
@@ -172,6 +202,14 @@ class BrickletIO4(Device):
         """
         return self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_INTERRUPT, (), '', 'B')
 
+    def get_interrupt_async(self):
+        """
+        Asynchronous version of :func:`GetInterrupt`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetInterrupt` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_INTERRUPT, (), '', 'B')
+
     def set_monoflop(self, selection_mask, value_mask, time):
         """
         Configures a monoflop of the pins specified by the first parameter as 4 bit
@@ -210,6 +248,14 @@ class BrickletIO4(Device):
         """
         return GetMonoflop(*self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_MONOFLOP, (pin,), 'B', 'B I I'))
 
+    def get_monoflop_async(self, pin):
+        """
+        Asynchronous version of :func:`GetMonoflop`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetMonoflop` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_MONOFLOP, (pin,), 'B', 'B I I', GetMonoflop)
+
     def set_selected_values(self, selection_mask, value_mask):
         """
         Sets the output value (high or low) with a bitmask, according to
@@ -241,6 +287,14 @@ class BrickletIO4(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletIO4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletIO4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -48,6 +48,29 @@ class BrickletLCD20x4(Device):
     FUNCTION_GET_IDENTITY = 255
 
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_WRITE_LINE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_CLEAR_DISPLAY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_BACKLIGHT_ON: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_BACKLIGHT_OFF: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_IS_BACKLIGHT_ON: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CONFIG: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CONFIG: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_IS_BUTTON_PRESSED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_BUTTON_PRESSED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_BUTTON_RELEASED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_SET_CUSTOM_CHARACTER: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CUSTOM_CHARACTER: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_BUTTON_PRESSED: 'B',
+        CALLBACK_BUTTON_RELEASED: 'B',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -57,23 +80,6 @@ class BrickletLCD20x4(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletLCD20x4.FUNCTION_WRITE_LINE] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_CLEAR_DISPLAY] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_BACKLIGHT_ON] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_BACKLIGHT_OFF] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_IS_BACKLIGHT_ON] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletLCD20x4.FUNCTION_SET_CONFIG] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_GET_CONFIG] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletLCD20x4.FUNCTION_IS_BUTTON_PRESSED] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletLCD20x4.CALLBACK_BUTTON_PRESSED] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletLCD20x4.CALLBACK_BUTTON_RELEASED] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_SET_CUSTOM_CHARACTER] = BrickletLCD20x4.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletLCD20x4.FUNCTION_GET_CUSTOM_CHARACTER] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletLCD20x4.FUNCTION_GET_IDENTITY] = BrickletLCD20x4.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletLCD20x4.CALLBACK_BUTTON_PRESSED] = 'B'
-        self.callback_formats[BrickletLCD20x4.CALLBACK_BUTTON_RELEASED] = 'B'
-
     def write_line(self, line, position, text):
         """
         Writes text to a specific line (0 to 3) with a specific position 
@@ -114,6 +120,14 @@ class BrickletLCD20x4(Device):
         """
         return self.ipcon.send_request(self, BrickletLCD20x4.FUNCTION_IS_BACKLIGHT_ON, (), '', '?')
 
+    def is_backlight_on_async(self):
+        """
+        Asynchronous version of :func:`IsBacklightOn`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsBacklightOn` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletLCD20x4.FUNCTION_IS_BACKLIGHT_ON, (), '', '?')
+
     def set_config(self, cursor, blinking):
         """
         Configures if the cursor (shown as "_") should be visible and if it
@@ -131,6 +145,14 @@ class BrickletLCD20x4(Device):
         """
         return GetConfig(*self.ipcon.send_request(self, BrickletLCD20x4.FUNCTION_GET_CONFIG, (), '', '? ?'))
 
+    def get_config_async(self):
+        """
+        Asynchronous version of :func:`GetConfig`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetConfig` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletLCD20x4.FUNCTION_GET_CONFIG, (), '', '? ?', GetConfig)
+
     def is_button_pressed(self, button):
         """
         Returns *true* if the button (0 to 2 or 0 to 3 with hardware version >= 1.2) 
@@ -140,6 +162,14 @@ class BrickletLCD20x4(Device):
         """
         return self.ipcon.send_request(self, BrickletLCD20x4.FUNCTION_IS_BUTTON_PRESSED, (button,), 'B', '?')
 
+    def is_button_pressed_async(self, button):
+        """
+        Asynchronous version of :func:`IsButtonPressed`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`IsButtonPressed` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletLCD20x4.FUNCTION_IS_BUTTON_PRESSED, (button,), 'B', '?')
+
     def set_custom_character(self, index, character):
         """
         The LCD 20x4 Bricklet can store up to 8 custom characters. The characters
@@ -178,6 +208,14 @@ class BrickletLCD20x4(Device):
         """
         return self.ipcon.send_request(self, BrickletLCD20x4.FUNCTION_GET_CUSTOM_CHARACTER, (index,), 'B', '8B')
 
+    def get_custom_character_async(self, index):
+        """
+        Asynchronous version of :func:`GetCustomCharacter`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCustomCharacter` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletLCD20x4.FUNCTION_GET_CUSTOM_CHARACTER, (index,), 'B', '8B')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -192,6 +230,14 @@ class BrickletLCD20x4(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletLCD20x4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletLCD20x4.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
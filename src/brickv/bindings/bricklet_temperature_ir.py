@@ -60,6 +60,37 @@ class BrickletTemperatureIR(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_AMBIENT_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_OBJECT_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_EMISSIVITY: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_EMISSIVITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_AMBIENT_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_OBJECT_TEMPERATURE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_AMBIENT_TEMPERATURE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_OBJECT_TEMPERATURE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_AMBIENT_TEMPERATURE: 'h',
+        CALLBACK_OBJECT_TEMPERATURE: 'h',
+        CALLBACK_AMBIENT_TEMPERATURE_REACHED: 'h',
+        CALLBACK_OBJECT_TEMPERATURE_REACHED: 'h',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -69,31 +100,6 @@ class BrickletTemperatureIR(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_EMISSIVITY] = BrickletTemperatureIR.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_EMISSIVITY] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD] = BrickletTemperatureIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD] = BrickletTemperatureIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletTemperatureIR.CALLBACK_AMBIENT_TEMPERATURE] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletTemperatureIR.CALLBACK_OBJECT_TEMPERATURE] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletTemperatureIR.CALLBACK_AMBIENT_TEMPERATURE_REACHED] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletTemperatureIR.CALLBACK_OBJECT_TEMPERATURE_REACHED] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletTemperatureIR.FUNCTION_GET_IDENTITY] = BrickletTemperatureIR.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletTemperatureIR.CALLBACK_AMBIENT_TEMPERATURE] = 'h'
-        self.callback_formats[BrickletTemperatureIR.CALLBACK_OBJECT_TEMPERATURE] = 'h'
-        self.callback_formats[BrickletTemperatureIR.CALLBACK_AMBIENT_TEMPERATURE_REACHED] = 'h'
-        self.callback_formats[BrickletTemperatureIR.CALLBACK_OBJECT_TEMPERATURE_REACHED] = 'h'
-
     def get_ambient_temperature(self):
         """
         Returns the ambient temperature of the sensor. The value
@@ -107,6 +113,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE, (), '', 'h')
 
+    def get_ambient_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetAmbientTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAmbientTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE, (), '', 'h')
+
     def get_object_temperature(self):
         """
         Returns the object temperature of the sensor, i.e. the temperature
@@ -125,6 +139,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE, (), '', 'h')
 
+    def get_object_temperature_async(self):
+        """
+        Asynchronous version of :func:`GetObjectTemperature`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetObjectTemperature` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE, (), '', 'h')
+
     def set_emissivity(self, emissivity):
         """
         Sets the `emissivity <http://en.wikipedia.org/wiki/Emissivity>`__ that is
@@ -154,6 +176,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_EMISSIVITY, (), '', 'H')
 
+    def get_emissivity_async(self):
+        """
+        Asynchronous version of :func:`GetEmissivity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetEmissivity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_EMISSIVITY, (), '', 'H')
+
     def set_ambient_temperature_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`AmbientTemperature` callback is triggered
@@ -172,6 +202,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_ambient_temperature_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetAmbientTemperatureCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAmbientTemperatureCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_object_temperature_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`ObjectTemperature` callback is triggered
@@ -190,6 +228,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_object_temperature_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetObjectTemperatureCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetObjectTemperatureCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_ambient_temperature_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`AmbientTemperatureReached` callback. 
@@ -216,6 +262,14 @@ class BrickletTemperatureIR(Device):
         """
         return GetAmbientTemperatureCallbackThreshold(*self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_ambient_temperature_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetAmbientTemperatureCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetAmbientTemperatureCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 'c h h', GetAmbientTemperatureCallbackThreshold)
+
     def set_object_temperature_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`ObjectTemperatureReached` callback. 
@@ -242,6 +296,14 @@ class BrickletTemperatureIR(Device):
         """
         return GetObjectTemperatureCallbackThreshold(*self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 'c h h'))
 
+    def get_object_temperature_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetObjectTemperatureCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetObjectTemperatureCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 'c h h', GetObjectTemperatureCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -264,6 +326,14 @@ class BrickletTemperatureIR(Device):
         """
         return self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -278,6 +348,14 @@ class BrickletTemperatureIR(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletTemperatureIR.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletTemperatureIR.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
@@ -80,6 +80,48 @@ class BrickletVoltageCurrent(Device):
     THRESHOLD_OPTION_SMALLER = '<'
     THRESHOLD_OPTION_GREATER = '>'
 
+    __slots__ = ()
+
+    response_expected_defaults = {
+        FUNCTION_GET_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_POWER: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CONFIGURATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CONFIGURATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CALIBRATION: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_CALIBRATION: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_CURRENT_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_POWER_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_POWER_CALLBACK_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_POWER_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_POWER_CALLBACK_THRESHOLD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_TRUE,
+        FUNCTION_GET_DEBOUNCE_PERIOD: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        CALLBACK_CURRENT: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_POWER: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_CURRENT_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_VOLTAGE_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        CALLBACK_POWER_REACHED: Device.RESPONSE_EXPECTED_ALWAYS_FALSE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    }
+
+    callback_formats = {
+        CALLBACK_CURRENT: 'i',
+        CALLBACK_VOLTAGE: 'i',
+        CALLBACK_POWER: 'i',
+        CALLBACK_CURRENT_REACHED: 'i',
+        CALLBACK_VOLTAGE_REACHED: 'i',
+        CALLBACK_POWER_REACHED: 'i',
+    }
+
     def __init__(self, uid, ipcon):
         """
         Creates an object with the unique device ID *uid* and adds it to
@@ -89,42 +131,6 @@ class BrickletVoltageCurrent(Device):
 
         self.api_version = (2, 0, 0)
 
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_CURRENT] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_POWER] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_CONFIGURATION] = BrickletVoltageCurrent.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_CONFIGURATION] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_CALIBRATION] = BrickletVoltageCurrent.RESPONSE_EXPECTED_FALSE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_CALIBRATION] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_CURRENT_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_POWER_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_POWER_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_THRESHOLD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_SET_DEBOUNCE_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_TRUE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_DEBOUNCE_PERIOD] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_CURRENT] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_VOLTAGE] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_POWER] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_CURRENT_REACHED] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_VOLTAGE_REACHED] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.CALLBACK_POWER_REACHED] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[BrickletVoltageCurrent.FUNCTION_GET_IDENTITY] = BrickletVoltageCurrent.RESPONSE_EXPECTED_ALWAYS_TRUE
-
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_CURRENT] = 'i'
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_VOLTAGE] = 'i'
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_POWER] = 'i'
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_CURRENT_REACHED] = 'i'
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_VOLTAGE_REACHED] = 'i'
-        self.callback_formats[BrickletVoltageCurrent.CALLBACK_POWER_REACHED] = 'i'
-
     def get_current(self):
         """
         Returns the current. The value is in mA
@@ -136,6 +142,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT, (), '', 'i')
 
+    def get_current_async(self):
+        """
+        Asynchronous version of :func:`GetCurrent`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrent` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT, (), '', 'i')
+
     def get_voltage(self):
         """
         Returns the voltage. The value is in mV
@@ -147,6 +161,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE, (), '', 'i')
 
+    def get_voltage_async(self):
+        """
+        Asynchronous version of :func:`GetVoltage`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltage` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE, (), '', 'i')
+
     def get_power(self):
         """
         Returns the power. The value is in mW
@@ -158,6 +180,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER, (), '', 'i')
 
+    def get_power_async(self):
+        """
+        Asynchronous version of :func:`GetPower`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPower` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_POWER, (), '', 'i')
+
     def set_configuration(self, averaging, voltage_conversion_time, current_conversion_time):
         """
         Sets the configuration of the Voltage/Current Bricklet. It is
@@ -205,6 +235,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetConfiguration(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CONFIGURATION, (), '', 'B B B'))
 
+    def get_configuration_async(self):
+        """
+        Asynchronous version of :func:`GetConfiguration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetConfiguration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_CONFIGURATION, (), '', 'B B B', GetConfiguration)
+
     def set_calibration(self, gain_multiplier, gain_divisor):
         """
         Since the shunt resistor that is used to measure the current is not
@@ -223,6 +261,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetCalibration(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CALIBRATION, (), '', 'H H'))
 
+    def get_calibration_async(self):
+        """
+        Asynchronous version of :func:`GetCalibration`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCalibration` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_CALIBRATION, (), '', 'H H', GetCalibration)
+
     def set_current_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Current` callback is triggered
@@ -241,6 +287,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_current_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 'I')
+
     def set_voltage_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Voltage` callback is triggered
@@ -259,6 +313,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_voltage_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetVoltageCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltageCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 'I')
+
     def set_power_callback_period(self, period):
         """
         Sets the period in ms with which the :func:`Power` callback is triggered
@@ -277,6 +339,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_PERIOD, (), '', 'I')
 
+    def get_power_callback_period_async(self):
+        """
+        Asynchronous version of :func:`GetPowerCallbackPeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPowerCallbackPeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_PERIOD, (), '', 'I')
+
     def set_current_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`CurrentReached` callback. 
@@ -303,6 +373,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetCurrentCallbackThreshold(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 'c i i'))
 
+    def get_current_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetCurrentCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetCurrentCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 'c i i', GetCurrentCallbackThreshold)
+
     def set_voltage_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`VoltageReached` callback. 
@@ -329,6 +407,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetVoltageCallbackThreshold(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c i i'))
 
+    def get_voltage_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetVoltageCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetVoltageCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 'c i i', GetVoltageCallbackThreshold)
+
     def set_power_callback_threshold(self, option, min, max):
         """
         Sets the thresholds for the :func:`PowerReached` callback. 
@@ -355,6 +441,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetPowerCallbackThreshold(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_THRESHOLD, (), '', 'c i i'))
 
+    def get_power_callback_threshold_async(self):
+        """
+        Asynchronous version of :func:`GetPowerCallbackThreshold`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetPowerCallbackThreshold` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_THRESHOLD, (), '', 'c i i', GetPowerCallbackThreshold)
+
     def set_debounce_period(self, debounce):
         """
         Sets the period in ms with which the threshold callbacks
@@ -377,6 +471,14 @@ class BrickletVoltageCurrent(Device):
         """
         return self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
 
+    def get_debounce_period_async(self):
+        """
+        Asynchronous version of :func:`GetDebouncePeriod`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetDebouncePeriod` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 'I')
+
     def get_identity(self):
         """
         Returns the UID, the UID where the Bricklet is connected to, 
@@ -391,6 +493,14 @@ class BrickletVoltageCurrent(Device):
         """
         return GetIdentity(*self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H'))
 
+    def get_identity_async(self):
+        """
+        Asynchronous version of :func:`GetIdentity`. Returns a future instead
+        of waiting for the response, the result method of the future returns
+        what :func:`GetIdentity` would return.
+        """
+        return self.ipcon.send_request_async(self, BrickletVoltageCurrent.FUNCTION_GET_IDENTITY, (), '', '8s 8s c 3B 3B H', GetIdentity)
+
     def register_callback(self, id, callback):
         """
         Registers a callback with ID *id* to the function *callback*.
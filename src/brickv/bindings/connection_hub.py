@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2013 Matthias Bolte <matthias@tinkerforge.com>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted.
+
+# selectors is only available in python 3. this file still sticks to python 2
+# syntax, because the package builds compile every module in the bindings
+# directory
+
+from threading import Thread, Event, Lock, current_thread
+from collections import deque
+import selectors
+import socket
+import sys
+import traceback
+
+try:
+    from queue import Queue # Python 3
+except ImportError:
+    from Queue import Queue # Python 2
+
+try:
+    from .ip_connection import IPConnection, Error, ReceiveBuffer, monotonic
+except ValueError:
+    from ip_connection import IPConnection, Error, ReceiveBuffer, monotonic
+
+class CallbackLane:
+    """
+    Stand-in for the callback queue of an IPConnection served by a
+    ConnectionHub. Items are passed to the callback worker the IP
+    Connection is assigned to.
+
+    With CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK the I/O thread cannot wait for
+    free space, that would stop all IP Connections of the hub. Instead the
+    lane gets paused once the queue size is reached, the hub stops reading
+    the socket of this IP Connection until half of its queued packets are
+    dispatched.
+    """
+
+    def __init__(self, ipcon, worker, hub):
+        self.ipcon = ipcon
+        self.worker = worker
+        self.hub = hub
+        self.exited = Event()
+        self.lock = Lock()
+        self.queued = 0 # protected by lock
+        self.paused = False # protected by lock
+
+        # the worker queue is shared, bound the number of queued packets of
+        # this IP Connection instead
+        if ipcon.callback_queue_policy == IPConnection.CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK:
+            self.size = ipcon.callback_queue_size
+        else:
+            self.size = None
+
+    def put(self, item, block=True, timeout=None):
+        # never blocks, the packets of the chunk that is currently handled
+        # are queued even if the lane is paused already
+        kind, data = item
+
+        if self.size is not None and kind == IPConnection.QUEUE_PACKET:
+            with self.lock:
+                self.queued += 1
+
+                if self.queued >= self.size:
+                    self.paused = True
+
+        self.worker.queue.put((self, kind, data))
+
+    def packet_dequeued(self):
+        if self.size is None:
+            return
+
+        with self.lock:
+            self.queued -= 1
+            resume = self.paused and self.queued <= self.size // 2
+
+            if resume:
+                self.paused = False
+
+        if resume:
+            self.hub.resume_connection(self.ipcon)
+
+    def join(self):
+        # a callback can disconnect its own IP Connection, the worker
+        # cannot wait for itself in that case
+        if current_thread() is not self.worker.thread:
+            self.exited.wait()
+
+class CallbackWorker:
+    def __init__(self, name):
+        self.queue = Queue()
+        self.thread = Thread(name=name, target=self.loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def loop(self):
+        while True:
+            lane, kind, data = self.queue.get()
+
+            if lane is None:
+                return
+
+            if kind == IPConnection.QUEUE_EXIT:
+                lane.exited.set()
+                continue
+
+            ipcon = lane.ipcon
+
+            try:
+                if kind == IPConnection.QUEUE_META:
+                    ipcon.dispatch_meta(*data)
+                elif kind == IPConnection.QUEUE_PACKET:
+                    lane.packet_dequeued()
+
+                    # don't dispatch callbacks when the receive thread isn't running
+                    if ipcon.receive_flag:
+                        ipcon.dispatch_packet(data)
+                    else:
+                        ipcon.count_dropped_callback(data)
+                elif kind == IPConnection.QUEUE_COALESCED_PACKET:
+                    packet = ipcon.take_coalesced_packet(data)
+
+                    if ipcon.receive_flag:
+                        ipcon.dispatch_packet(packet)
+                    else:
+                        ipcon.count_dropped_callback(packet)
+                elif kind == IPConnection.QUEUE_BATCH:
+                    if ipcon.receive_flag:
+                        ipcon.dispatch_batch(data)
+            except:
+                # the worker is shared by many IP Connections, a failing
+                # callback must not stop it
+                traceback.print_exc()
+
+class ConnectionHub:
+    """
+    Serves the sockets of any number of IP Connections with a single I/O
+    thread and delivers their callbacks with a pool of *callback_workers*
+    threads, instead of two threads per IP Connection. Each IP Connection
+    is assigned to one worker, so its callbacks are still delivered in
+    order.
+
+    Pass the hub to the constructor of the IP Connections, their API does
+    not change otherwise::
+
+        hub = ConnectionHub(callback_workers=4)
+        ipcon = IPConnection(hub)
+    """
+
+    SWEEP_INTERVAL = 0.1
+
+    def __init__(self, callback_workers=1):
+        if callback_workers < 1:
+            raise ValueError('At least one callback worker is required')
+
+        self.selector = selectors.DefaultSelector()
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+        self.wakeup_writer.setblocking(False)
+        self.selector.register(self.wakeup_reader, selectors.EVENT_READ, None)
+        self.commands = deque()
+        self.connections = {} # ipcon -> socket, only used by the I/O thread
+        self.paused_connections = {} # ipcon -> selector data, only used by the I/O thread
+        self.running = True
+        self.workers = []
+        self.next_worker = 0
+        self.next_worker_lock = Lock()
+
+        for i in range(callback_workers):
+            self.workers.append(CallbackWorker('Hub-Callback-{0}'.format(i)))
+
+        self.io_thread = Thread(name='Hub-IO', target=self.io_loop)
+        self.io_thread.daemon = True
+        self.io_thread.start()
+
+    def close(self):
+        """
+        Stops the I/O thread and the callback workers. All IP Connections
+        using this hub have to be disconnected before.
+        """
+
+        if not self.running:
+            return
+
+        self.call_in_io_thread(self.stop)
+        self.io_thread.join()
+
+        for worker in self.workers:
+            worker.queue.put((None, None, None))
+
+        for worker in self.workers:
+            if current_thread() is not worker.thread:
+                worker.thread.join()
+
+        self.selector.close()
+        self.wakeup_reader.close()
+        self.wakeup_writer.close()
+
+    def create_callback_lane(self, ipcon):
+        with self.next_worker_lock:
+            worker = self.workers[self.next_worker]
+            self.next_worker = (self.next_worker + 1) % len(self.workers)
+
+        return CallbackLane(ipcon, worker, self)
+
+    def add_connection(self, ipcon):
+        self.call_in_io_thread(lambda: self.register(ipcon))
+
+    def remove_connection(self, ipcon):
+        self.call_in_io_thread(lambda: self.unregister(ipcon))
+
+    def call_in_io_thread(self, function):
+        if current_thread() is self.io_thread:
+            function()
+            return
+
+        if not self.running:
+            raise Error(Error.NOT_CONNECTED, 'Connection hub is closed')
+
+        done = Event()
+        result = []
+
+        def command():
+            try:
+                function()
+            except:
+                result.append(sys.exc_info()[1])
+            finally:
+                done.set()
+
+        self.post_command(command)
+
+        done.wait()
+
+        if len(result) > 0:
+            raise result[0]
+
+    def post_command(self, command):
+        # runs *command* in the I/O thread without waiting for it
+        self.commands.append(command)
+
+        try:
+            self.wakeup_writer.send(b'\x00')
+        except socket.error:
+            pass # wakeup byte(s) already pending
+
+    def pause_connection(self, ipcon):
+        # NOTE: must be called from the I/O thread
+        sock = self.connections.get(ipcon)
+
+        if sock is None or ipcon in self.paused_connections:
+            return
+
+        self.paused_connections[ipcon] = self.selector.unregister(sock).data
+
+    def resume_connection(self, ipcon):
+        def resume():
+            data = self.paused_connections.pop(ipcon, None)
+            sock = self.connections.get(ipcon)
+
+            # the I/O thread might not have paused the connection yet, then
+            # it doesn't do so anymore because the lane is resumed already
+            if data is not None and sock is not None:
+                self.selector.register(sock, selectors.EVENT_READ, data)
+
+        if self.running:
+            self.post_command(resume)
+
+    def register(self, ipcon):
+        receive_buffer = ReceiveBuffer(ipcon.receive_buffer_size)
+
+        self.selector.register(ipcon.socket, selectors.EVENT_READ, (ipcon, receive_buffer))
+        self.connections[ipcon] = ipcon.socket
+
+    def unregister(self, ipcon):
+        sock = self.connections.pop(ipcon, None)
+        self.paused_connections.pop(ipcon, None)
+
+        if sock is None:
+            return
+
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+
+        ipcon.fail_pending_requests(Error(Error.NOT_CONNECTED, 'Connection closed'))
+
+    def stop(self):
+        for ipcon in list(self.connections):
+            self.unregister(ipcon)
+
+        self.running = False
+
+    def io_loop(self):
+        next_sweep = monotonic() + ConnectionHub.SWEEP_INTERVAL
+
+        while self.running:
+            for key, mask in self.selector.select(ConnectionHub.SWEEP_INTERVAL):
+                if key.data is None:
+                    self.run_commands()
+                    continue
+
+                ipcon, receive_buffer = key.data
+
+                if not ipcon.receive_flag or not ipcon.receive_into(receive_buffer):
+                    self.unregister(ipcon)
+                    continue
+
+                lane = ipcon.callback_queue
+
+                if lane is not None and lane.paused:
+                    # the callbacks of this IP Connection fall behind, stop
+                    # reading its socket instead of blocking the I/O thread
+                    self.pause_connection(ipcon)
+
+            # complete futures whose timeout expired on connections that
+            # don't receive anything anymore
+            now = monotonic()
+
+            if now >= next_sweep:
+                next_sweep = now + ConnectionHub.SWEEP_INTERVAL
+
+                for ipcon in self.connections:
+                    if ipcon.next_request_deadline <= now:
+                        ipcon.expire_pending_requests()
+
+    def run_commands(self):
+        try:
+            while len(self.wakeup_reader.recv(4096)) > 0:
+                pass
+        except socket.error:
+            pass
+
+        while len(self.commands) > 0:
+            self.commands.popleft()()
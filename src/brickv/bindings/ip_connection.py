@@ -5,7 +5,8 @@
 # Redistribution and use in source and binary forms of this file,
 # with or without modification, are permitted.
 
-from threading import Thread, Lock, Semaphore
+from threading import Thread, Lock, Semaphore, Condition, Event
+from collections import deque
 
 # current_thread for python 2.6, currentThread for python 2.5
 try:
@@ -15,15 +16,35 @@ except ImportError:
 
 # Queue for python 2, queue for python 3
 try:
-    from Queue import Queue, Empty
+    from Queue import Queue, Full
 except ImportError:
-    from queue import Queue, Empty
+    from queue import Queue, Full
 
 import struct
 import socket
+import heapq
+import math
+import random
+import logging
+import numbers
 import types
 import sys
 import time
+import traceback
+import weakref
+
+# monotonic clock for the arrival timestamps, timeouts and deadlines,
+# time.monotonic was added in python 3.3
+try:
+    monotonic = time.monotonic
+except AttributeError:
+    monotonic = time.time
+
+# numpy is optional, it is only required for batch callbacks
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # use normal tuples instead of namedtuples in python version below 2.6
 if sys.hexversion < 0x02060000:
@@ -35,20 +56,250 @@ if sys.hexversion < 0x02060000:
 else:
     from collections import namedtuple
 
+CallbackStatistics = namedtuple('CallbackStatistics', ['dropped', 'coalesced'])
+DeviceState = namedtuple('DeviceState', ['values', 'timestamp'])
+CallResult = namedtuple('CallResult', ['result', 'error'])
+LatencyStatistics = namedtuple('LatencyStatistics', ['count', 'mean', 'p50', 'p99', 'max'])
+Statistics = namedtuple('Statistics', ['packets_in_per_second', 'bytes_in_per_second',
+                                       'packets_out_per_second', 'bytes_out_per_second',
+                                       'packets_in', 'bytes_in', 'packets_out', 'bytes_out',
+                                       'callback_queue_depth', 'callback_queue_age',
+                                       'round_trips', 'callback_times', 'timeouts'])
+ReconnectStatistics = namedtuple('ReconnectStatistics', ['attempts', 'reconnects', 'last_latency', 'mean_latency', 'max_latency'])
+
 def get_uid_from_data(data):
-    return struct.unpack('<I', data[0:4])[0]
+    return struct.unpack_from('<I', data, 0)[0]
 
 def get_length_from_data(data):
-    return struct.unpack('<B', data[4:5])[0]
+    return struct.unpack_from('<B', data, 4)[0]
 
 def get_function_id_from_data(data):
-    return struct.unpack('<B', data[5:6])[0]
+    return struct.unpack_from('<B', data, 5)[0]
 
 def get_sequence_number_from_data(data):
-    return (struct.unpack('<B', data[6:7])[0] >> 4) & 0x0F
+    return (struct.unpack_from('<B', data, 6)[0] >> 4) & 0x0F
+
+def get_enumeration_type_from_data(data):
+    return struct.unpack_from('<B', data, 33)[0]
 
 def get_error_code_from_data(data):
-    return (struct.unpack('<B', data[7:8])[0] >> 6) & 0x03
+    return (struct.unpack_from('<B', data, 7)[0] >> 6) & 0x03
+
+TIMESTAMP_STRUCT = struct.Struct('<d')
+
+def append_timestamp(data, timestamp):
+    # the timestamp is stored behind the packet, decoding the payload
+    # ignores it
+    return copy_data(data) + TIMESTAMP_STRUCT.pack(timestamp)
+
+def get_timestamp_from_data(data):
+    return TIMESTAMP_STRUCT.unpack_from(data, get_length_from_data(data))[0]
+
+def send_all(sock, data):
+    # like sock.sendall, but keeps sending if the receive timeout of the
+    # socket expires while the send buffer is full, see receive_packets
+    view = memoryview(data)
+
+    while len(view) > 0:
+        try:
+            sent = sock.send(view)
+        except socket.timeout:
+            continue
+
+        view = view[sent:]
+
+def copy_data(data):
+    # packets handed to handle_response can be memoryview slices of the
+    # receive buffer. they have to be copied before they are queued,
+    # because the receive buffer gets reused for the next packets
+    if isinstance(data, memoryview):
+        return data.tobytes()
+
+    return data
+
+def to_packable_string(s):
+    # struct expects bytes for s and c fields
+    if sys.hexversion < 0x03000000:
+        if type(s) == types.UnicodeType:
+            return s.encode('latin-1')
+    elif isinstance(s, str):
+        return s.encode('latin-1')
+
+    return s
+
+def trim_deserialized_string(s):
+    if sys.hexversion >= 0x03000000:
+        s = s.decode('ascii')
+
+    i = s.find(chr(0))
+    if i >= 0:
+        s = s[:i]
+
+    return s
+
+class PacketFormat:
+    """
+    Compiled form of a space separated format string such as
+    '8s 8s c 3B 3B H'. All fields are packed and unpacked by a single
+    struct.Struct, strings and arrays are converted to and from the
+    flat value list by a per-field post-processing step.
+    """
+
+    # field kinds
+    SCALAR = 0
+    ARRAY = 1
+    STRING = 2
+    CHAR_ARRAY = 3
+
+    def __init__(self, form, prefix=''):
+        self.form = form
+        self.fields = []
+
+        for f in form.split(' '):
+            if len(f) == 0:
+                continue
+
+            t = f[-1]
+            count = int(f[:-1] or 1)
+
+            if t == 's':
+                kind = PacketFormat.STRING
+            elif t == 'c' and len(f) > 1:
+                kind = PacketFormat.CHAR_ARRAY
+            elif len(f) > 1:
+                kind = PacketFormat.ARRAY
+            else:
+                kind = PacketFormat.SCALAR
+
+            self.fields.append((kind, count))
+
+        self.struct = struct.Struct('<' + prefix + ''.join(form.split(' ')))
+        self.size = self.struct.size
+
+        # formats without strings, chars and arrays map 1:1 to the struct
+        # values and can skip the post-processing step
+        self.is_flat = 'c' not in form
+
+        for kind, count in self.fields:
+            if kind != PacketFormat.SCALAR:
+                self.is_flat = False
+
+        self.is_single_scalar = self.is_flat and len(self.fields) == 1
+
+    def flatten(self, data):
+        values = []
+
+        for (kind, count), d in zip(self.fields, data):
+            if kind == PacketFormat.ARRAY:
+                values.extend(d)
+            elif kind == PacketFormat.CHAR_ARRAY:
+                if count != len(d):
+                    raise ValueError('Incorrect char list length')
+
+                values.extend([to_packable_string(k) for k in d])
+            else:
+                values.append(to_packable_string(d))
+
+        return values
+
+    def unflatten(self, values):
+        ret = []
+        i = 0
+
+        for kind, count in self.fields:
+            if kind == PacketFormat.STRING:
+                ret.append(trim_deserialized_string(values[i]))
+                i += 1
+            elif kind == PacketFormat.SCALAR:
+                ret.append(values[i])
+                i += 1
+            else:
+                ret.append(values[i:i + count])
+                i += count
+
+        if len(ret) == 1:
+            return ret[0]
+
+        return ret
+
+    def unpack(self, data, offset=0):
+        values = self.struct.unpack_from(data, offset)
+
+        if self.is_single_scalar:
+            return values[0]
+        elif self.is_flat:
+            return list(values)
+
+        return self.unflatten(values)
+
+class PacketCodec:
+    """
+    Request encoder and response decoder for one (form, form_ret) pair.
+    The request struct includes the packet header, so a complete request
+    is built by a single pack call.
+    """
+
+    def __init__(self, form, form_ret):
+        self.request = PacketFormat(form, 'IBBBB')
+        self.response = PacketFormat(form_ret)
+        self.request_length = self.request.size
+        self.request_pack = self.request.struct.pack
+
+        if self.request.is_flat:
+            self.request_flatten = None
+        else:
+            self.request_flatten = self.request.flatten
+
+    def pack_request(self, uid, function_id, sequence_number_and_options, data):
+        if self.request_flatten is not None:
+            data = self.request_flatten(data)
+
+        return self.request_pack(uid, self.request_length, function_id,
+                                 sequence_number_and_options, 0, *data)
+
+    def unpack_response(self, packet):
+        return self.response.unpack(packet, 8)
+
+# codecs are immutable once created. concurrent creation of the same codec
+# is harmless, the last one simply wins
+codecs = {}
+
+def get_codec(form, form_ret):
+    key = (form, form_ret)
+
+    try:
+        return codecs[key]
+    except KeyError:
+        codec = PacketCodec(form, form_ret)
+        codecs[key] = codec
+
+        return codec
+
+NUMPY_TYPES = {'b': 'i1', 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4',
+               'I': '<u4', 'q': '<i8', 'Q': '<u8', 'f': '<f4', 'd': '<f8',
+               '?': '?', 'c': 'S1'}
+
+def get_numpy_dtype(form):
+    # packed structured dtype with the same layout as the struct format,
+    # the fields are named f0, f1, ... like numpy does by default
+    fields = []
+
+    for f in form.split(' '):
+        if len(f) == 0:
+            continue
+
+        name = 'f{0}'.format(len(fields))
+        t = f[-1]
+        count = int(f[:-1] or 1)
+
+        if t == 's':
+            fields.append((name, 'S{0}'.format(count)))
+        elif len(f) > 1:
+            fields.append((name, NUMPY_TYPES[t], (count, )))
+        else:
+            fields.append((name, NUMPY_TYPES[t]))
+
+    return numpy.dtype(fields)
 
 BASE58 = '123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ'
 def base58encode(value):
@@ -97,13 +348,26 @@ class Error(Exception):
     def __str__(self):
         return str(self.value) + ': ' + str(self.description)
 
-class Device:
+class Device(object):
     RESPONSE_EXPECTED_INVALID_FUNCTION_ID = 0
     RESPONSE_EXPECTED_ALWAYS_TRUE = 1 # getter
     RESPONSE_EXPECTED_ALWAYS_FALSE = 2 # callback
     RESPONSE_EXPECTED_TRUE = 3 # setter
     RESPONSE_EXPECTED_FALSE = 4 # setter, default
 
+    # the subclasses declare the metadata of their functions as class level
+    # tables that are shared by all their instances
+    __slots__ = ('uid', 'ipcon', 'api_version', 'registered_callbacks',
+                 'registered_batches', 'write_combining', 'getter_cache',
+                 'state_getters', 'auth_key', 'response_expected', '__weakref__')
+
+    response_expected_defaults = {}
+    callback_formats = {}
+
+    # stand-in for registered_batches, write_combining and state_getters
+    # until something is configured, never modify it
+    NO_ENTRIES = {}
+
     def __init__(self, uid, ipcon):
         """
         Creates the device object with the unique device ID *uid* and adds
@@ -119,24 +383,19 @@ class Device:
         self.ipcon = ipcon
         self.api_version = (0, 0, 0)
         self.registered_callbacks = {}
-        self.callback_formats = {}
-        self.expected_response_function_id = None # protected by request_lock
-        self.expected_response_sequence_number = None # protected by request_lock
-        self.response_queue = Queue()
-        self.request_lock = Lock()
+        self.registered_batches = Device.NO_ENTRIES
+        self.write_combining = Device.NO_ENTRIES # function_id -> (interval, index_count)
+        self.getter_cache = None # created by set_getter_cache
+        self.state_getters = Device.NO_ENTRIES # getter function_id -> (callback id, max_age)
         self.auth_key = None
 
-        self.response_expected = [Device.RESPONSE_EXPECTED_INVALID_FUNCTION_ID] * 256
-        self.response_expected[IPConnection.FUNCTION_ENUMERATE] = Device.RESPONSE_EXPECTED_ALWAYS_FALSE
-        self.response_expected[IPConnection.FUNCTION_ADC_CALIBRATE] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_GET_ADC_CALIBRATION] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_READ_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_WRITE_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_READ_BRICKLET_PLUGIN] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_WRITE_BRICKLET_PLUGIN] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.CALLBACK_ENUMERATE] = Device.RESPONSE_EXPECTED_ALWAYS_FALSE
+        # shared with all other instances of the class until changed by
+        # set_response_expected or set_response_expected_all
+        self.response_expected = self.__class__.get_shared_response_expected()
 
-        ipcon.devices[self.uid] = self # FIXME: maybe use a weakref here
+        # the IP Connection only holds a weak reference, the device object
+        # is removed from it when it is garbage collected or released
+        ipcon.devices[self.uid] = self
 
     def get_api_version(self):
         """
@@ -146,6 +405,62 @@ class Device:
 
         return self.api_version
 
+    @classmethod
+    def get_shared_response_expected(cls):
+        # built on the first instance of each class. a concurrent first
+        # instance might build it twice, that is harmless
+        table = cls.__dict__.get('shared_response_expected')
+
+        if table is None:
+            table = [Device.RESPONSE_EXPECTED_INVALID_FUNCTION_ID] * 256
+            table[IPConnection.FUNCTION_ENUMERATE] = Device.RESPONSE_EXPECTED_ALWAYS_FALSE
+            table[IPConnection.FUNCTION_ADC_CALIBRATE] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.FUNCTION_GET_ADC_CALIBRATION] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.FUNCTION_READ_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.FUNCTION_WRITE_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.FUNCTION_READ_BRICKLET_PLUGIN] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.FUNCTION_WRITE_BRICKLET_PLUGIN] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+            table[IPConnection.CALLBACK_ENUMERATE] = Device.RESPONSE_EXPECTED_ALWAYS_FALSE
+
+            for function_id, flag in cls.response_expected_defaults.items():
+                table[function_id] = flag
+
+            cls.shared_response_expected = table
+
+        return table
+
+    def release(self):
+        """
+        Removes the device object from its IP Connection and drops its
+        registered callbacks, batches, caches and state getters. Callbacks
+        and responses for this device object are ignored afterwards, it
+        cannot be used anymore.
+
+        This happens implicitly when the device object is garbage collected,
+        release allows to do it deterministically, for example when the
+        device was enumerated as disconnected.
+        """
+
+        devices = self.ipcon.devices
+
+        if devices.get(self.uid) is self:
+            # another device object with the same UID might have been
+            # created since, keep that one
+            devices.pop(self.uid, None)
+
+            if self.ipcon.state_store is not None:
+                self.ipcon.state_store.remove(self.uid)
+
+        if self.getter_cache is not None:
+            # a getter call in flight must not store its result anymore
+            self.getter_cache.clear()
+
+        self.registered_callbacks = {}
+        self.registered_batches = Device.NO_ENTRIES
+        self.write_combining = Device.NO_ENTRIES
+        self.getter_cache = None
+        self.state_getters = Device.NO_ENTRIES
+
     def get_response_expected(self, function_id):
         """
         Returns the response expected flag for the function specified by the
@@ -201,6 +516,9 @@ class Device:
         if flag in [Device.RESPONSE_EXPECTED_ALWAYS_TRUE, Device.RESPONSE_EXPECTED_ALWAYS_FALSE]:
             raise ValueError('Response Expected flag cannot be changed for function ID {0}'.format(function_id))
 
+        if self.response_expected is self.__class__.shared_response_expected:
+            self.response_expected = list(self.response_expected)
+
         if bool(response_expected):
             self.response_expected[function_id] = Device.RESPONSE_EXPECTED_TRUE
         else:
@@ -217,209 +535,1930 @@ class Device:
         else:
             flag = Device.RESPONSE_EXPECTED_FALSE
 
+        if self.response_expected is self.__class__.shared_response_expected:
+            self.response_expected = list(self.response_expected)
+
         for i in range(len(self.response_expected)):
             if self.response_expected[i] in [Device.RESPONSE_EXPECTED_TRUE, Device.RESPONSE_EXPECTED_FALSE]:
                 self.response_expected[i] = flag
 
-class IPConnection:
-    FUNCTION_ENUMERATE = 254
-    FUNCTION_ADC_CALIBRATE = 251
-    FUNCTION_GET_ADC_CALIBRATION = 250
-    FUNCTION_READ_BRICKLET_UID = 249
-    FUNCTION_WRITE_BRICKLET_UID = 248
-    FUNCTION_READ_BRICKLET_PLUGIN = 247
-    FUNCTION_WRITE_BRICKLET_PLUGIN = 246
+    def set_write_combining(self, function_id, interval, index_count=0):
+        """
+        Enables write combining for the setter function specified by the
+        *function_id* parameter, while its response expected flag is
+        disabled. Calls of the setter are then sent at most every
+        *interval* seconds. A call within the interval is held back and
+        replaced by later calls, so the device only gets the latest value
+        once the interval is over. This is useful for setters that are
+        called from slider movements.
+
+        The first *index_count* parameters of the setter select what is
+        set, for example the servo number, calls with different values for
+        these parameters don't replace each other. An *interval* of 0
+        disables write combining.
+        """
 
-    CALLBACK_ENUMERATE = 253
-    CALLBACK_CONNECTED = 0
-    CALLBACK_DISCONNECTED = 1
+        if function_id < 0 or function_id >= len(self.response_expected):
+            raise ValueError('Function ID {0} out of range'.format(function_id))
 
-    BROADCAST_UID = 0
+        if self.response_expected[function_id] not in [Device.RESPONSE_EXPECTED_TRUE, Device.RESPONSE_EXPECTED_FALSE]:
+            raise ValueError('Write combining is only possible for setter functions, not for function ID {0}'.format(function_id))
 
-    PLUGIN_CHUNK_SIZE = 32
+        interval = float(interval)
 
-    # enumeration_type parameter to the enumerate callback
-    ENUMERATION_TYPE_AVAILABLE = 0
-    ENUMERATION_TYPE_CONNECTED = 1
-    ENUMERATION_TYPE_DISCONNECTED = 2
+        if interval < 0:
+            raise ValueError('Interval cannot be negative')
 
-    # connect_reason parameter to the connected callback
-    CONNECT_REASON_REQUEST = 0
-    CONNECT_REASON_AUTO_RECONNECT = 1
+        if interval == 0:
+            self.write_combining.pop(function_id, None)
+        else:
+            if self.write_combining is Device.NO_ENTRIES:
+                self.write_combining = {}
 
-    # disconnect_reason parameter to the disconnected callback
-    DISCONNECT_REASON_REQUEST = 0
-    DISCONNECT_REASON_ERROR = 1
-    DISCONNECT_REASON_SHUTDOWN = 2
+            self.write_combining[function_id] = (interval, int(index_count))
 
-    # returned by get_connection_state
-    CONNECTION_STATE_DISCONNECTED = 0
-    CONNECTION_STATE_CONNECTED = 1
-    CONNECTION_STATE_PENDING = 2 # auto-reconnect in process
+    def get_write_combining(self, function_id):
+        """
+        Returns the interval and index count as set by set_write_combining,
+        the interval is 0 if write combining is disabled.
+        """
 
-    QUEUE_EXIT = 0
-    QUEUE_META = 1
-    QUEUE_PACKET = 2
+        return self.write_combining.get(function_id, (0, 0))
 
-    def __init__(self):
+    def set_getter_cache(self, function_id, ttl, setter_function_ids=None):
         """
-        Creates an IP Connection object that can be used to enumerate the available
-        devices. It is also required for the constructor of Bricks and Bricklets.
+        Enables caching of the results of the getter function specified by
+        the *function_id* parameter. A result is returned from the cache
+        for *ttl* seconds, for each combination of getter parameters. An
+        *ttl* of 0 disables caching.
+
+        Cached results are invalidated if one of the setter functions
+        *setter_function_ids* is called. By default this is the setter with
+        the same name as the getter, for example FUNCTION_SET_DEBOUNCE_PERIOD
+        for FUNCTION_GET_DEBOUNCE_PERIOD. All cached results are invalidated
+        on (auto-)reconnect and if the device is enumerated as connected or
+        disconnected, because it was reset then.
+
+        Only the blocking getters use the cache, the *_async getters always
+        send a request.
         """
 
-        self.host = None
-        self.port = None
-        self.timeout = 2.5
-        self.auto_reconnect = True
-        self.auto_reconnect_allowed = False
-        self.auto_reconnect_pending = False
-        self.sequence_number_lock = Lock()
-        self.next_sequence_number = 0
-        self.auth_key = None
-        self.devices = {}
-        self.registered_callbacks = {}
-        self.socket = None
-        self.socket_lock = Lock()
-        self.receive_flag = False
-        self.receive_thread = None
-        self.callback_queue = None
-        self.callback_thread = None
-        self.waiter = Semaphore()
+        if function_id < 0 or function_id >= len(self.response_expected):
+            raise ValueError('Function ID {0} out of range'.format(function_id))
 
-    def connect(self, host, port):
+        if self.response_expected[function_id] != Device.RESPONSE_EXPECTED_ALWAYS_TRUE:
+            raise ValueError('Caching is only possible for getter functions, not for function ID {0}'.format(function_id))
+
+        ttl = float(ttl)
+
+        if ttl < 0:
+            raise ValueError('TTL cannot be negative')
+
+        if setter_function_ids is None:
+            setter_function_ids = []
+
+            for name in dir(self):
+                if name.startswith('FUNCTION_GET_') and getattr(self, name) == function_id:
+                    setter_name = 'FUNCTION_SET_' + name[len('FUNCTION_GET_'):]
+
+                    if hasattr(self, setter_name):
+                        setter_function_ids.append(getattr(self, setter_name))
+
+        if self.getter_cache is None:
+            self.getter_cache = GetterCache()
+
+        self.getter_cache.configure(function_id, ttl, setter_function_ids)
+
+    def get_getter_cache_statistics(self):
+        """
+        Returns the number of getter calls that were answered by the cache
+        (hits) and that had to send a request (misses).
         """
-        Creates a TCP/IP connection to the given *host* and *port*. The host
-        and port can point to a Brick Daemon or to a WIFI/Ethernet Extension.
 
-        Devices can only be controlled when the connection was established
-        successfully.
+        if self.getter_cache is None:
+            return 0, 0
 
-        Blocks until the connection is established and throws an exception if
-        there is no Brick Daemon or WIFI/Ethernet Extension listening at the
-        given host and port.
+        return self.getter_cache.hits, self.getter_cache.misses
+
+    def set_getter_from_state(self, function_id, max_age, callback_id=None):
+        """
+        Lets the getter function specified by the *function_id* parameter
+        return the latest value of the callback *callback_id* from the state
+        store of the IP Connection, if that value is not older than
+        *max_age* seconds. By default this is the callback with the same
+        name as the getter, for example CALLBACK_TEMPERATURE for
+        FUNCTION_GET_TEMPERATURE. A request is only sent if there is no
+        recent enough value. A *max_age* of 0 disables this.
+
+        Only the blocking getters use the state store, the *_async getters
+        always send a request. See IPConnection.get_state_store.
         """
 
-        with self.socket_lock:
-            if self.socket is not None:
-                raise Error(Error.ALREADY_CONNECTED,
-                            'Already connected to {0}:{1}'.format(self.host, self.port))
+        if function_id < 0 or function_id >= len(self.response_expected):
+            raise ValueError('Function ID {0} out of range'.format(function_id))
 
-            self.host = host
-            self.port = port
+        if self.response_expected[function_id] != Device.RESPONSE_EXPECTED_ALWAYS_TRUE:
+            raise ValueError('Only getter functions can return callback values, not function ID {0}'.format(function_id))
 
-            self.connect_unlocked(False)
+        max_age = float(max_age)
 
-    def disconnect(self):
+        if max_age < 0:
+            raise ValueError('Maximum age cannot be negative')
+
+        if max_age == 0:
+            self.state_getters.pop(function_id, None)
+            return
+
+        if callback_id is None:
+            for name in dir(self):
+                if name.startswith('FUNCTION_GET_') and getattr(self, name) == function_id:
+                    callback_name = 'CALLBACK_' + name[len('FUNCTION_GET_'):]
+
+                    if hasattr(self, callback_name):
+                        callback_id = getattr(self, callback_name)
+
+        if callback_id not in self.callback_formats:
+            raise ValueError('No matching callback for function ID {0}'.format(function_id))
+
+        self.ipcon.get_state_store(self, callback_id)
+
+        if self.state_getters is Device.NO_ENTRIES:
+            self.state_getters = {}
+
+        self.state_getters[function_id] = (callback_id, max_age)
+
+    def register_timestamped_callback(self, id, callback):
         """
-        Disconnects the TCP/IP connection from the Brick Daemon or the
-        WIFI/Ethernet Extension.
+        Registers a callback with ID *id* to the function *callback*. In
+        addition to the callback values the function gets the arrival time
+        of the callback as keyword argument *timestamp*, in seconds of the
+        monotonic clock returned by ip_connection.monotonic().
         """
 
-        with self.socket_lock:
-            self.auto_reconnect_allowed = False
+        self.registered_callbacks[id] = TimestampedCallback(callback)
 
-            if self.auto_reconnect_pending:
-                # abort potentially pending auto reconnect
-                self.auto_reconnect_pending = False
+    def register_batch_callback(self, id, callback, size=100, interval=0.1):
+        """
+        Registers the callback with ID *id* in batch mode. Instead of calling
+        *callback* for every value, the values are collected and passed to
+        it as callback(values, timestamps) once *size* values are collected
+        or *interval* seconds after the first value of the batch arrived.
+
+        *values* is a NumPy structured array with one field per callback
+        parameter, named f0, f1, ... *timestamps* is a NumPy array with the
+        arrival time of each value, as returned by ip_connection.monotonic().
+
+        A callback registered with register_callback takes precedence over
+        a batch callback with the same ID. Requires NumPy.
+        """
+
+        if numpy is None:
+            raise Error(Error.NOT_SUPPORTED, 'Batch callbacks require NumPy')
+
+        if id not in self.callback_formats or len(self.callback_formats[id]) == 0:
+            raise Error(Error.INVALID_PARAMETER, 'Callback {0} has no values to batch'.format(id))
+
+        size = int(size)
+
+        if size < 1:
+            raise ValueError('Batch size cannot be smaller than 1')
+
+        if self.registered_batches is Device.NO_ENTRIES:
+            self.registered_batches = {}
+
+        self.registered_batches[id] = CallbackBatch(self, callback, self.callback_formats[id], size, float(interval))
+
+    def unregister_batch_callback(self, id):
+        """
+        Unregisters the batch callback with ID *id*. Values that are not
+        delivered yet are discarded.
+        """
+
+        self.registered_batches.pop(id, None)
+
+class GetterCache:
+    """
+    Results of cacheable getters of a device, see Device.set_getter_cache.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.ttls = {} # getter function_id -> ttl
+        self.invalidations = {} # setter function_id -> set of getter function_ids
+        self.entries = {} # (getter function_id, data) -> (expiry, result)
+        self.generation = 0 # increased on every invalidation
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, function_id, ttl, setter_function_ids):
+        with self.lock:
+            for getter_function_ids in self.invalidations.values():
+                getter_function_ids.discard(function_id)
+
+            if ttl > 0:
+                self.ttls[function_id] = ttl
+
+                for setter_function_id in setter_function_ids:
+                    self.invalidations.setdefault(setter_function_id, set()).add(function_id)
             else:
-                if self.socket is None:
-                    raise Error(Error.NOT_CONNECTED, 'Not connected')
+                self.ttls.pop(function_id, None)
 
-                # end receive thread
-                self.receive_flag = False
+            self.invalidate_unlocked(set([function_id]))
 
-                try:
-                    self.socket.shutdown(socket.SHUT_RDWR)
-                except socket.error:
-                    pass
+    def lookup(self, function_id, data):
+        # returns (True, result) for a hit, otherwise (False, generation)
+        # to be passed to store
+        with self.lock:
+            try:
+                entry = self.entries.get((function_id, data))
+            except TypeError:
+                return False, None # parameters are not hashable, don't cache
+
+            if entry is not None and entry[0] > monotonic():
+                self.hits += 1
+                return True, entry[1]
+
+            self.misses += 1
+            return False, self.generation
+
+    def store(self, function_id, data, result, generation):
+        with self.lock:
+            # don't store a result that was requested before an invalidation
+            if generation is not None and generation == self.generation and function_id in self.ttls:
+                self.entries[(function_id, data)] = (monotonic() + self.ttls[function_id], result)
+
+    def invalidate(self, setter_function_id):
+        with self.lock:
+            self.invalidate_unlocked(self.invalidations.get(setter_function_id))
+
+    def invalidate_unlocked(self, getter_function_ids):
+        # NOTE: assumes that lock is locked
+        if not getter_function_ids:
+            return
 
-                if self.receive_thread is not None:
-                    self.receive_thread.join() # FIXME: use a timeout?
+        self.generation += 1
 
-                self.receive_thread = None
+        for key in list(self.entries.keys()):
+            if key[0] in getter_function_ids:
+                del self.entries[key]
 
-                # close socket
-                self.socket.close()
-                self.socket = None
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries = {}
 
-            # end callback thread
-            callback_queue = self.callback_queue
-            callback_thread = self.callback_thread
+class DeviceStateStore:
+    """
+    Latest value and arrival time of the device callbacks that were added
+    to the store, see IPConnection.get_state_store. The receive thread only
+    records the packets, they are decoded on lookup.
+    """
 
-            self.callback_queue = None
-            self.callback_thread = None
+    def __init__(self):
+        self.entries = {} # (uid, function_id) -> (packet, timestamp, form)
+        self.recorded = set() # (uid, function_id) of the callbacks to record
 
-        # do this outside of socket_lock to allow calling (dis-)connect from
-        # the callbacks while blocking on the join call here
-        callback_queue.put((IPConnection.QUEUE_META,
-                            (IPConnection.CALLBACK_DISCONNECTED,
-                             IPConnection.DISCONNECT_REASON_REQUEST)))
-        callback_queue.put((IPConnection.QUEUE_EXIT, None))
+    def add(self, uid, function_id):
+        # adding to a set is atomic, no lock required
+        self.recorded.add((self.get_numeric_uid(uid), function_id))
+
+    def remove(self, uid):
+        # stops recording the callbacks of a released device and drops its
+        # values. popping single items is atomic, no lock required
+        uid = self.get_numeric_uid(uid)
+
+        for key in list(self.recorded):
+            if key[0] == uid:
+                self.recorded.discard(key)
+
+        for key in list(self.entries):
+            if key[0] == uid:
+                self.entries.pop(key, None)
+
+    def update(self, uid, function_id, packet, timestamp, form):
+        # replacing a dict item is atomic, no lock required
+        self.entries[(uid, function_id)] = (packet, timestamp, form)
+
+    def get(self, uid, function_id):
+        """
+        Returns the latest values of the callback *function_id* of the
+        device with UID *uid* and their arrival time, as returned by
+        ip_connection.monotonic(). Returns None if the callback was not
+        received yet. Callbacks with more than one value return their
+        values as list.
+        """
+
+        entry = self.entries.get((self.get_numeric_uid(uid), function_id))
+
+        if entry is None:
+            return None
+
+        packet, timestamp, form = entry
+
+        return DeviceState(get_codec('', form).unpack_response(packet), timestamp)
+
+    def get_age(self, uid, function_id):
+        """
+        Returns the time in seconds since the latest value of the callback
+        *function_id* of the device with UID *uid* arrived, or None if the
+        callback was not received yet.
+        """
+
+        entry = self.entries.get((self.get_numeric_uid(uid), function_id))
+
+        if entry is None:
+            return None
+
+        return monotonic() - entry[1]
+
+    def get_numeric_uid(self, uid):
+        # UIDs can be given as string or as number, like Device.uid
+        if isinstance(uid, numbers.Integral):
+            return uid
+
+        uid = base58decode(uid)
+
+        if uid > 0xFFFFFFFF:
+            uid = uid64_to_uid32(uid)
+
+        return uid
+
+    def clear(self):
+        self.entries = {}
+
+class TimestampedCallback:
+    """
+    Callback function registered with Device.register_timestamped_callback.
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def dispatch(self, codec, packet):
+        timestamp = get_timestamp_from_data(packet)
+
+        if len(codec.response.fields) == 0:
+            return self.function(timestamp=timestamp)
+        elif len(codec.response.fields) == 1:
+            return self.function(codec.unpack_response(packet), timestamp=timestamp)
+        else:
+            return self.function(*codec.unpack_response(packet), timestamp=timestamp)
+
+class CallbackBatch:
+    """
+    Collects the payloads of a callback in the receive thread and passes
+    them as NumPy array to the callback thread, see
+    Device.register_batch_callback.
+    """
+
+    def __init__(self, device, callback, form, size, interval):
+        self.device = device
+        self.callback = callback
+        self.dtype = get_numpy_dtype(form)
+        self.size = size
+        self.interval = interval
+        self.lock = Lock()
+        self.payloads = bytearray() # protected by lock
+        self.timestamps = [] # protected by lock
+        self.generation = 0 # protected by lock
+
+    def add(self, packet, timestamp):
+        with self.lock:
+            self.payloads += packet[8:]
+            self.timestamps.append(timestamp)
+            count = len(self.timestamps)
+
+            if count >= self.size:
+                batch = self.take()
+            else:
+                if count == 1 and self.interval > 0:
+                    self.device.ipcon.batch_flusher.schedule(self, self.generation, self.interval)
+
+                return
+
+        self.deliver(batch)
+
+    def expire(self, generation):
+        with self.lock:
+            if generation != self.generation or len(self.timestamps) == 0:
+                return # already delivered because the batch was full
+
+            batch = self.take()
+
+        self.deliver(batch)
+
+    def take(self):
+        # NOTE: assumes that lock is locked
+        batch = (self.device.uid, self, self.payloads, self.timestamps)
+
+        self.payloads = bytearray()
+        self.timestamps = []
+        self.generation += 1
+
+        return batch
+
+    def deliver(self, batch):
+        callback_queue = self.device.ipcon.callback_queue
+
+        if callback_queue is not None:
+            callback_queue.put((IPConnection.QUEUE_BATCH, batch))
+
+    def dispatch(self, payloads, timestamps):
+        return self.callback(numpy.frombuffer(payloads, self.dtype),
+                             numpy.array(timestamps))
+
+class BatchFlusher:
+    """
+    Delivers the callback batches that did not get full within their
+    interval, see Device.register_batch_callback. A single thread serves
+    all batches of an IP Connection, it is started with the first batch.
+    """
+
+    def __init__(self):
+        self.condition = Condition(Lock())
+        self.deadlines = [] # heap of (deadline, counter, batch, generation), protected by condition
+        self.counter = 0 # tie breaker for equal deadlines, protected by condition
+        self.thread = None
+
+    def schedule(self, batch, generation, interval):
+        with self.condition:
+            self.counter += 1
+            heapq.heappush(self.deadlines, (monotonic() + interval, self.counter, batch, generation))
+
+            if self.thread is None:
+                self.thread = Thread(name='Batch-Flusher', target=self.loop)
+                self.thread.daemon = True
+                self.thread.start()
+
+            self.condition.notify()
+
+    def loop(self):
+        while True:
+            with self.condition:
+                while True:
+                    if len(self.deadlines) == 0:
+                        self.condition.wait()
+                        continue
+
+                    timeout = self.deadlines[0][0] - monotonic()
+
+                    if timeout <= 0:
+                        break
+
+                    self.condition.wait(timeout)
+
+                _, _, batch, generation = heapq.heappop(self.deadlines)
+
+            # a batch that got full in the meantime ignores the outdated
+            # generation
+            batch.expire(generation)
+
+class Future:
+    """
+    Result of a request sent with send_request_async. The future is
+    completed by the receive thread as soon as the response arrives.
+    """
+
+    def __init__(self, ipcon, function_id, codec, result_type, deadline):
+        self.ipcon = ipcon
+        self.function_id = function_id
+        self.codec = codec
+        self.result_type = result_type
+        self.deadline = deadline
+        self.key = None # set while the request is in IPConnection.pending_requests
+        self.lock = Lock()
+        self.event = Event()
+        self.response = None
+        self.error = None
+        self.timestamp = None # arrival time of the response
+        self.statistics = None # (send time, round trip key, uid) if statistics are enabled
+        self.done_callbacks = []
+
+    def complete(self, response, error):
+        with self.lock:
+            if self.event.is_set():
+                return
+
+            self.response = response
+            self.error = error
+            self.event.set()
+
+            done_callbacks = self.done_callbacks
+            self.done_callbacks = None
+
+        for done_callback in done_callbacks:
+            try:
+                done_callback(self)
+            except:
+                traceback.print_exc()
+
+    def done(self):
+        """
+        Returns *true* if the response arrived or the request failed.
+        """
+
+        return self.event.is_set()
+
+    def add_done_callback(self, done_callback):
+        """
+        Adds a function that is called with the future as parameter when
+        the future gets completed. If the future is already completed then
+        the function is called immediately.
+
+        The function is typically called from the receive thread. It must
+        not block and it must not call blocking getters.
+        """
+
+        with self.lock:
+            if not self.event.is_set():
+                self.done_callbacks.append(done_callback)
+                return
+
+        done_callback(self)
+
+    def wait(self, timeout=None):
+        # without a timeout, wait until the IP Connection timeout expires
+        if timeout is None:
+            timeout = self.deadline - monotonic()
+
+        if timeout > 0:
+            self.event.wait(timeout)
+
+        if not self.event.is_set() and self.deadline <= monotonic():
+            self.ipcon.expire_pending_request(self)
+
+        return self.event.is_set()
+
+    def result(self, timeout=None):
+        """
+        Returns the result of the request. Blocks until the response
+        arrived, but at most until the IP Connection timeout for this
+        request expired or for *timeout* seconds, if given. Raises the same
+        errors as the blocking getters do.
+        """
+
+        if not self.wait(timeout):
+            msg = 'Did not receive response for function {0} in time'.format(self.function_id)
+            raise Error(Error.TIMEOUT, msg)
+
+        if self.error is not None:
+            raise self.error
+
+        if self.response is None:
+            # no response expected
+            return None
+
+        error_code = get_error_code_from_data(self.response)
+
+        if error_code == 0:
+            # no error
+            pass
+        elif error_code == 1:
+            msg = 'Got invalid parameter for function {0}'.format(self.function_id)
+            raise Error(Error.INVALID_PARAMETER, msg)
+        elif error_code == 2:
+            msg = 'Function {0} is not supported'.format(self.function_id)
+            raise Error(Error.NOT_SUPPORTED, msg)
+        else:
+            msg = 'Function {0} returned an unknown error'.format(self.function_id)
+            raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+
+        if len(self.codec.response.fields) == 0:
+            return None
+
+        value = self.codec.unpack_response(self.response)
+
+        if self.result_type is not None:
+            return self.result_type(*value)
+
+        return value
+
+    def exception(self, timeout=None):
+        """
+        Returns the error raised by result or *None* if the request
+        succeeded.
+        """
+
+        try:
+            self.result(timeout)
+        except Error:
+            return sys.exc_info()[1]
+
+        return None
+
+def gather_calls(calls, timeout=None):
+    """
+    Calls getters of many devices at once, also across several IP
+    Connections. *calls* is a list of (device, function, args) tuples,
+    where *function* is a getter of *device* or its name and *args* are
+    its parameters, *args* can be omitted for getters without parameters.
+
+    All requests are sent back-to-back before waiting for the responses,
+    so all calls together take about one round trip instead of one round
+    trip per call. Returns a list of CallResult(result, error) tuples in
+    the order of *calls*. *error* is None if the call succeeded, otherwise
+    it is the Error the getter would have raised, for example a timeout.
+
+    Waits at most *timeout* seconds in total, if given. Calls that are not
+    answered by then fail with a timeout error. Otherwise the timeouts of
+    the IP Connections apply.
+
+    Raises ValueError without sending any request if one of the functions
+    is no getter with an *_async variant, for example a setter.
+    """
+
+    # resolve all functions first, a bad call must not leave the requests
+    # of the calls before it in flight
+    resolved = []
+
+    for call in calls:
+        device, function = call[0], call[1]
+        args = call[2] if len(call) > 2 else ()
+
+        if callable(function):
+            function = function.__name__
+
+        async_function = getattr(device, function + '_async', None)
+
+        if async_function is None:
+            raise ValueError('Function {0} of {1} has no *_async variant'.format(function, device.__class__.__name__))
+
+        resolved.append((async_function, args))
+
+    if timeout is not None:
+        deadline = monotonic() + timeout
+
+    futures = []
+
+    for async_function, args in resolved:
+        try:
+            futures.append(async_function(*args))
+        except Error:
+            futures.append(sys.exc_info()[1])
+
+    results = []
+
+    for future in futures:
+        if isinstance(future, Error):
+            results.append(CallResult(None, future))
+            continue
+
+        if timeout is not None and not future.wait(max(deadline - monotonic(), 0)):
+            future.ipcon.expire_pending_request(future)
+
+        try:
+            results.append(CallResult(future.result(), None))
+        except Error:
+            results.append(CallResult(None, sys.exc_info()[1]))
+
+    return results
+
+class ReceiveBuffer:
+    """
+    Preallocated buffer that incoming data is received into. Complete
+    packets are framed in place and handed out as memoryview slices. If
+    the free space at the end of the buffer gets too small then the
+    remaining partial packet (less than 256 bytes) is moved to the front,
+    packets never wrap around the end of the buffer.
+    """
+
+    def __init__(self, size):
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self.start = 0 # offset of the first byte not framed yet
+        self.end = 0 # offset after the last received byte
+
+    def get_free_view(self):
+        if len(self.buffer) - self.end < 256 and self.start > 0:
+            pending = self.end - self.start
+            self.buffer[0:pending] = self.buffer[self.start:self.end]
+            self.start = 0
+            self.end = pending
+
+        return self.view[self.end:]
+
+    def frame(self, received, handle_packet):
+        # returns False if the stream is corrupted
+        self.end += received
+
+        while True:
+            if self.end - self.start < 8:
+                # Wait for complete header
+                break
+
+            length = get_length_from_data(self.view[self.start:])
+
+            if length < 8:
+                # the length byte is corrupted, there is no way to find
+                # the next packet boundary in the stream anymore
+                return False
+
+            if self.end - self.start < length:
+                # Wait for complete packet
+                break
+
+            handle_packet(self.view[self.start:self.start + length])
+
+            self.start += length
+
+        if self.start == self.end:
+            self.start = 0
+            self.end = 0
+
+        return True
+
+class SendQueue:
+    """
+    Collects outgoing packets for a short time window and writes them with
+    a single send_all call from a separate thread, see
+    IPConnection.set_send_window. Packets are queued without blocking, a
+    write error is reported by the next call to put.
+    """
+
+    def __init__(self, sock, window):
+        self.socket = sock
+        self.window = window
+        self.condition = Condition(Lock())
+        self.packets = [] # protected by condition
+        self.error = None # protected by condition
+        self.running = True # protected by condition
+        self.thread = Thread(name='Brickd-Sender', target=self.loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def put(self, packet):
+        with self.condition:
+            if self.error is not None:
+                raise self.error
+
+            if not self.running:
+                raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+            self.packets.append(packet)
+
+            if len(self.packets) == 1:
+                self.condition.notify()
+
+    def close(self):
+        # the packets that are still queued get written before the thread
+        # exits
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+        if current_thread() is not self.thread:
+            self.thread.join()
+
+    def loop(self):
+        while True:
+            with self.condition:
+                while self.running and len(self.packets) == 0:
+                    self.condition.wait()
+
+                if len(self.packets) == 0:
+                    return
+
+                running = self.running
+
+            if running:
+                # give more packets the chance to join this write
+                time.sleep(self.window)
+
+            with self.condition:
+                packets = self.packets
+                self.packets = []
+
+            try:
+                send_all(self.socket, b''.join(packets))
+            except socket.error:
+                with self.condition:
+                    self.error = Error(Error.NOT_CONNECTED,
+                                       'Could not send request: {0}'.format(sys.exc_info()[1]))
+                    self.packets = []
+
+                # the receive thread notices the shutdown and reports the
+                # disconnect, this also fails the pending requests
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except socket.error:
+                    pass
+
+                return
+
+class WriteCombiner:
+    """
+    Holds back calls of setters with write combining enabled, see
+    Device.set_write_combining. A call is sent directly if the last call
+    with the same key was sent at least one interval ago. Otherwise it is
+    kept as the pending call of its key, replacing an older pending call,
+    and sent by a separate thread when the interval is over. If that
+    thread fails to send a call then the next call is sent directly, so it
+    reports its own error if the connection is still broken. The held back
+    calls are dropped and the thread is stopped when the connection is
+    established or closed, see reset.
+    """
+
+    def __init__(self, ipcon):
+        self.ipcon = ipcon
+        self.condition = Condition(Lock())
+        self.entries = {} # key -> [next send time, pending request or None, interval], protected by condition
+        self.error = None # protected by condition
+        self.thread = None
+
+    def send(self, key, request, interval):
+        with self.condition:
+            now = monotonic()
+            entry = self.entries.get(key)
+
+            if self.error is not None or entry is None or (entry[1] is None and entry[0] <= now):
+                self.error = None
+                self.entries[key] = [now + interval, None, interval]
+            else:
+                entry[1] = request
+                entry[2] = interval
+
+                if self.thread is None:
+                    self.thread = Thread(name='Brickd-Write-Combiner', target=self.loop)
+                    self.thread.daemon = True
+                    self.thread.start()
+
+                self.condition.notify()
+
+                return
+
+        self.ipcon.send(request)
+
+    def reset(self):
+        # drops the held back calls and stops the thread, it is started
+        # again by the next held back call. the thread is not joined, it
+        # might wait for the socket_lock that the caller holds
+        with self.condition:
+            self.entries = {}
+            self.error = None
+            self.thread = None
+            self.condition.notify()
+
+    def loop(self):
+        while True:
+            due = []
+
+            with self.condition:
+                while len(due) == 0:
+                    if self.thread is not current_thread():
+                        return # stopped by reset
+
+                    now = monotonic()
+                    next_time = None
+
+                    for key, entry in list(self.entries.items()):
+                        if entry[0] <= now:
+                            if entry[1] is None:
+                                del self.entries[key] # idle since an interval
+                            else:
+                                due.append(entry[1])
+                                entry[0] = now + entry[2]
+                                entry[1] = None
+                        elif entry[1] is not None and (next_time is None or entry[0] < next_time):
+                            next_time = entry[0]
+
+                    if len(due) == 0:
+                        if next_time is None:
+                            self.condition.wait()
+                        else:
+                            self.condition.wait(next_time - now)
+
+            for request in due:
+                try:
+                    self.ipcon.send(request)
+                except Error:
+                    with self.condition:
+                        if self.thread is current_thread():
+                            self.error = sys.exc_info()[1]
+
+class ShardedCallbackQueue:
+    """
+    Stand-in for the callback queue that distributes the callbacks to
+    several callback threads by device UID. The callbacks of a device are
+    always dispatched by the same thread, in order. Meta callbacks and
+    enumerate callbacks are all dispatched by the first thread, in order,
+    because they go to the same callback function of the IP Connection.
+    """
+
+    def __init__(self, ipcon, count, maxsize):
+        self.queues = []
+        self.threads = []
+
+        for i in range(count):
+            queue = Queue(maxsize)
+            thread = Thread(name='Callback-Processor-{0}'.format(i),
+                            target=ipcon.callback_loop,
+                            args=(queue, ))
+            thread.daemon = True
+
+            self.queues.append(queue)
+            self.threads.append(thread)
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def put(self, item, block=True, timeout=None):
+        kind, data = item
+
+        if kind == IPConnection.QUEUE_PACKET:
+            if get_function_id_from_data(data) == IPConnection.CALLBACK_ENUMERATE:
+                uid = 0
+            else:
+                uid = get_uid_from_data(data)
+        elif kind == IPConnection.QUEUE_META:
+            uid = 0
+        elif kind == IPConnection.QUEUE_EXIT:
+            for queue in self.queues:
+                queue.put(item)
+            return
+        else:
+            # coalesced packets and batches start with the uid
+            uid = data[0]
+
+        self.queues[uid % len(self.queues)].put(item, block, timeout)
+
+    def join(self):
+        # a callback can disconnect the IP Connection, its thread cannot
+        # wait for itself in that case
+        for thread in self.threads:
+            if current_thread() is not thread:
+                thread.join()
+
+class LatencyHistogram:
+    """
+    Durations in buckets of powers of two microseconds. Percentiles are
+    reported as the upper bound of their bucket.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * 40
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration):
+        # frexp returns the exponent e with 2 ** (e - 1) <= x < 2 ** e
+        bucket = math.frexp(duration * 1000000.0)[1]
+
+        self.buckets[min(max(bucket, 0), len(self.buckets) - 1)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def percentile(self, fraction):
+        rank = fraction * self.count
+        seen = 0
+
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+
+            if seen >= rank and count > 0:
+                return min(2 ** bucket / 1000000.0, self.max)
+
+        return self.max
+
+    def get(self):
+        if self.count == 0:
+            return LatencyStatistics(0, 0.0, 0.0, 0.0, 0.0)
+
+        return LatencyStatistics(self.count, self.total / self.count,
+                                 self.percentile(0.5), self.percentile(0.99),
+                                 self.max)
+
+class StatisticsCollector:
+    """
+    Counters and histograms of an IP Connection, see
+    IPConnection.set_statistics_enabled. Only exists while enabled, the
+    hot paths just check for None otherwise.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.packets_in = 0 # protected by lock
+        self.bytes_in = 0 # protected by lock
+        self.packets_out = 0 # protected by lock
+        self.bytes_out = 0 # protected by lock
+        self.rate_time = monotonic() # protected by lock
+        self.rate_counters = (0, 0, 0, 0) # protected by lock
+        self.queue_times = deque() # enqueue times of the queued callbacks, oldest first
+        self.round_trips = {} # (device name, function_id) -> LatencyHistogram, protected by lock
+        self.callback_times = {} # (device name, function_id) -> LatencyHistogram, protected by lock
+        self.timeouts = {} # uid -> count, protected by lock
+
+    def count_in(self, length):
+        with self.lock:
+            self.packets_in += 1
+            self.bytes_in += length
+
+    def count_out(self, length):
+        with self.lock:
+            self.packets_out += 1
+            self.bytes_out += length
+
+    def callback_queued(self):
+        self.queue_times.append(monotonic())
+
+    def callback_dequeued(self):
+        # the queue of a callback thread is FIFO, but with several callback
+        # threads or a hub the dequeued callback might not be the oldest
+        # one. the age of the oldest callback is approximate then
+        try:
+            self.queue_times.popleft()
+        except IndexError:
+            pass # queued before statistics got enabled
+
+    def add_round_trip(self, key, duration):
+        with self.lock:
+            histogram = self.round_trips.get(key)
+
+            if histogram is None:
+                histogram = self.round_trips[key] = LatencyHistogram()
+
+            histogram.add(duration)
+
+    def add_callback_time(self, key, duration):
+        with self.lock:
+            histogram = self.callback_times.get(key)
+
+            if histogram is None:
+                histogram = self.callback_times[key] = LatencyHistogram()
+
+            histogram.add(duration)
+
+    def add_timeout(self, uid):
+        with self.lock:
+            self.timeouts[uid] = self.timeouts.get(uid, 0) + 1
+
+    def get(self):
+        now = monotonic()
+
+        try:
+            queue_age = now - self.queue_times[0]
+        except IndexError:
+            queue_age = 0.0
+
+        with self.lock:
+            counters = (self.packets_in, self.bytes_in, self.packets_out, self.bytes_out)
+            elapsed = max(now - self.rate_time, 1e-9)
+            rates = [(counter - last) / elapsed for counter, last in zip(counters, self.rate_counters)]
+
+            self.rate_time = now
+            self.rate_counters = counters
+
+            return Statistics(*(rates + list(counters) +
+                                [len(self.queue_times), queue_age,
+                                 dict((key, histogram.get()) for key, histogram in self.round_trips.items()),
+                                 dict((key, histogram.get()) for key, histogram in self.callback_times.items()),
+                                 dict(self.timeouts)]))
+
+class StatisticsLogger:
+    """
+    Logs a summary of the statistics of an IP Connection every *interval*
+    seconds with the logging module.
+    """
+
+    def __init__(self, ipcon, interval):
+        self.ipcon = ipcon
+        self.interval = interval
+        self.stopped = Event()
+        self.thread = Thread(name='Brickd-Statistics-Logger', target=self.loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def loop(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                statistics = self.ipcon.get_statistics()
+            except Error:
+                return # disabled in the meantime
+
+            logging.info(format_statistics(self.ipcon.host, self.ipcon.port, statistics))
+
+def format_statistics(host, port, statistics):
+    round_trip_count = 0
+    round_trip_p50 = 0.0
+    round_trip_p99 = 0.0
+
+    # the percentiles of the busiest function represent the connection
+    for latency in statistics.round_trips.values():
+        if latency.count > round_trip_count:
+            round_trip_count = latency.count
+            round_trip_p50 = latency.p50
+            round_trip_p99 = latency.p99
+
+    callback_time = sum([latency.mean * latency.count for latency in statistics.callback_times.values()])
+
+    return '{0}:{1}: in {2:.0f} packets/s {3:.0f} B/s, out {4:.0f} packets/s {5:.0f} B/s, ' \
+           'callback queue {6} ({7:.3f} s), round trip p50 {8:.3f} ms p99 {9:.3f} ms, ' \
+           'callbacks {10:.3f} s, timeouts {11}'.format(host, port,
+                                                        statistics.packets_in_per_second,
+                                                        statistics.bytes_in_per_second,
+                                                        statistics.packets_out_per_second,
+                                                        statistics.bytes_out_per_second,
+                                                        statistics.callback_queue_depth,
+                                                        statistics.callback_queue_age,
+                                                        round_trip_p50 * 1000.0,
+                                                        round_trip_p99 * 1000.0,
+                                                        callback_time,
+                                                        sum(statistics.timeouts.values()))
+
+# capture files start with the magic, followed by one record per packet:
+# the monotonic timestamp, the direction and the raw packet
+CAPTURE_MAGIC = b'BRICKCAP\x01'
+CAPTURE_RECORD_STRUCT = struct.Struct('<dB')
+
+class PacketCapture:
+    """
+    Capture file that the packets received and sent by an IP Connection
+    are written to, see IPConnection.start_capture.
+    """
+
+    def __init__(self, filename):
+        self.lock = Lock()
+        self.file = open(filename, 'wb')
+        self.file.write(CAPTURE_MAGIC)
+
+    def write(self, direction, timestamp, packet):
+        with self.lock:
+            # the receive thread might still hold on to a stopped capture
+            if not self.file.closed:
+                self.file.write(CAPTURE_RECORD_STRUCT.pack(timestamp, direction))
+                self.file.write(copy_data(packet))
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def read_capture(filename):
+    """
+    Yields (timestamp, direction, packet) for every packet in the capture
+    file *filename*, as written by IPConnection.start_capture.
+    """
+
+    with open(filename, 'rb') as f:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise Error(Error.INVALID_PARAMETER, '{0} is not a capture file'.format(filename))
+
+        while True:
+            record = f.read(CAPTURE_RECORD_STRUCT.size + 8)
+
+            if len(record) == 0:
+                return
+
+            if len(record) < CAPTURE_RECORD_STRUCT.size + 8:
+                raise Error(Error.INVALID_PARAMETER, 'Capture file {0} is truncated'.format(filename))
+
+            timestamp, direction = CAPTURE_RECORD_STRUCT.unpack_from(record)
+            header = record[CAPTURE_RECORD_STRUCT.size:]
+            payload = f.read(get_length_from_data(header) - 8)
+
+            if len(payload) < get_length_from_data(header) - 8:
+                raise Error(Error.INVALID_PARAMETER, 'Capture file {0} is truncated'.format(filename))
+
+            yield timestamp, direction, header + payload
+
+class ReconnectScheduler:
+    """
+    Starts the auto-reconnect attempts of all IP Connections at their due
+    time with a single thread. The connection attempts run in threads of
+    their own, see ReconnectAttempt, a slow connect never delays the
+    attempts of other IP Connections.
+    """
+
+    def __init__(self):
+        self.condition = Condition(Lock())
+        self.entries = [] # heap of (due time, sequence, ipcon, generation), protected by condition
+        self.sequence = 0 # protected by condition
+        self.thread = None # protected by condition
+
+    def schedule(self, ipcon, delay, generation):
+        with self.condition:
+            heapq.heappush(self.entries, (monotonic() + delay, self.sequence, ipcon, generation))
+            self.sequence += 1
+
+            if self.thread is None:
+                self.thread = Thread(name='Brickd-Reconnect-Scheduler', target=self.loop)
+                self.thread.daemon = True
+                self.thread.start()
+
+            self.condition.notify()
+
+    def loop(self):
+        while True:
+            with self.condition:
+                while len(self.entries) == 0 or self.entries[0][0] > monotonic():
+                    if len(self.entries) == 0:
+                        self.condition.wait()
+                    else:
+                        self.condition.wait(self.entries[0][0] - monotonic())
+
+                ipcon, generation = heapq.heappop(self.entries)[2:]
+
+            try:
+                ipcon.start_reconnect_attempt(generation)
+            except:
+                traceback.print_exc()
+
+reconnect_scheduler = ReconnectScheduler()
+
+class ReconnectAttempt:
+    """
+    Tries to connect to all given addresses in parallel. The first
+    established connection is handed to the IP Connection, the others are
+    closed again. If all fail then the next attempt is scheduled.
+    """
+
+    def __init__(self, ipcon, generation, addresses):
+        self.ipcon = ipcon
+        self.generation = generation
+        self.lock = Lock()
+        self.remaining = len(addresses) # protected by lock
+        self.finished = False # protected by lock
+
+        for address in addresses:
+            thread = Thread(name='Brickd-Reconnect', target=self.connect, args=(address, ))
+            thread.daemon = True
+            thread.start()
+
+    def connect(self, address):
+        sock = None
+
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # a timeout of 0 would make the connect non-blocking
+            sock.settimeout(max(self.ipcon.timeout, 0.1))
+            sock.connect(address)
+            sock.settimeout(None)
+        except:
+            if sock is not None:
+                sock.close()
+
+            sock = None
+
+        with self.lock:
+            self.remaining -= 1
+            winner = sock is not None and not self.finished
+            failed = self.remaining == 0 and not self.finished and sock is None
+
+            if winner or failed:
+                self.finished = True
+
+        if winner:
+            if not self.ipcon.finish_reconnect(self.generation, sock, address):
+                sock.close()
+        elif sock is not None:
+            sock.close()
+        elif failed:
+            self.ipcon.reconnect_failed(self.generation)
+
+class IPConnection:
+    FUNCTION_ENUMERATE = 254
+    FUNCTION_ADC_CALIBRATE = 251
+    FUNCTION_GET_ADC_CALIBRATION = 250
+    FUNCTION_READ_BRICKLET_UID = 249
+    FUNCTION_WRITE_BRICKLET_UID = 248
+    FUNCTION_READ_BRICKLET_PLUGIN = 247
+    FUNCTION_WRITE_BRICKLET_PLUGIN = 246
+
+    CALLBACK_ENUMERATE = 253
+    CALLBACK_CONNECTED = 0
+    CALLBACK_DISCONNECTED = 1
+
+    BROADCAST_UID = 0
+
+    PLUGIN_CHUNK_SIZE = 32
+
+    # enumeration_type parameter to the enumerate callback
+    ENUMERATION_TYPE_AVAILABLE = 0
+    ENUMERATION_TYPE_CONNECTED = 1
+    ENUMERATION_TYPE_DISCONNECTED = 2
+
+    # connect_reason parameter to the connected callback
+    CONNECT_REASON_REQUEST = 0
+    CONNECT_REASON_AUTO_RECONNECT = 1
+
+    # disconnect_reason parameter to the disconnected callback
+    DISCONNECT_REASON_REQUEST = 0
+    DISCONNECT_REASON_ERROR = 1
+    DISCONNECT_REASON_SHUTDOWN = 2
+
+    # returned by get_connection_state
+    CONNECTION_STATE_DISCONNECTED = 0
+    CONNECTION_STATE_CONNECTED = 1
+    CONNECTION_STATE_PENDING = 2 # auto-reconnect in process
+
+    # policy parameter to set_callback_queue_policy
+    CALLBACK_QUEUE_POLICY_UNBOUNDED = 0
+    CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK = 1
+    CALLBACK_QUEUE_POLICY_COALESCE = 2
+
+    QUEUE_EXIT = 0
+    QUEUE_META = 1
+    QUEUE_PACKET = 2
+    QUEUE_COALESCED_PACKET = 3
+    QUEUE_BATCH = 4
+
+    # receive socket timeout in seconds, overdue requests are completed
+    # with at most this delay if nothing is received
+    RECEIVE_TIMEOUT = 0.1
+
+    CAPTURE_DIRECTION_RECEIVED = 0
+    CAPTURE_DIRECTION_SENT = 1
+
+    def __init__(self, hub=None):
+        """
+        Creates an IP Connection object that can be used to enumerate the available
+        devices. It is also required for the constructor of Bricks and Bricklets.
+
+        If a ConnectionHub *hub* is given then the connection is served by
+        the I/O thread and the callback workers of the hub, instead of
+        starting its own receive and callback thread.
+        """
+
+        self.hub = hub
+        self.host = None
+        self.port = None
+        self.timeout = 2.5
+        self.auto_reconnect = True
+        self.auto_reconnect_allowed = False
+        self.auto_reconnect_pending = False
+        self.auto_reconnect_backoff = (0.1, 30.0) # minimum and maximum delay in seconds
+        self.auto_reconnect_hosts = [] # additional (host, port) tried in parallel
+        self.auto_reconnect_generation = 0 # protected by socket_lock
+        self.auto_reconnect_failures = 0 # protected by socket_lock
+        self.disconnect_time = 0.0
+        self.reconnect_attempts = 0
+        self.reconnects = 0 # protected by socket_lock
+        self.reconnect_latency_total = 0.0 # protected by socket_lock
+        self.reconnect_latency_last = 0.0 # protected by socket_lock
+        self.reconnect_latency_max = 0.0 # protected by socket_lock
+        self.sequence_number_lock = Lock()
+        self.next_sequence_number = 0
+        self.pending_requests = {} # protected by pending_requests_lock
+        self.pending_requests_lock = Lock()
+        self.pending_requests_released = Condition(self.pending_requests_lock)
+        self.next_request_deadline = float('inf') # protected by pending_requests_lock
+        self.auth_key = None
+        self.devices = weakref.WeakValueDictionary() # uid -> device, see Device.release
+        self.registered_callbacks = {}
+        self.socket = None
+        self.socket_lock = Lock()
+        self.send_window = 0
+        self.send_queue = None
+        self.write_combiner = WriteCombiner(self)
+        self.batch_flusher = BatchFlusher()
+        self.state_store = None # created by get_state_store
+        self.receive_buffer_size = 8192
+        self.receive_timestamp = 0.0 # arrival time of the packets handed to handle_response
+        self.receive_flag = False
+        self.receive_thread = None
+        self.callback_queue = None
+        self.callback_queue_policy = IPConnection.CALLBACK_QUEUE_POLICY_UNBOUNDED
+        self.callback_queue_size = 1000
+        self.callback_thread_count = 1
+        self.callback_thread = None
+        self.coalesced_packets = {} # protected by callback_statistics_lock
+        self.callback_statistics = {} # protected by callback_statistics_lock
+        self.callback_statistics_lock = Lock()
+        self.statistics = None # created by set_statistics_enabled
+        self.statistics_logger = None
+        self.capture = None # created by start_capture
+        self.replaying = False # protected by socket_lock
+        self.waiter = Semaphore()
+
+    def connect(self, host, port):
+        """
+        Creates a TCP/IP connection to the given *host* and *port*. The host
+        and port can point to a Brick Daemon or to a WIFI/Ethernet Extension.
+
+        Devices can only be controlled when the connection was established
+        successfully.
+
+        Blocks until the connection is established and throws an exception if
+        there is no Brick Daemon or WIFI/Ethernet Extension listening at the
+        given host and port.
+        """
+
+        with self.socket_lock:
+            if self.socket is not None:
+                raise Error(Error.ALREADY_CONNECTED,
+                            'Already connected to {0}:{1}'.format(self.host, self.port))
+
+            if self.replaying:
+                raise Error(Error.ALREADY_CONNECTED, 'Cannot connect while replaying a capture')
+
+            self.host = host
+            self.port = port
+
+            self.connect_unlocked(False)
+
+    def disconnect(self):
+        """
+        Disconnects the TCP/IP connection from the Brick Daemon or the
+        WIFI/Ethernet Extension.
+        """
+
+        with self.socket_lock:
+            self.auto_reconnect_allowed = False
+            self.auto_reconnect_generation += 1
+
+            if self.auto_reconnect_pending:
+                # abort potentially pending auto reconnect
+                self.auto_reconnect_pending = False
+            else:
+                if self.socket is None:
+                    raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+                self.close_send_queue()
+                self.write_combiner.reset()
+
+                # end receive thread
+                self.receive_flag = False
+
+                if self.hub is not None:
+                    self.hub.remove_connection(self)
+
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except socket.error:
+                    pass
+
+                if self.receive_thread is not None:
+                    self.receive_thread.join() # FIXME: use a timeout?
+
+                self.receive_thread = None
+
+                # close socket
+                self.socket.close()
+                self.socket = None
+
+            # end callback thread
+            callback_queue = self.callback_queue
+            callback_thread = self.callback_thread
+
+            self.callback_queue = None
+            self.callback_thread = None
+
+        # do this outside of socket_lock to allow calling (dis-)connect from
+        # the callbacks while blocking on the join call here
+        callback_queue.put((IPConnection.QUEUE_META,
+                            (IPConnection.CALLBACK_DISCONNECTED,
+                             IPConnection.DISCONNECT_REASON_REQUEST)))
+        callback_queue.put((IPConnection.QUEUE_EXIT, None))
+
+        self.join_callback_thread(callback_queue, callback_thread)
+
+    def get_connection_state(self):
+        """
+        Can return the following states:
+
+        - CONNECTION_STATE_DISCONNECTED: No connection is established.
+        - CONNECTION_STATE_CONNECTED: A connection to the Brick Daemon or
+          the WIFI/Ethernet Extension is established.
+        - CONNECTION_STATE_PENDING: IP Connection is currently trying to
+          connect.
+        """
+
+        if self.socket is not None:
+            return IPConnection.CONNECTION_STATE_CONNECTED
+        elif self.auto_reconnect_pending:
+            return IPConnection.CONNECTION_STATE_PENDING
+        else:
+            return IPConnection.CONNECTION_STATE_DISCONNECTED
+
+    def set_auto_reconnect(self, auto_reconnect):
+        """
+        Enables or disables auto-reconnect. If auto-reconnect is enabled,
+        the IP Connection will try to reconnect to the previously given
+        host and port, if the connection is lost.
+
+        Default value is *True*.
+        """
+
+        self.auto_reconnect = bool(auto_reconnect)
+
+        if not self.auto_reconnect:
+            # abort potentially pending auto reconnect
+            with self.socket_lock:
+                self.auto_reconnect_allowed = False
+                self.auto_reconnect_pending = False
+                self.auto_reconnect_generation += 1
+
+    def get_auto_reconnect(self):
+        """
+        Returns *true* if auto-reconnect is enabled, *false* otherwise.
+        """
+
+        return self.auto_reconnect
+
+    def set_auto_reconnect_backoff(self, minimum, maximum):
+        """
+        Sets the delay in seconds before the auto-reconnect attempts. The
+        first attempt is made after *minimum* seconds, the delay doubles
+        with every failed attempt up to *maximum* seconds. Each delay is
+        randomly shortened by up to half, so that many IP Connections
+        losing their connection at the same time don't all retry at once.
+
+        Default backoff is 0.1 to 30 seconds.
+        """
+
+        minimum = float(minimum)
+        maximum = float(maximum)
+
+        if minimum <= 0:
+            raise ValueError('Minimum auto-reconnect delay has to be positive')
+
+        if maximum < minimum:
+            raise ValueError('Maximum auto-reconnect delay cannot be smaller than the minimum')
+
+        self.auto_reconnect_backoff = (minimum, maximum)
+
+    def get_auto_reconnect_backoff(self):
+        """
+        Returns the minimum and maximum auto-reconnect delay as set by
+        set_auto_reconnect_backoff.
+        """
+
+        return self.auto_reconnect_backoff
+
+    def set_auto_reconnect_hosts(self, hosts):
+        """
+        Sets a list of additional (host, port) pairs, for example other
+        Brick Daemons or Extensions of the same stack. Auto-reconnect tries
+        them in parallel to the host and port given to connect, the first
+        one to accept the connection is used and becomes the host and port
+        of the IP Connection.
+
+        Default is an empty list.
+        """
+
+        self.auto_reconnect_hosts = [(str(host), int(port)) for host, port in hosts]
+
+    def get_auto_reconnect_hosts(self):
+        """
+        Returns the additional hosts as set by set_auto_reconnect_hosts.
+        """
+
+        return list(self.auto_reconnect_hosts)
+
+    def get_reconnect_statistics(self):
+        """
+        Returns the number of auto-reconnect attempts, the number of
+        successful auto-reconnects and the last, mean and maximum time in
+        seconds from the loss of the connection until it was
+        reestablished.
+        """
+
+        with self.socket_lock:
+            if self.reconnects > 0:
+                mean_latency = self.reconnect_latency_total / self.reconnects
+            else:
+                mean_latency = 0.0
+
+            return ReconnectStatistics(self.reconnect_attempts, self.reconnects,
+                                       self.reconnect_latency_last, mean_latency,
+                                       self.reconnect_latency_max)
+
+    def set_timeout(self, timeout):
+        """
+        Sets the timeout in seconds for getters and for setters for which the
+        response expected flag is activated.
+
+        Default timeout is 2.5.
+        """
+
+        timeout = float(timeout)
+
+        if timeout < 0:
+            raise ValueError('Timeout cannot be negative')
+
+        self.timeout = timeout
+
+    def get_timeout(self):
+        """
+        Returns the timeout as set by set_timeout.
+        """
+
+        return self.timeout
+
+    def set_receive_buffer_size(self, size):
+        """
+        Sets the size in bytes of the buffer that incoming data is received
+        into. A bigger buffer allows to receive bigger bursts of callbacks
+        with a single system call. The new size is used for the next
+        connection attempt.
+
+        Default size is 8192, the minimum size is 256.
+        """
+
+        size = int(size)
+
+        if size < 256:
+            raise ValueError('Receive buffer size cannot be smaller than 256 bytes')
+
+        self.receive_buffer_size = size
+
+    def get_receive_buffer_size(self):
+        """
+        Returns the receive buffer size as set by set_receive_buffer_size.
+        """
+
+        return self.receive_buffer_size
+
+    def set_send_window(self, window):
+        """
+        Sets the time window in microseconds to collect outgoing requests
+        in. If the window is greater than 0 then requests are queued and
+        written together by a separate thread, instead of writing each
+        request with its own system call. This reduces the number of TCP
+        packets for bursts of setter calls at the cost of up to *window*
+        microseconds of added latency. The new window is used for the next
+        connection attempt.
+
+        Default window is 0, requests are written directly.
+        """
+
+        window = int(window)
+
+        if window < 0:
+            raise ValueError('Send window cannot be negative')
+
+        self.send_window = window
+
+    def get_send_window(self):
+        """
+        Returns the send window as set by set_send_window.
+        """
+
+        return self.send_window
+
+    def set_callback_queue_policy(self, policy, size=1000):
+        """
+        Sets how callbacks are queued between the receive thread and the
+        callback thread, if the callback functions cannot keep up with the
+        devices:
+
+        - CALLBACK_QUEUE_POLICY_UNBOUNDED: All callbacks are queued, the
+          queue can grow without limit.
+        - CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK: At most *size* callbacks per
+          callback thread are queued, the receive thread waits for free
+          space. This also delays the responses to getters. With a
+          ConnectionHub the I/O thread of the hub doesn't wait, it stops
+          reading the socket of this IP Connection until half of its queued
+          callbacks are delivered, the other IP Connections of the hub are
+          not affected.
+        - CALLBACK_QUEUE_POLICY_COALESCE: Only the newest pending value of
+          each callback of each device is kept, older values are replaced.
+
+        The policy can only be changed while disconnected. Default policy is
+        CALLBACK_QUEUE_POLICY_UNBOUNDED.
+        """
+
+        if policy not in (IPConnection.CALLBACK_QUEUE_POLICY_UNBOUNDED,
+                          IPConnection.CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK,
+                          IPConnection.CALLBACK_QUEUE_POLICY_COALESCE):
+            raise ValueError('Unknown callback queue policy {0}'.format(policy))
+
+        size = int(size)
+
+        if size < 1:
+            raise ValueError('Callback queue size cannot be smaller than 1')
+
+        if self.callback_queue is not None:
+            raise Error(Error.ALREADY_CONNECTED,
+                        'Callback queue policy cannot be changed while connected')
+
+        self.callback_queue_policy = policy
+        self.callback_queue_size = size
+
+    def get_callback_queue_policy(self):
+        """
+        Returns the callback queue policy and size as set by
+        set_callback_queue_policy.
+        """
+
+        return self.callback_queue_policy, self.callback_queue_size
+
+    def set_callback_thread_count(self, count):
+        """
+        Sets the number of threads that call the callback functions. With
+        more than one thread the callbacks are distributed by device UID: a
+        slow callback function only delays other callbacks of the same
+        device and of the devices that share its thread. The callbacks of
+        each device are still called in order, the connected and
+        disconnected callbacks are called in order by the first thread.
+
+        The thread count can only be changed while disconnected and is
+        ignored if the IP Connection uses a ConnectionHub. Default thread
+        count is 1.
+        """
+
+        count = int(count)
+
+        if count < 1:
+            raise ValueError('At least one callback thread is required')
+
+        if self.callback_queue is not None:
+            raise Error(Error.ALREADY_CONNECTED,
+                        'Callback thread count cannot be changed while connected')
+
+        self.callback_thread_count = count
+
+    def get_callback_thread_count(self):
+        """
+        Returns the callback thread count as set by set_callback_thread_count.
+        """
+
+        return self.callback_thread_count
+
+    def get_state_store(self, device=None, function_id=None):
+        """
+        Returns the DeviceStateStore of this IP Connection. If a *device* and
+        the ID *function_id* of one of its callbacks are given then the
+        store records the latest value and arrival time of this callback
+        from now on. Only the callbacks added this way are recorded. Its get
+        function allows to look up the current state of a device without a
+        request.
+        """
+
+        if device is not None and function_id not in device.callback_formats:
+            raise ValueError('Function ID {0} is not a callback'.format(function_id))
+
+        if self.state_store is None:
+            self.state_store = DeviceStateStore()
+
+        if device is not None:
+            self.state_store.add(device.uid, function_id)
 
-        if current_thread() is not callback_thread:
-            callback_thread.join()
+        return self.state_store
 
-    def get_connection_state(self):
+    def get_callback_statistics(self):
         """
-        Can return the following states:
+        Returns a dict that maps (uid, function_id) of each callback that
+        lost values to the number of dropped and coalesced values.
 
-        - CONNECTION_STATE_DISCONNECTED: No connection is established.
-        - CONNECTION_STATE_CONNECTED: A connection to the Brick Daemon or
-          the WIFI/Ethernet Extension is established.
-        - CONNECTION_STATE_PENDING: IP Connection is currently trying to
-          connect.
+        Values are dropped if the connection is closed while they are still
+        queued. Values are coalesced if a newer value replaced them under
+        CALLBACK_QUEUE_POLICY_COALESCE.
         """
 
-        if self.socket is not None:
-            return IPConnection.CONNECTION_STATE_CONNECTED
-        elif self.auto_reconnect_pending:
-            return IPConnection.CONNECTION_STATE_PENDING
-        else:
-            return IPConnection.CONNECTION_STATE_DISCONNECTED
+        with self.callback_statistics_lock:
+            return dict((key, CallbackStatistics(*counters))
+                        for key, counters in self.callback_statistics.items())
 
-    def set_auto_reconnect(self, auto_reconnect):
+    def set_statistics_enabled(self, enabled, log_interval=0):
         """
-        Enables or disables auto-reconnect. If auto-reconnect is enabled,
-        the IP Connection will try to reconnect to the previously given
-        host and port, if the connection is lost.
+        Enables or disables the collection of statistics, see
+        get_statistics. Enabling resets all statistics. If *log_interval*
+        is greater than 0 then a summary is logged with the logging module
+        at level INFO every *log_interval* seconds.
 
-        Default value is *True*.
+        Statistics are disabled by default.
         """
 
-        self.auto_reconnect = bool(auto_reconnect)
+        log_interval = float(log_interval)
 
-        if not self.auto_reconnect:
-            # abort potentially pending auto reconnect
-            self.auto_reconnect_allowed = False
+        if log_interval < 0:
+            raise ValueError('Log interval cannot be negative')
 
-    def get_auto_reconnect(self):
+        if self.statistics_logger is not None:
+            self.statistics_logger.stop()
+            self.statistics_logger = None
+
+        if bool(enabled):
+            self.statistics = StatisticsCollector()
+
+            if log_interval > 0:
+                self.statistics_logger = StatisticsLogger(self, log_interval)
+        else:
+            self.statistics = None
+
+    def get_statistics(self):
         """
-        Returns *true* if auto-reconnect is enabled, *false* otherwise.
+        Returns the statistics collected since they were enabled:
+
+        - packets and bytes received and sent per second, averaged since
+          the previous call of get_statistics or log line, and in total
+        - the number of callbacks waiting in the callback queue and the
+          age in seconds of the oldest one
+        - a dict that maps (device class name, function_id) of each
+          function with a response to the count, mean, median, 99th
+          percentile and maximum of its round trip time in seconds
+        - a dict that maps (device class name, function_id) of each
+          callback to the same numbers for the time spent in its callback
+          function
+        - a dict that maps the UID of each device with timeouts to their
+          number
+
+        Raises an error if statistics are not enabled.
         """
 
-        return self.auto_reconnect
+        statistics = self.statistics
 
-    def set_timeout(self, timeout):
-        """
-        Sets the timeout in seconds for getters and for setters for which the
-        response expected flag is activated.
+        if statistics is None:
+            raise Error(Error.NOT_SUPPORTED, 'Statistics are not enabled')
 
-        Default timeout is 2.5.
+        return statistics.get()
+
+    def start_capture(self, filename):
+        """
+        Starts to write every packet that is received and sent to the
+        capture file *filename*, together with its direction and the
+        monotonic time it was received or sent at. A running capture is
+        stopped. The capture can be replayed with replay_capture.
         """
 
-        timeout = float(timeout)
+        capture = PacketCapture(filename)
 
-        if timeout < 0:
-            raise ValueError('Timeout cannot be negative')
+        self.stop_capture()
+        self.capture = capture
 
-        self.timeout = timeout
+    def stop_capture(self):
+        """
+        Stops the capture started by start_capture and closes its file.
+        """
 
-    def get_timeout(self):
+        capture = self.capture
+        self.capture = None
+
+        if capture is not None:
+            capture.close()
+
+    def replay_capture(self, filename, speed=1.0):
         """
-        Returns the timeout as set by set_timeout.
+        Feeds the received packets of the capture file *filename* to the IP
+        Connection as if they arrived from the devices again. Callbacks are
+        called and the state store is updated as usual, the sent packets
+        are skipped. The packets are replayed with their original timing
+        divided by *speed*, a *speed* of 0 replays them as fast as
+        possible.
+
+        The IP Connection must not be connected. Blocks until all callbacks
+        of the capture were called and returns the number of replayed
+        packets.
         """
 
-        return self.timeout
+        speed = float(speed)
+
+        if speed < 0:
+            raise ValueError('Speed cannot be negative')
+
+        with self.socket_lock:
+            if self.socket is not None or self.replaying:
+                raise Error(Error.ALREADY_CONNECTED, 'Cannot replay a capture while connected')
+
+            self.create_callback_queue()
+            self.replaying = True
+            self.receive_flag = True
+
+        count = 0
+
+        try:
+            first = None
+
+            for timestamp, direction, packet in read_capture(filename):
+                if direction != IPConnection.CAPTURE_DIRECTION_RECEIVED:
+                    continue
+
+                if speed > 0:
+                    if first is None:
+                        first = (monotonic(), timestamp)
+                    else:
+                        delay = first[0] + (timestamp - first[1]) / speed - monotonic()
+
+                        if delay > 0:
+                            time.sleep(delay)
+
+                self.receive_timestamp = monotonic()
+                self.handle_response(packet)
+                count += 1
+        finally:
+            with self.socket_lock:
+                callback_queue = self.callback_queue
+                callback_thread = self.callback_thread
+
+                self.callback_queue = None
+                self.callback_thread = None
+
+            # let the callback thread call the remaining callbacks before
+            # stopping it
+            callback_queue.put((IPConnection.QUEUE_EXIT, None))
+            self.join_callback_thread(callback_queue, callback_thread)
+
+            with self.socket_lock:
+                self.receive_flag = False
+                self.replaying = False
+
+        return count
 
     def enumerate(self):
         """
@@ -460,41 +2499,48 @@ class IPConnection:
 
         self.registered_callbacks[id] = callback
 
-    def connect_unlocked(self, is_auto_reconnect):
-        # NOTE: assumes that socket_lock is locked
+    def connect_unlocked(self, is_auto_reconnect, sock=None):
+        # NOTE: assumes that socket_lock is locked. *sock* is an already
+        # connected socket, used by the auto-reconnect attempts
+
+        self.create_callback_queue()
+        self.write_combiner.reset()
 
-        if self.callback_thread is None:
+        if sock is not None:
+            self.socket = sock
+        else:
             try:
-                self.callback_queue = Queue()
-                self.callback_thread = Thread(name='Callback-Processor',
-                                              target=self.callback_loop,
-                                              args=(self.callback_queue, ))
-                self.callback_thread.daemon = True
-                self.callback_thread.start()
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.socket.connect((self.host, self.port))
             except:
-                self.callback_queue = None
-                self.callback_thread = None
+                self.socket = None
                 raise
 
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            self.socket.connect((self.host, self.port))
-        except:
-            self.socket = None
-            raise
+            if self.send_window > 0:
+                self.send_queue = SendQueue(self.socket, self.send_window / 1000000.0)
 
-        try:
             self.receive_flag = True
-            self.receive_thread = Thread(name='Brickd-Receiver',
-                                         target=self.receive_loop)
-            self.receive_thread.daemon = True
-            self.receive_thread.start()
+
+            if self.hub is not None:
+                self.hub.add_connection(self)
+            else:
+                self.receive_thread = Thread(name='Brickd-Receiver',
+                                             target=self.receive_loop)
+                self.receive_thread.daemon = True
+                self.receive_thread.start()
         except:
             def cleanup():
+                self.close_send_queue()
+                self.write_combiner.reset()
+
                 # end receive thread
                 self.receive_flag = False
 
+                if self.hub is not None:
+                    self.hub.remove_connection(self)
+
                 try:
                     self.socket.shutdown(socket.SHUT_RDWR)
                 except socket.error:
@@ -513,8 +2559,7 @@ class IPConnection:
                 if not is_auto_reconnect:
                     self.callback_queue.put((IPConnection.QUEUE_EXIT, None))
 
-                    if current_thread() is not self.callback_thread:
-                        self.callback_thread.join()
+                    self.join_callback_thread(self.callback_queue, self.callback_thread)
 
                     self.callback_queue = None
                     self.callback_thread = None
@@ -525,6 +2570,9 @@ class IPConnection:
         self.auto_reconnect_allowed = False
         self.auto_reconnect_pending = False
 
+        # the devices could have been reset while there was no connection
+        self.clear_getter_caches()
+
         if is_auto_reconnect:
             connect_reason = IPConnection.CONNECT_REASON_AUTO_RECONNECT
         else:
@@ -534,49 +2582,101 @@ class IPConnection:
                                 (IPConnection.CALLBACK_CONNECTED,
                                  connect_reason)))
 
-    def receive_loop(self):
-        if sys.hexversion < 0x03000000:
-            pending_data = ''
-        else:
-            pending_data = bytes()
-
-        while self.receive_flag:
-            try:
-                data = self.socket.recv(8192)
-            except socket.error:
-                self.auto_reconnect_allowed = True
-                self.receive_flag = False
-                self.callback_queue.put((IPConnection.QUEUE_META,
-                                         (IPConnection.CALLBACK_DISCONNECTED,
-                                          IPConnection.DISCONNECT_REASON_ERROR)))
-                return
-
-            if len(data) == 0:
-                if self.receive_flag:
-                    self.auto_reconnect_allowed = True
-                    self.receive_flag = False
-                    self.callback_queue.put((IPConnection.QUEUE_META,
-                                             (IPConnection.CALLBACK_DISCONNECTED,
-                                              IPConnection.DISCONNECT_REASON_SHUTDOWN)))
-                return
-
-            pending_data += data
-
-            while True:
-                if len(pending_data) < 8:
-                    # Wait for complete header
-                    break
-
-                length = get_length_from_data(pending_data)
+    def create_callback_queue(self):
+        # NOTE: assumes that socket_lock is locked
 
-                if len(pending_data) < length:
-                    # Wait for complete packet
-                    break
+        if self.callback_queue is None and self.hub is not None:
+            self.callback_queue = self.hub.create_callback_lane(self)
+        elif self.callback_queue is None:
+            if self.callback_queue_policy == IPConnection.CALLBACK_QUEUE_POLICY_BOUNDED_BLOCK:
+                maxsize = self.callback_queue_size
+            else:
+                maxsize = 0
 
-                packet = pending_data[0:length]
-                pending_data = pending_data[length:]
+            try:
+                if self.callback_thread_count > 1:
+                    self.callback_queue = ShardedCallbackQueue(self, self.callback_thread_count, maxsize)
+                    self.callback_queue.start()
+                else:
+                    self.callback_queue = Queue(maxsize)
+                    self.callback_thread = Thread(name='Callback-Processor',
+                                                  target=self.callback_loop,
+                                                  args=(self.callback_queue, ))
+                    self.callback_thread.daemon = True
+                    self.callback_thread.start()
+            except:
+                self.callback_queue = None
+                self.callback_thread = None
+                raise
 
-                self.handle_response(packet)
+    def receive_loop(self):
+        try:
+            self.receive_packets()
+        finally:
+            # nobody is going to answer the requests that are still in
+            # flight, let them fail now instead of waiting for the timeout
+            self.fail_pending_requests(Error(Error.NOT_CONNECTED, 'Connection closed'))
+
+    def receive_packets(self):
+        receive_buffer = ReceiveBuffer(self.receive_buffer_size)
+
+        # wake up regularly if nothing is received, futures that are only
+        # observed by done callbacks have to time out on an idle connection
+        # too. the timeout is set once, like the sweep interval of the
+        # ConnectionHub, changing it for every recv would cost a syscall
+        self.socket.settimeout(IPConnection.RECEIVE_TIMEOUT)
+
+        while self.receive_flag and self.receive_into(receive_buffer):
+            pass
+
+    def receive_into(self, receive_buffer):
+        # receives and handles the next chunk of data. returns False if the
+        # connection got closed
+        try:
+            received = self.socket.recv_into(receive_buffer.get_free_view())
+        except socket.timeout:
+            # nothing received for a while, see receive_packets
+            if self.next_request_deadline <= monotonic():
+                self.expire_pending_requests()
+
+            return True
+        except socket.error:
+            self.queue_disconnected(IPConnection.DISCONNECT_REASON_ERROR)
+            return False
+
+        if received == 0:
+            if self.receive_flag:
+                self.queue_disconnected(IPConnection.DISCONNECT_REASON_SHUTDOWN)
+            return False
+
+        self.receive_timestamp = monotonic()
+
+        if not receive_buffer.frame(received, self.handle_response):
+            self.queue_disconnected(IPConnection.DISCONNECT_REASON_ERROR)
+            return False
+
+        # complete futures whose timeout expired without anybody
+        # waiting for them in result()
+        if self.next_request_deadline <= monotonic():
+            self.expire_pending_requests()
+
+        return True
+
+    def queue_disconnected(self, disconnect_reason):
+        self.disconnect_time = monotonic()
+        self.auto_reconnect_allowed = True
+        self.receive_flag = False
+        self.callback_queue.put((IPConnection.QUEUE_META,
+                                 (IPConnection.CALLBACK_DISCONNECTED,
+                                  disconnect_reason)))
+
+    def join_callback_thread(self, callback_queue, callback_thread):
+        # NOTE: assumes that QUEUE_EXIT was already put into callback_queue
+        if callback_thread is None:
+            # callback lane of a hub or sharded callback queue
+            callback_queue.join()
+        elif current_thread() is not callback_thread:
+            callback_thread.join()
 
     def dispatch_meta(self, function_id, parameter):
         if function_id == IPConnection.CALLBACK_CONNECTED:
@@ -589,73 +2689,142 @@ class IPConnection:
             # with a concurrent call to the (dis-)connect function
             with self.socket_lock:
                 if self.socket is not None:
+                    self.close_send_queue()
+                    self.write_combiner.reset()
                     self.socket.close()
                     self.socket = None
 
-            # FIXME: wait a moment here, otherwise the next connect
-            # attempt will succeed, even if there is no open server
-            # socket. the first receive will then fail directly
-            time.sleep(0.1)
-
             if IPConnection.CALLBACK_DISCONNECTED in self.registered_callbacks and \
                self.registered_callbacks[IPConnection.CALLBACK_DISCONNECTED] is not None:
                 self.registered_callbacks[IPConnection.CALLBACK_DISCONNECTED](parameter)
 
-            if parameter != IPConnection.DISCONNECT_REASON_REQUEST and \
-               self.auto_reconnect and self.auto_reconnect_allowed:
-                self.auto_reconnect_pending = True
-                retry = True
-
-                # block here until reconnect. this is okay, there is no
-                # callback to deliver when there is no connection
-                while retry:
-                    retry = False
-
-                    with self.socket_lock:
-                        if self.auto_reconnect_allowed and self.socket is None:
-                            try:
-                                self.connect_unlocked(True)
-                            except:
-                                retry = True
-                        else:
-                            self.auto_reconnect_pending = False
+            # the reconnect attempts are made by the reconnect scheduler,
+            # the callback thread continues to deliver the queued callbacks
+            if parameter != IPConnection.DISCONNECT_REASON_REQUEST:
+                with self.socket_lock:
+                    if self.auto_reconnect and self.auto_reconnect_allowed and self.socket is None:
+                        self.auto_reconnect_pending = True
+                        self.auto_reconnect_generation += 1
+                        self.auto_reconnect_failures = 0
+                        self.schedule_reconnect()
+
+    def get_reconnect_delay(self):
+        # exponential backoff, randomly shortened by up to half
+        minimum, maximum = self.auto_reconnect_backoff
+        delay = min(maximum, minimum * 2 ** min(self.auto_reconnect_failures, 32))
+
+        return random.uniform(delay / 2, delay)
+
+    def schedule_reconnect(self):
+        # NOTE: assumes that socket_lock is locked
+        reconnect_scheduler.schedule(self, self.get_reconnect_delay(), self.auto_reconnect_generation)
+
+    def is_reconnect_current(self, generation):
+        # NOTE: assumes that socket_lock is locked
+        return generation == self.auto_reconnect_generation and \
+               self.auto_reconnect_allowed and self.socket is None
+
+    def start_reconnect_attempt(self, generation):
+        # called by the reconnect scheduler
+        with self.socket_lock:
+            if not self.is_reconnect_current(generation):
+                return
+
+            addresses = [(self.host, self.port)]
+
+            for address in self.auto_reconnect_hosts:
+                if address not in addresses:
+                    addresses.append(address)
+
+            self.reconnect_attempts += 1
+
+        ReconnectAttempt(self, generation, addresses)
 
-                    if retry:
-                        time.sleep(0.1)
+    def finish_reconnect(self, generation, sock, address):
+        # called by the reconnect attempt that established a connection.
+        # returns False if the connection is not needed anymore
+        with self.socket_lock:
+            if not self.is_reconnect_current(generation):
+                return False
+
+            self.host, self.port = address
+
+            try:
+                self.connect_unlocked(True, sock)
+            except:
+                self.auto_reconnect_failures += 1
+                self.schedule_reconnect()
+                return True
+
+            self.record_reconnect()
+
+        return True
+
+    def reconnect_failed(self, generation):
+        with self.socket_lock:
+            if self.is_reconnect_current(generation):
+                self.auto_reconnect_failures += 1
+                self.schedule_reconnect()
+
+    def record_reconnect(self):
+        # NOTE: assumes that socket_lock is locked
+        latency = monotonic() - self.disconnect_time
+
+        self.reconnects += 1
+        self.reconnect_latency_total += latency
+        self.reconnect_latency_last = latency
+        self.reconnect_latency_max = max(self.reconnect_latency_max, latency)
 
     def dispatch_packet(self, packet):
+        statistics = self.statistics
+
+        if statistics is None:
+            return self.call_packet_callback(packet)
+
+        statistics.callback_dequeued()
+
+        device = self.devices.get(get_uid_from_data(packet), self)
+        start = monotonic()
+
+        try:
+            return self.call_packet_callback(packet)
+        finally:
+            statistics.add_callback_time((device.__class__.__name__, get_function_id_from_data(packet)),
+                                         monotonic() - start)
+
+    def call_packet_callback(self, packet):
         uid = get_uid_from_data(packet)
-        length = get_length_from_data(packet)
         function_id = get_function_id_from_data(packet)
-        payload = packet[8:]
 
         if function_id == IPConnection.CALLBACK_ENUMERATE and \
            IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks:
             uid, connected_uid, position, hardware_version, \
                 firmware_version, device_identifier, enumeration_type = \
-                self.deserialize_data(payload, '8s 8s c 3B 3B H B')
+                get_codec('', '8s 8s c 3B 3B H B').unpack_response(packet)
 
             cb = self.registered_callbacks[IPConnection.CALLBACK_ENUMERATE]
-            cb(uid, connected_uid, position, hardware_version,
-               firmware_version, device_identifier, enumeration_type)
-            return
+            return cb(uid, connected_uid, position, hardware_version,
+                      firmware_version, device_identifier, enumeration_type)
 
-        if uid not in self.devices:
-            return
+        device = self.devices.get(uid)
 
-        device = self.devices[uid]
+        if device is None:
+            return
 
         if function_id in device.registered_callbacks and \
            device.registered_callbacks[function_id] is not None:
             cb = device.registered_callbacks[function_id]
-            form = device.callback_formats[function_id]
+            codec = get_codec('', device.callback_formats[function_id])
+
+            if cb.__class__ is TimestampedCallback:
+                return cb.dispatch(codec, packet)
 
-            if len(form) == 0:
-                cb()
-            elif len(form) == 1:
-                cb(self.deserialize_data(payload, form))
+            if len(codec.response.fields) == 0:
+                return cb()
+            elif len(codec.response.fields) == 1:
+                return cb(codec.unpack_response(packet))
             else:
-                cb(*self.deserialize_data(payload, form))
+                return cb(*codec.unpack_response(packet))
 
     def callback_loop(self, callback_queue):
         while True:
@@ -668,130 +2837,142 @@ class IPConnection:
             elif kind == IPConnection.QUEUE_PACKET:
                 if not self.receive_flag:
                     # don't dispatch callbacks when the receive thread isn't running
+                    self.count_dropped_callback(data)
                     continue
 
                 self.dispatch_packet(data)
+            elif kind == IPConnection.QUEUE_COALESCED_PACKET:
+                packet = self.take_coalesced_packet(data)
 
-    def deserialize_data(self, data, form):
-        ret = []
-        for f in form.split(' '):
-            f = '<' + f
-            length = struct.calcsize(f)
-
-            x = struct.unpack(f, data[:length])
-            if len(x) > 1:
-                ret.append(x)
-            elif 's' in f:
-                ret.append(self.trim_deserialized_string(x[0]))
-            else:
-                ret.append(x[0])
+                if not self.receive_flag:
+                    # don't dispatch callbacks when the receive thread isn't running
+                    self.count_dropped_callback(packet)
+                    continue
 
-            data = data[length:]
+                self.dispatch_packet(packet)
+            elif kind == IPConnection.QUEUE_BATCH:
+                if not self.receive_flag:
+                    # don't dispatch callbacks when the receive thread isn't running
+                    continue
 
-        if len(ret) == 1:
-            return ret[0]
+                self.dispatch_batch(data)
 
-        return ret
+    def dispatch_batch(self, batch):
+        uid, callback_batch, payloads, timestamps = batch
 
-    def trim_deserialized_string(self, s):
-        if sys.hexversion >= 0x03000000:
-            s = s.decode('ascii')
+        return callback_batch.dispatch(payloads, timestamps)
 
-        i = s.find(chr(0))
-        if i >= 0:
-            s = s[:i]
+    def take_coalesced_packet(self, key):
+        with self.callback_statistics_lock:
+            return self.coalesced_packets.pop(key)
 
-        return s
+    def deserialize_data(self, data, form):
+        return get_codec('', form).response.unpack(data)
 
     def send(self, packet):
+        statistics = self.statistics
+        capture = self.capture
+
+        if statistics is not None:
+            statistics.count_out(len(packet))
+
+        if capture is not None:
+            capture.write(IPConnection.CAPTURE_DIRECTION_SENT, monotonic(), packet)
+
+        send_queue = self.send_queue
+
+        if send_queue is not None:
+            send_queue.put(packet)
+            return
+
         with self.socket_lock:
             if self.socket is None:
                 raise Error(Error.NOT_CONNECTED, 'Not connected')
 
             try:
-                self.socket.send(packet)
+                send_all(self.socket, packet)
             except socket.error:
-                pass
+                raise Error(Error.NOT_CONNECTED,
+                            'Could not send request: {0}'.format(sys.exc_info()[1]))
+
+    def close_send_queue(self):
+        # NOTE: assumes that socket_lock is locked
+        if self.send_queue is not None:
+            self.send_queue.close()
+            self.send_queue = None
 
     def send_request(self, device, function_id, data, form, form_ret):
-        length = 8 + struct.calcsize('<' + form)
-        request, response_expected, sequence_number = \
-            self.create_packet_header(device, length, function_id)
-
-        def pack_string(f, d):
-            if sys.hexversion < 0x03000000:
-                if type(d) == types.UnicodeType:
-                    f = f.replace('s', 'B')
-                    l = map(ord, d)
-                    l += [0] * (int(f.replace('B', '')) - len(l))
-                    return struct.pack('<' + f, *l)
+        if function_id in device.state_getters:
+            callback_id, max_age = device.state_getters[function_id]
 
-                else:
-                    return struct.pack('<' + f, d)
-            else:
-                if isinstance(d, str):
-                    return struct.pack('<' + f, bytes(map(ord, d)))
-                else:
-                    return struct.pack('<' + f, d)
-
-        for f, d in zip(form.split(' '), data):
-            if len(f) > 1 and not 's' in f and not 'c' in f:
-                request += struct.pack('<' + f, *d)
-            elif 's' in f:
-                request += pack_string(f, d)
-            elif 'c' in f:
-                if len(f) > 1:
-                    if int(f.replace('c', '')) != len(d):
-                        raise ValueError('Incorrect char list length');
-                    for k in d:
-                        request += pack_string('c', k)
-                else:
-                    request += pack_string(f, d)
-            else:
-                request += struct.pack('<' + f, d)
+            # the callback values are only usable if they have the same
+            # format as the getter result
+            if form_ret == device.callback_formats[callback_id]:
+                entry = self.state_store.entries.get((device.uid, callback_id))
 
-        if response_expected:
-            with device.request_lock:
-                device.expected_response_function_id = function_id
-                device.expected_response_sequence_number = sequence_number
+                if entry is not None and monotonic() - entry[1] <= max_age:
+                    return get_codec('', form_ret).unpack_response(entry[0])
 
-                try:
-                    self.send(request)
-
-                    while True:
-                        response = device.response_queue.get(True, self.timeout)
-
-                        if function_id == get_function_id_from_data(response) and \
-                           sequence_number == get_sequence_number_from_data(response):
-                            # ignore old responses that arrived after the timeout expired, but before setting
-                            # expected_response_function_id and expected_response_sequence_number back to None
-                            break
-                except Empty:
-                    msg = 'Did not receive response for function {0} in time'.format(function_id)
-                    raise Error(Error.TIMEOUT, msg)
-                finally:
-                    device.expected_response_function_id = None
-                    device.expected_response_sequence_number = None
-
-            error_code = get_error_code_from_data(response)
-
-            if error_code == 0:
-                # no error
-                pass
-            elif error_code == 1:
-                msg = 'Got invalid parameter for function {0}'.format(function_id)
-                raise Error(Error.INVALID_PARAMETER, msg)
-            elif error_code == 2:
-                msg = 'Function {0} is not supported'.format(function_id)
-                raise Error(Error.NOT_SUPPORTED, msg)
-            else:
-                msg = 'Function {0} returned an unknown error'.format(function_id)
-                raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+        getter_cache = device.getter_cache
+
+        if getter_cache is None or function_id not in getter_cache.ttls:
+            return self.send_request_async(device, function_id, data, form, form_ret).result()
+
+        found, result = getter_cache.lookup(function_id, data)
+
+        if found:
+            return result
+
+        generation = result
+        result = self.send_request_async(device, function_id, data, form, form_ret).result()
+
+        getter_cache.store(function_id, data, result, generation)
 
-            if len(form_ret) > 0:
-                return self.deserialize_data(response[8:], form_ret)
+        return result
+
+    def send_request_async(self, device, function_id, data, form, form_ret, result_type=None):
+        """
+        Sends a request without waiting for the response and returns a
+        Future for it. This allows to have many requests in flight at once
+        and to collect their results afterwards. If *result_type* is given
+        then the result values are passed to it as parameters.
+        """
+
+        if device.getter_cache is not None:
+            device.getter_cache.invalidate(function_id)
+
+        codec = get_codec(form, form_ret)
+        future = Future(self, function_id, codec, result_type, monotonic() + self.timeout)
+
+        if self.statistics is not None:
+            future.statistics = (monotonic(), (device.__class__.__name__, function_id), device.uid)
+
+        if device.get_response_expected(function_id):
+            sequence_number = self.add_pending_request(device.uid, function_id, future)
         else:
-            self.send(request)
+            sequence_number = self.get_next_sequence_number()
+
+        uid, sequence_number_and_options, _ = \
+            self.create_packet_header_values(device, function_id, sequence_number)
+        request = codec.pack_request(uid, function_id, sequence_number_and_options, data)
+
+        try:
+            if future.key is None and function_id in device.write_combining:
+                interval, index_count = device.write_combining[function_id]
+                key = (uid, function_id, tuple(data[:index_count]))
+
+                self.write_combiner.send(key, request, interval)
+            else:
+                self.send(request)
+        except:
+            self.remove_pending_request(future)
+            raise
+
+        if future.key is None:
+            # no response expected
+            future.complete(None, None)
+
+        return future
 
     def get_next_sequence_number(self):
         with self.sequence_number_lock:
@@ -799,39 +2980,245 @@ class IPConnection:
             self.next_sequence_number = sequence_number % 15
             return sequence_number
 
+    def add_pending_request(self, uid, function_id, future):
+        # the response to a request is matched by (uid, function_id,
+        # sequence_number). sequence number 0 is reserved for callbacks,
+        # so there can be up to 15 requests in flight for each function of
+        # a device. if all of them are in use then block until one of them
+        # gets released or times out
+        while True:
+            with self.pending_requests_lock:
+                for i in range(15):
+                    sequence_number = self.get_next_sequence_number()
+                    key = (uid, function_id, sequence_number)
+
+                    if key not in self.pending_requests:
+                        future.key = key
+                        self.pending_requests[key] = future
+                        self.next_request_deadline = min(self.next_request_deadline, future.deadline)
+
+                        return sequence_number
+
+                expired = self.pop_expired_requests()
+
+                if len(expired) == 0:
+                    self.pending_requests_released.wait(max(self.next_request_deadline - monotonic(), 0))
+                    expired = self.pop_expired_requests()
+
+            self.complete_expired_requests(expired)
+
+    def remove_pending_request(self, future):
+        # the entry is only removed if it still belongs to this future.
+        # after a response was received or the request timed out the key
+        # might already have been reused for another request
+        with self.pending_requests_lock:
+            if future.key is None or self.pending_requests.get(future.key) is not future:
+                return False
+
+            del self.pending_requests[future.key]
+            future.key = None
+            self.pending_requests_released.notify_all()
+
+            return True
+
+    def expire_pending_request(self, future):
+        if self.remove_pending_request(future):
+            self.complete_expired_requests([future])
+
+    def expire_pending_requests(self):
+        with self.pending_requests_lock:
+            expired = self.pop_expired_requests()
+
+        self.complete_expired_requests(expired)
+
+    def pop_expired_requests(self):
+        # NOTE: assumes that pending_requests_lock is locked
+        now = monotonic()
+        expired = []
+
+        self.next_request_deadline = float('inf')
+
+        for key, future in list(self.pending_requests.items()):
+            if future.deadline <= now:
+                del self.pending_requests[key]
+                future.key = None
+                expired.append(future)
+            else:
+                self.next_request_deadline = min(self.next_request_deadline, future.deadline)
+
+        if len(expired) > 0:
+            self.pending_requests_released.notify_all()
+
+        return expired
+
+    def complete_expired_requests(self, expired):
+        # NOTE: must not be called with pending_requests_lock locked, the
+        # done callbacks of the futures might send new requests
+        statistics = self.statistics
+
+        for future in expired:
+            if statistics is not None and future.statistics is not None:
+                statistics.add_timeout(base58encode(future.statistics[2]))
+
+            msg = 'Did not receive response for function {0} in time'.format(future.function_id)
+            future.complete(None, Error(Error.TIMEOUT, msg))
+
+    def fail_pending_requests(self, error):
+        with self.pending_requests_lock:
+            failed = list(self.pending_requests.values())
+
+        for future in failed:
+            if self.remove_pending_request(future):
+                future.complete(None, error)
+
     def handle_response(self, packet):
         function_id = get_function_id_from_data(packet)
         sequence_number = get_sequence_number_from_data(packet)
+        statistics = self.statistics
+        capture = self.capture
+
+        if statistics is not None:
+            statistics.count_in(get_length_from_data(packet))
+
+        if capture is not None:
+            capture.write(IPConnection.CAPTURE_DIRECTION_RECEIVED, self.receive_timestamp, packet)
 
         if sequence_number == 0 and function_id == IPConnection.CALLBACK_ENUMERATE:
+            self.check_enumeration_type(packet)
+
             if IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks:
-                self.callback_queue.put((IPConnection.QUEUE_PACKET, packet))
+                if self.callback_queue_policy == IPConnection.CALLBACK_QUEUE_POLICY_UNBOUNDED:
+                    if statistics is not None:
+                        statistics.callback_queued()
+
+                    self.callback_queue.put((IPConnection.QUEUE_PACKET, copy_data(packet)))
+                else:
+                    # enumerate callbacks of different devices are never coalesced
+                    self.queue_callback(None, packet)
             return
 
         uid = get_uid_from_data(packet)
 
-        if not uid in self.devices:
-            # Response from an unknown device, ignoring it
+        if sequence_number != 0:
+            # the response is matched without looking up the device object,
+            # so a request of a device that was released meanwhile still
+            # gets completed instead of waiting for its timeout
+            with self.pending_requests_lock:
+                future = self.pending_requests.pop((uid, function_id, sequence_number), None)
+
+                if future is not None:
+                    future.key = None
+                    self.pending_requests_released.notify_all()
+
+            if future is not None:
+                if statistics is not None and future.statistics is not None:
+                    statistics.add_round_trip(future.statistics[1], monotonic() - future.statistics[0])
+
+                future.timestamp = self.receive_timestamp
+                future.complete(copy_data(packet), None)
+
+            # otherwise the response seems to be OK, but can't be handled,
+            # most likely the request already timed out
             return
 
-        device = self.devices[uid]
+        device = self.devices.get(uid)
 
-        if sequence_number == 0:
-            if function_id in device.registered_callbacks:
-                self.callback_queue.put((IPConnection.QUEUE_PACKET, packet))
+        if device is None:
+            # Callback from an unknown or released device, ignoring it
             return
 
-        if device.expected_response_function_id == function_id and \
-           device.expected_response_sequence_number == sequence_number:
-            device.response_queue.put(packet)
+        if self.state_store is not None and (uid, function_id) in self.state_store.recorded:
+            self.state_store.update(uid, function_id, copy_data(packet),
+                                    self.receive_timestamp,
+                                    device.callback_formats[function_id])
+
+        if function_id in device.registered_callbacks:
+            if device.registered_callbacks[function_id].__class__ is TimestampedCallback:
+                packet = append_timestamp(packet, self.receive_timestamp)
+
+            if self.callback_queue_policy == IPConnection.CALLBACK_QUEUE_POLICY_UNBOUNDED:
+                if statistics is not None:
+                    statistics.callback_queued()
+
+                self.callback_queue.put((IPConnection.QUEUE_PACKET, copy_data(packet)))
+            else:
+                self.queue_callback((uid, function_id), packet)
+        elif function_id in device.registered_batches:
+            device.registered_batches[function_id].add(packet, self.receive_timestamp)
+
+        # otherwise the callback seems to be OK, but can't be handled, most
+        # likely a callback without registered function
+
+    def check_enumeration_type(self, packet):
+        # a device that is enumerated as connected or disconnected was
+        # reset, its cached getter results are outdated
+        device = self.devices.get(get_uid_from_data(packet))
+
+        if device is not None and device.getter_cache is not None and \
+           get_length_from_data(packet) == 34 and \
+           get_enumeration_type_from_data(packet) != IPConnection.ENUMERATION_TYPE_AVAILABLE:
+            device.getter_cache.clear()
+
+    def clear_getter_caches(self):
+        for device in list(self.devices.values()):
+            if device.getter_cache is not None:
+                device.getter_cache.clear()
+
+    def queue_callback(self, key, packet):
+        if self.callback_queue_policy == IPConnection.CALLBACK_QUEUE_POLICY_COALESCE and key is not None:
+            with self.callback_statistics_lock:
+                coalesced = key in self.coalesced_packets
+                self.coalesced_packets[key] = copy_data(packet)
+
+                if coalesced:
+                    # the callback thread didn't pick up the previous value
+                    # yet, it will get this one instead
+                    self.callback_statistics.setdefault(key, [0, 0])[1] += 1
+                    return
+
+            if self.statistics is not None:
+                self.statistics.callback_queued()
+
+            self.callback_queue.put((IPConnection.QUEUE_COALESCED_PACKET, key))
             return
 
-        # Response seems to be OK, but can't be handled, most likely
-        # a callback without registered function
+        item = (IPConnection.QUEUE_PACKET, copy_data(packet))
+
+        if self.statistics is not None:
+            self.statistics.callback_queued()
+
+        # wait for free space, but don't block a disconnect forever
+        while True:
+            try:
+                self.callback_queue.put(item, True, 0.1)
+                return
+            except Full:
+                if not self.receive_flag:
+                    self.count_dropped_callback(item[1])
+                    return
+
+    def count_dropped_callback(self, packet):
+        key = (get_uid_from_data(packet), get_function_id_from_data(packet))
+        statistics = self.statistics
+
+        if statistics is not None:
+            statistics.callback_dequeued()
+
+        with self.callback_statistics_lock:
+            self.callback_statistics.setdefault(key, [0, 0])[0] += 1
 
     def create_packet_header(self, device, length, function_id):
-        uid = IPConnection.BROADCAST_UID
         sequence_number = self.get_next_sequence_number()
+        uid, sequence_number_and_options, response_expected = \
+            self.create_packet_header_values(device, function_id, sequence_number)
+
+        return (struct.pack('<IBBBB', uid, length, function_id,
+                            sequence_number_and_options, 0),
+                response_expected,
+                sequence_number)
+
+    def create_packet_header_values(self, device, function_id, sequence_number):
+        uid = IPConnection.BROADCAST_UID
         r_bit = 0
         a_bit = 0
 
@@ -850,10 +3237,7 @@ class IPConnection:
         sequence_number_and_options = \
             (sequence_number << 4) | (r_bit << 3) | (a_bit << 2)
 
-        return (struct.pack('<IBBBB', uid, length, function_id,
-                            sequence_number_and_options, 0),
-                bool(r_bit),
-                sequence_number)
+        return uid, sequence_number_and_options, bool(r_bit)
 
     def write_bricklet_plugin(self, device, port, position, plugin_chunk):
         self.send_request(device,
@@ -29,7 +29,7 @@ from plugin_system.plugin_manager import PluginManager
 from bindings.ip_connection import IPConnection
 from flashing import FlashingWindow
 from advanced import AdvancedWindow
-from async_call import async_start_thread, async_next_session
+from async_call import async_start_threads, async_next_session
 from bindings.brick_master import BrickMaster
 from program_path import ProgramPath
 import config
@@ -83,7 +83,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         signal.signal(signal.SIGINT, self.exit_brickv)
         signal.signal(signal.SIGTERM, self.exit_brickv)
 
-        self.async_thread = async_start_thread(self)
+        self.async_threads = async_start_threads(self)
 
         self.setWindowTitle("Brick Viewer " + config.BRICKV_VERSION)
         
@@ -195,6 +195,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             if infos.infos[key].type in ('brick', 'bricklet'):
                 infos.infos[key].plugin.stop()
                 infos.infos[key].plugin.destroy()
+                infos.infos[key].plugin.release_devices()
                 keys_to_remove.append(key)
                 
         for key in keys_to_remove:
@@ -395,6 +396,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                             if device_info.plugin:
                                 device_info.plugin.stop()
                                 device_info.plugin.destroy()
+                                device_info.plugin.release_devices()
                             i = self.tab_for_uid(device_info.uid)
                             self.tab_widget.removeTab(i)
                         except:
@@ -25,6 +25,8 @@ from PyQt4.QtGui import QVBoxLayout, QWidget, QPushButton
 from PyQt4.QtCore import QTimer
 import PyQt4.Qwt5 as Qwt
 
+from bindings.ip_connection import monotonic
+
 class Plot(Qwt.QwtPlot):
     def __init__(self, y_axis, plot_list, *args):
         Qwt.QwtPlot.__init__(self, *args)
@@ -103,7 +105,7 @@ class PlotWidget(QWidget):
         if clear_button is None:
             layout.addWidget(self.clear_button)
         
-        self.counter = 0
+        self.start_time = monotonic()
         self.update_func = []
         
         for pl in plot_list:
@@ -117,14 +119,16 @@ class PlotWidget(QWidget):
         if self.stop:
             return
         
+        # use the real time instead of counting timer ticks, the timer
+        # drifts if the GUI is busy
+        elapsed = monotonic() - self.start_time
+
         for i in range(len(self.update_func)):
             value = self.update_func[i]()
 
             if value is not None:
-                self.plot.add_data(i, self.counter/10.0, value)
-            
-        self.counter += 1
+                self.plot.add_data(i, elapsed, value)
             
     def clear_pressed(self):
         self.plot.clear_graph()
-        self.counter = 0
+        self.start_time = monotonic()
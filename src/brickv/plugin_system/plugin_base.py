@@ -22,6 +22,7 @@ Boston, MA 02111-1307, USA.
 """
 
 from PyQt4.QtGui import QWidget
+from bindings.ip_connection import Device
 
 class PluginBase(QWidget, object):
     def __init__(self, ipcon, uid, name, version):
@@ -49,6 +50,13 @@ class PluginBase(QWidget, object):
     def destroy(self):
         pass
 
+    def release_devices(self):
+        # called after destroy when the device is gone, releases the device
+        # objects the plugin stored as attributes
+        for value in list(self.__dict__.values()):
+            if isinstance(value, Device):
+                value.release()
+
     def has_reset_device(self):
         return False
 
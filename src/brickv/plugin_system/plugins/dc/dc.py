@@ -57,10 +57,17 @@ class DC(PluginBase, Ui_DC):
         
         self.full_brake_time = 0
         
+        # send slider movements right away, write combining makes sure that
+        # the motor only gets the latest values if it cannot keep up
+        self.dc.set_write_combining(BrickDC.FUNCTION_SET_VELOCITY, 0.05)
+        self.dc.set_write_combining(BrickDC.FUNCTION_SET_ACCELERATION, 0.05)
+
+        self.velocity_slider.sliderMoved.connect(self.velocity_slider_moved)
         self.velocity_slider.sliderReleased.connect(self.velocity_slider_released)
         self.velocity_slider.valueChanged.connect(self.velocity_spin.setValue)
         self.velocity_spin.editingFinished.connect(self.velocity_spin_finished)
         
+        self.acceleration_slider.sliderMoved.connect(self.acceleration_slider_moved)
         self.acceleration_slider.sliderReleased.connect(self.acceleration_slider_released)
         self.acceleration_slider.valueChanged.connect(self.acceleration_spin.setValue)
         self.acceleration_spin.editingFinished.connect(self.acceleration_spin_finished)
@@ -255,6 +262,12 @@ class DC(PluginBase, Ui_DC):
         async_call(self.dc.get_minimum_voltage, None, self.minimum_voltage_update, self.increase_error_count)
         async_call(self.dc.get_current_consumption, None, self.current_consumption_update, self.increase_error_count)
         
+    def acceleration_slider_moved(self, value):
+        try:
+            self.dc.set_acceleration(value)
+        except ip_connection.Error:
+            return
+
     def acceleration_slider_released(self):
         value = self.acceleration_slider.value()
         self.acceleration_spin.setValue(value)
@@ -271,6 +284,12 @@ class DC(PluginBase, Ui_DC):
         except ip_connection.Error:
             return
         
+    def velocity_slider_moved(self, value):
+        try:
+            self.dc.set_velocity(value)
+        except ip_connection.Error:
+            return
+
     def velocity_slider_released(self):
         value = self.velocity_slider.value()
         self.velocity_spin.setValue(value)
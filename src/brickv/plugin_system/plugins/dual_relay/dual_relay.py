@@ -251,11 +251,11 @@ class DualRelay(PluginBase, Ui_DualRelay):
     def update(self):
         if self.r1_monoflop:
             try:
-                async_call(self.dr.get_monoflop, 1, lambda a: self.time1_spinbox.setValue(a[2]), self.increase_error_count)
+                async_call(self.dr.get_monoflop, 1, lambda a: self.time1_spinbox.setValue(a[2]), self.increase_error_count, key=('get_monoflop', 1))
             except ip_connection.Error:
                 pass
         if self.r2_monoflop:
             try:
-                async_call(self.dr.get_monoflop, 2, lambda a: self.time2_spinbox.setValue(a[2]), self.increase_error_count)
+                async_call(self.dr.get_monoflop, 2, lambda a: self.time2_spinbox.setValue(a[2]), self.increase_error_count, key=('get_monoflop', 2))
             except ip_connection.Error:
                 pass
@@ -25,6 +25,7 @@ Boston, MA 02111-1307, USA.
 
 from plugin_system.plugin_base import PluginBase
 from bindings.brick_imu import BrickIMU
+from bindings.ip_connection import monotonic
 from async_call import async_call
 
 from PyQt4.QtGui import QLabel, QVBoxLayout, QSizePolicy
@@ -118,8 +119,8 @@ class IMU(PluginBase, Ui_IMU):
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_data)
         
-        self.imu.register_callback(self.imu.CALLBACK_ALL_DATA, 
-                                   self.all_data_callback)
+        self.imu.register_timestamped_callback(self.imu.CALLBACK_ALL_DATA,
+                                               self.all_data_callback)
         self.imu.register_callback(self.imu.CALLBACK_ORIENTATION,
                                    self.orientation_callback)
         self.imu.register_callback(self.imu.CALLBACK_QUATERNION,
@@ -141,7 +142,8 @@ class IMU(PluginBase, Ui_IMU):
         self.max_y = 0
         self.max_z = 0
         
-        self.counter = 0
+        self.start_time = monotonic()
+        self.all_data_timestamp = None
         self.update_counter = 0
         
         self.mag_plot = Plot("Magnetic Field [mG]",
@@ -229,7 +231,8 @@ in the image above, then press "Save Orientation".""")
     def has_device_identifier(device_identifier):
         return device_identifier == BrickIMU.DEVICE_IDENTIFIER
         
-    def all_data_callback(self, acc_x, acc_y, acc_z, mag_x, mag_y, mag_z, gyr_x, gyr_y, gyr_z, tem):
+    def all_data_callback(self, acc_x, acc_y, acc_z, mag_x, mag_y, mag_z, gyr_x, gyr_y, gyr_z, tem, timestamp):
+        self.all_data_timestamp = timestamp
         self.acc_x = acc_x
         self.acc_y = acc_y
         self.acc_z = acc_z
@@ -253,7 +256,7 @@ in the image above, then press "Save Orientation".""")
         self.yaw = yaw
         
     def clear_graphs_clicked(self):
-        self.counter = 0
+        self.start_time = monotonic()
         self.mag_plot.clear_graph()
         self.acc_plot.clear_graph()
         self.gyr_plot.clear_graph()
@@ -283,23 +286,27 @@ in the image above, then press "Save Orientation".""")
             self.orientation_update(self.roll, self.pitch, self.yaw)
             self.temperature_update(self.tem)
             
+            # plot over the arrival time of the values, no new values
+            # arrived since the graphs got cleared otherwise
+            if self.all_data_timestamp is None or \
+               self.all_data_timestamp < self.start_time:
+                return
+
+            elapsed = self.all_data_timestamp - self.start_time
             
+            self.gyr_plot.add_data(0, elapsed, gyr_x)
+            self.gyr_plot.add_data(1, elapsed, gyr_y)
+            self.gyr_plot.add_data(2, elapsed, gyr_z)
             
-            self.gyr_plot.add_data(0, self.counter, gyr_x)
-            self.gyr_plot.add_data(1, self.counter, gyr_y)
-            self.gyr_plot.add_data(2, self.counter, gyr_z)
-            
-            self.acc_plot.add_data(0, self.counter, self.acc_x)
-            self.acc_plot.add_data(1, self.counter, self.acc_y)
-            self.acc_plot.add_data(2, self.counter, self.acc_z)
+            self.acc_plot.add_data(0, elapsed, self.acc_x)
+            self.acc_plot.add_data(1, elapsed, self.acc_y)
+            self.acc_plot.add_data(2, elapsed, self.acc_z)
             
-            self.mag_plot.add_data(0, self.counter, self.mag_x)
-            self.mag_plot.add_data(1, self.counter, self.mag_y)
-            self.mag_plot.add_data(2, self.counter, self.mag_z)
+            self.mag_plot.add_data(0, elapsed, self.mag_x)
+            self.mag_plot.add_data(1, elapsed, self.mag_y)
+            self.mag_plot.add_data(2, elapsed, self.mag_z)
             
-            self.tem_plot.add_data(0, self.counter, self.tem/100.0)
-        
-            self.counter += 0.1
+            self.tem_plot.add_data(0, elapsed, self.tem/100.0)
         
     def acceleration_update(self, x, y, z):
         x_str = "%g" % x
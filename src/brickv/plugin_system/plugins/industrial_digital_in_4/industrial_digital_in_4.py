@@ -39,6 +39,7 @@ class IndustrialDigitalIn4(PluginBase, Ui_IndustrialDigitalIn4):
         self.setupUi(self)
         
         self.idi4 = BrickletIndustrialDigitalIn4(uid, ipcon)
+        self.idi4.set_getter_cache(BrickletIndustrialDigitalIn4.FUNCTION_GET_DEBOUNCE_PERIOD, 5)
         
         self.gnd_pixmap = bmp_to_pixmap('plugin_system/plugins/industrial_digital_in_4/dio_gnd.bmp')
         self.vcc_pixmap = bmp_to_pixmap('plugin_system/plugins/industrial_digital_in_4/dio_vcc.bmp')
@@ -41,6 +41,7 @@ class IO16(PluginBase, Ui_IO16):
         self.setupUi(self)
         
         self.io = BrickletIO16(uid, ipcon)
+        self.io.set_getter_cache(BrickletIO16.FUNCTION_GET_DEBOUNCE_PERIOD, 5)
         
         self.has_monoflop = version >= (1, 1, 2)
         
@@ -361,4 +362,4 @@ class IO16(PluginBase, Ui_IO16):
                     def get_lambda(port, pin):
                         return lambda x: self.update_async(port, pin, x)
                     
-                    async_call(self.io.get_port_monoflop, (port, pin), get_lambda(port, pin), self.increase_error_count)
+                    async_call(self.io.get_port_monoflop, (port, pin), get_lambda(port, pin), self.increase_error_count, key=('get_port_monoflop', port, pin))
@@ -319,4 +319,4 @@ class IO4(PluginBase, Ui_IO4):
                 def get_lambda(pin):
                     return lambda x: self.update_async(pin, x)
 
-                async_call(self.io.get_monoflop, pin, get_lambda(pin), self.increase_error_count)
+                async_call(self.io.get_monoflop, pin, get_lambda(pin), self.increase_error_count, key=('get_monoflop', pin))
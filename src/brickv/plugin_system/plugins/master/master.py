@@ -44,6 +44,12 @@ class Master(PluginBase, Ui_Master):
 
         self.master = BrickMaster(uid, ipcon)
         self.device = self.master
+
+        # the extension configurations are read on every tab switch, but
+        # only change if they are set
+        self.master.set_getter_cache(BrickMaster.FUNCTION_GET_CHIBI_FREQUENCY, 5)
+        self.master.set_getter_cache(BrickMaster.FUNCTION_GET_RS485_CONFIGURATION, 5)
+        self.master.set_getter_cache(BrickMaster.FUNCTION_GET_WIFI_CONFIGURATION, 5)
         
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_data)
@@ -128,8 +134,8 @@ class Master(PluginBase, Ui_Master):
         return device_identifier == BrickMaster.DEVICE_IDENTIFIER
     
     def update_data(self):
-        async_call(self.master.get_stack_voltage, None, self.stack_voltage_update, self.increase_error_count)
-        async_call(self.master.get_stack_current, None, self.stack_current_update, self.increase_error_count)
+        async_call(self.master.get_stack_voltage, None, self.stack_voltage_update, self.increase_error_count, key='get_stack_voltage')
+        async_call(self.master.get_stack_current, None, self.stack_current_update, self.increase_error_count, key='get_stack_current')
         
         for extension in self.extensions:
             extension.update_data()
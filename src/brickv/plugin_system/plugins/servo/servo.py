@@ -133,6 +133,11 @@ class Servo(PluginBase, Ui_Servo):
         self.servo = BrickServo(uid, ipcon)
         self.device = self.servo
 
+        # the servo configuration is read on every servo selection, but
+        # only changes if it is set
+        self.servo.set_getter_cache(BrickServo.FUNCTION_GET_DEGREE, 5)
+        self.servo.set_getter_cache(BrickServo.FUNCTION_GET_PULSE_WIDTH, 5)
+
         self.position_list = []
         self.velocity_list = []
         self.acceleration_list = []
@@ -186,14 +191,23 @@ class Servo(PluginBase, Ui_Servo):
         self.servo_dropbox.currentIndexChanged.connect(lambda x: self.update_servo_specific())
         self.enable_checkbox.stateChanged.connect(self.enable_state_changed)
         
+        # send slider movements right away, write combining makes sure that
+        # the servo only gets the latest values if it cannot keep up
+        self.servo.set_write_combining(BrickServo.FUNCTION_SET_POSITION, 0.05, 1)
+        self.servo.set_write_combining(BrickServo.FUNCTION_SET_VELOCITY, 0.05, 1)
+        self.servo.set_write_combining(BrickServo.FUNCTION_SET_ACCELERATION, 0.05, 1)
+
+        self.position_slider.sliderMoved.connect(self.position_slider_moved)
         self.position_slider.sliderReleased.connect(self.position_slider_released)
         self.position_slider.valueChanged.connect(self.position_spin.setValue)
         self.position_spin.editingFinished.connect(self.position_spin_finished)
         
+        self.velocity_slider.sliderMoved.connect(self.velocity_slider_moved)
         self.velocity_slider.sliderReleased.connect(self.velocity_slider_released)
         self.velocity_slider.valueChanged.connect(self.velocity_spin.setValue)
         self.velocity_spin.editingFinished.connect(self.velocity_spin_finished)
         
+        self.acceleration_slider.sliderMoved.connect(self.acceleration_slider_moved)
         self.acceleration_slider.sliderReleased.connect(self.acceleration_slider_released)
         self.acceleration_slider.valueChanged.connect(self.acceleration_spin.setValue)
         self.acceleration_spin.editingFinished.connect(self.acceleration_spin_finished)
@@ -321,15 +335,15 @@ class Servo(PluginBase, Ui_Servo):
             self.enable_checkbox.setCheckState(Qt.Unchecked)
             return
     
-        async_call(self.servo.get_position, i, self.get_position_async, self.increase_error_count)
-        async_call(self.servo.get_velocity, i, self.get_velocity_async, self.increase_error_count)
-        async_call(self.servo.get_acceleration, i, self.get_acceleration_async, self.increase_error_count)
-        async_call(self.servo.get_period, i, self.get_period_async, self.increase_error_count)
-        async_call(self.servo.is_enabled, i, self.is_enabled_async, self.increase_error_count)
+        async_call(self.servo.get_position, i, self.get_position_async, self.increase_error_count, key='get_position')
+        async_call(self.servo.get_velocity, i, self.get_velocity_async, self.increase_error_count, key='get_velocity')
+        async_call(self.servo.get_acceleration, i, self.get_acceleration_async, self.increase_error_count, key='get_acceleration')
+        async_call(self.servo.get_period, i, self.get_period_async, self.increase_error_count, key='get_period')
+        async_call(self.servo.is_enabled, i, self.is_enabled_async, self.increase_error_count, key='is_enabled')
         def get_lambda_deg(i):
             return lambda x: self.get_degree_async(x, i)
-        async_call(self.servo.get_degree, i, get_lambda_deg(i), self.increase_error_count)
-        async_call(self.servo.get_pulse_width, i, self.get_pulse_width_async, self.increase_error_count)
+        async_call(self.servo.get_degree, i, get_lambda_deg(i), self.increase_error_count, key='get_degree')
+        async_call(self.servo.get_pulse_width, i, self.get_pulse_width_async, self.increase_error_count, key='get_pulse_width')
             
     def error_handler(self, error):
         pass
@@ -543,6 +557,12 @@ class Servo(PluginBase, Ui_Servo):
         except ip_connection.Error:
             return
         
+    def position_slider_moved(self, value):
+        try:
+            self.servo.set_position(self.selected_servo(), value)
+        except ip_connection.Error:
+            return
+
     def position_slider_released(self):
         value = self.position_slider.value()
         self.position_spin.setValue(value)
@@ -559,6 +579,12 @@ class Servo(PluginBase, Ui_Servo):
         except ip_connection.Error:
             return
         
+    def velocity_slider_moved(self, value):
+        try:
+            self.servo.set_velocity(self.selected_servo(), value)
+        except ip_connection.Error:
+            return
+
     def velocity_slider_released(self):
         value = self.velocity_slider.value()
         self.velocity_spin.setValue(value)
@@ -575,6 +601,12 @@ class Servo(PluginBase, Ui_Servo):
         except ip_connection.Error:
             return
         
+    def acceleration_slider_moved(self, value):
+        try:
+            self.servo.set_acceleration(self.selected_servo(), value)
+        except ip_connection.Error:
+            return
+
     def acceleration_slider_released(self):
         value = self.acceleration_slider.value()
         self.acceleration_spin.setValue(value)
@@ -24,7 +24,7 @@ Boston, MA 02111-1307, USA.
 from plugin_system.plugin_base import PluginBase
 from bindings import ip_connection
 from bindings.brick_stepper import BrickStepper
-from async_call import async_call
+from async_call import async_call, async_queue_depth
 
 from PyQt4.QtGui import QErrorMessage, QInputDialog
 from PyQt4.QtCore import QTimer, Qt, pyqtSignal
@@ -63,14 +63,22 @@ class Stepper(PluginBase, Ui_Stepper):
         self.qem = QErrorMessage(self)
         self.qem.setWindowTitle("Under Voltage")
         
+        # send slider movements right away, write combining makes sure that
+        # the stepper only gets the latest values if it cannot keep up
+        self.stepper.set_write_combining(BrickStepper.FUNCTION_SET_MAX_VELOCITY, 0.05)
+        self.stepper.set_write_combining(BrickStepper.FUNCTION_SET_SPEED_RAMPING, 0.05)
+
+        self.velocity_slider.sliderMoved.connect(self.velocity_slider_moved)
         self.velocity_slider.sliderReleased.connect(self.velocity_slider_released)
         self.velocity_slider.valueChanged.connect(self.velocity_spin.setValue)
         self.velocity_spin.editingFinished.connect(self.velocity_spin_finished)
         
+        self.acceleration_slider.sliderMoved.connect(self.ramping_slider_moved)
         self.acceleration_slider.sliderReleased.connect(self.acceleration_slider_released)
         self.acceleration_slider.valueChanged.connect(self.acceleration_spin.setValue)
         self.acceleration_spin.editingFinished.connect(self.acceleration_spin_finished)
         
+        self.deceleration_slider.sliderMoved.connect(self.ramping_slider_moved)
         self.deceleration_slider.sliderReleased.connect(self.deceleration_slider_released)
         self.deceleration_slider.valueChanged.connect(self.deceleration_spin.setValue)
         self.deceleration_spin.editingFinished.connect(self.deceleration_spin_finished)
@@ -330,18 +338,29 @@ class Stepper(PluginBase, Ui_Stepper):
         async_call(self.stepper.is_enabled, None, self.is_enabled_async, self.increase_error_count)
 
     def update_data(self):
-        async_call(self.stepper.get_remaining_steps, None, self.remaining_steps_update, self.increase_error_count)
-        async_call(self.stepper.get_current_position, None, self.position_update, self.increase_error_count)
-        async_call(self.stepper.get_current_velocity, None, self.speedometer.set_velocity, self.increase_error_count)
+        # skip this update if the calls of the previous ones are still
+        # pending, for example because the connection is slow
+        if async_queue_depth(self.stepper) > 0:
+            return
+
+        async_call(self.stepper.get_remaining_steps, None, self.remaining_steps_update, self.increase_error_count, key='get_remaining_steps')
+        async_call(self.stepper.get_current_position, None, self.position_update, self.increase_error_count, key='get_current_position')
+        async_call(self.stepper.get_current_velocity, None, self.speedometer.set_velocity, self.increase_error_count, key='get_current_velocity')
 
         self.update_counter += 1
         if self.update_counter % 10 == 0:
-            async_call(self.stepper.get_motor_current, None, self.maximum_current_update, self.increase_error_count)
-            async_call(self.stepper.get_stack_input_voltage, None, self.stack_input_voltage_update, self.increase_error_count)
-            async_call(self.stepper.get_external_input_voltage, None, self.external_input_voltage_update, self.increase_error_count)
-            async_call(self.stepper.get_minimum_voltage, None, self.minimum_voltage_update, self.increase_error_count)
-            async_call(self.stepper.get_step_mode, None, self.mode_update, self.increase_error_count)
+            async_call(self.stepper.get_motor_current, None, self.maximum_current_update, self.increase_error_count, key='get_motor_current')
+            async_call(self.stepper.get_stack_input_voltage, None, self.stack_input_voltage_update, self.increase_error_count, key='get_stack_input_voltage')
+            async_call(self.stepper.get_external_input_voltage, None, self.external_input_voltage_update, self.increase_error_count, key='get_external_input_voltage')
+            async_call(self.stepper.get_minimum_voltage, None, self.minimum_voltage_update, self.increase_error_count, key='get_minimum_voltage')
+            async_call(self.stepper.get_step_mode, None, self.mode_update, self.increase_error_count, key='get_step_mode')
         
+    def velocity_slider_moved(self, value):
+        try:
+            self.stepper.set_max_velocity(value)
+        except ip_connection.Error:
+            return
+
     def velocity_slider_released(self):
         value = self.velocity_slider.value()
         self.velocity_spin.setValue(value)
@@ -358,6 +377,14 @@ class Stepper(PluginBase, Ui_Stepper):
         except ip_connection.Error:
             return
     
+    def ramping_slider_moved(self, _):
+        acc = self.acceleration_slider.sliderPosition()
+        dec = self.deceleration_slider.sliderPosition()
+        try:
+            self.stepper.set_speed_ramping(acc, dec)
+        except ip_connection.Error:
+            return
+
     def acceleration_slider_released(self):
         acc = self.acceleration_slider.value()
         dec = self.deceleration_slider.value()
@@ -49,7 +49,8 @@ class Temperature(PluginBase):
         
         self.temperature_label = TemperatureLabel()
         
-        self.current_value = None
+        # the plot reads the latest callback value from the state store
+        self.state_store = ipcon.get_state_store(self.tem, self.tem.CALLBACK_TEMPERATURE)
         
         plot_list = [['', Qt.red, self.get_current_value]]
         self.plot_widget = PlotWidget('Temperature [%cC]' % 0xB0, plot_list)
@@ -82,8 +83,12 @@ class Temperature(PluginBase):
         return device_identifier == BrickletTemperature.DEVICE_IDENTIFIER
 
     def get_current_value(self):
-        return self.current_value
+        state = self.state_store.get(self.tem.uid, BrickletTemperature.CALLBACK_TEMPERATURE)
+
+        if state is None:
+            return None
+
+        return state.values/100.0
 
     def cb_temperature(self, temperature):
-        self.current_value = temperature/100.0
         self.temperature_label.setText(str(temperature/100.0))